@@ -0,0 +1 @@
+"""Benchmarks of the dbt models against synthetic warehouses."""
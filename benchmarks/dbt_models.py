@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the dbt models against a synthetic warehouse.
+
+Generates a warehouse with `benchmarks.warehouse`, then runs every dbt model on its
+own with the `bench` target and records its runtime from `run_results.json` and the
+number of rows it holds. Example:
+
+    python -m benchmarks.dbt_models --issues 1000000 --histories 8000000 --users 5000
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psycopg2
+
+from benchmarks.warehouse import WarehouseGenerator, generate_warehouse
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DBT_DIR = Path(__file__).resolve().parent.parent / "dbt"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# staging views first, so that every mart reads models built in this run
+MODELS = [
+    "stg_jira_issues",
+    "stg_jira_projects",
+    "stg_jira_users",
+    "stg_jira_changelog",
+    "dim_projects",
+    "dim_users",
+    "fct_issues_details",
+    "fct_transitions",
+    "fct_user_performance",
+    "agg_issue_flow_daily",
+    "agg_issue_flow_monthly",
+    "agg_issue_counts",
+    "agg_user_totals",
+]
+
+
+def db_config() -> Dict[str, Any]:
+    """Returns the connection settings of the `bench` target of dbt/profiles.yml."""
+    return {
+        "host": os.getenv("POSTGRES_HOST", "localhost"),
+        "port": int(os.getenv("POSTGRES_PORT", "5432")),
+        # the database is fixed by the jira_data source of dbt
+        "database": "jira_dw",
+        "user": os.getenv("POSTGRES_USER", "dlt_user"),
+        "password": os.getenv("POSTGRES_PASSWORD", "dlt_password"),
+    }
+
+
+def run_model(model: str, source_schema: str, target: str) -> Dict[str, Any]:
+    """
+    Runs one dbt model and reads its timing from `run_results.json`.
+
+    Args:
+        model: Name of the model.
+        source_schema: Schema the `jira_data` source is read from.
+        target: dbt target to run with.
+    Returns:
+        Dict[str, Any]: `status`, `execution_time` in seconds as measured by dbt,
+            `wall_time` of the dbt process and the `adapter_response`.
+    """
+    variables = {"jira_source_schema": source_schema, "bulk_changelog": False}
+    cmd = [
+        "dbt",
+        "run",
+        "--select",
+        model,
+        "--target",
+        target,
+        "--vars",
+        json.dumps(variables),
+        "--profiles-dir",
+        str(DBT_DIR),
+    ]
+    started = time.perf_counter()
+    completed = subprocess.run(cmd, cwd=DBT_DIR, capture_output=True, text=True)
+    wall_time = time.perf_counter() - started
+    if completed.returncode != 0:
+        logger.error(f"dbt run of {model} failed:\n{completed.stdout[-2000:]}")
+        return {"status": "error", "execution_time": None, "wall_time": wall_time}
+
+    with open(DBT_DIR / "target" / "run_results.json") as f:
+        result = json.load(f)["results"][0]
+    return {
+        "status": result["status"],
+        "execution_time": result["execution_time"],
+        "wall_time": wall_time,
+        "adapter_response": result.get("adapter_response", {}),
+    }
+
+
+def count_rows(connection: Any, schema: str, relation: str) -> Optional[int]:
+    """
+    Counts the rows of a model, views included.
+
+    Args:
+        connection: A psycopg2 connection.
+        schema: The schema dbt builds the models in.
+        relation: Name of the model.
+    Returns:
+        Optional[int]: The number of rows, or None if the relation does not exist.
+    """
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM "{schema}"."{relation}"')
+            return cursor.fetchone()[0]
+    except psycopg2.Error:
+        connection.rollback()
+        return None
+
+
+def run_benchmark(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Generates the warehouse unless asked not to and benchmarks the models.
+
+    Args:
+        args: The parsed command line arguments.
+    Returns:
+        List[Dict[str, Any]]: The results per model.
+    """
+    connection = psycopg2.connect(**db_config())
+    try:
+        if not args.skip_generate:
+            generator = WarehouseGenerator(
+                issues=args.issues,
+                histories=args.histories,
+                users=args.users,
+                projects=args.projects,
+                seed=args.seed,
+            )
+            started = time.perf_counter()
+            counts = generate_warehouse(
+                connection, generator, schema=args.source_schema
+            )
+            logger.info(
+                f"Generated warehouse in {time.perf_counter() - started:.1f}s: "
+                f"{counts}"
+            )
+
+        results = []
+        for model in args.models or MODELS:
+            result = run_model(model, args.source_schema, args.target)
+            result["model"] = model
+            result["rows"] = count_rows(connection, args.target_schema, model)
+            logger.info(
+                f"{model}: {result['status']} in {result['execution_time']}s, "
+                f"{result['rows']} rows"
+            )
+            results.append(result)
+        return results
+    finally:
+        connection.close()
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the dbt models against a synthetic warehouse"
+    )
+    parser.add_argument("--issues", type=int, default=100_000)
+    parser.add_argument(
+        "--histories", type=int, default=None, help="Defaults to 8 per issue"
+    )
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--source-schema",
+        default="jira_bench",
+        help="Schema the synthetic tables are written to (dropped first)",
+    )
+    parser.add_argument("--target", default="bench", help="dbt target")
+    parser.add_argument(
+        "--target-schema",
+        default="jira_bench_analytics",
+        help="Schema the dbt target builds the models in",
+    )
+    parser.add_argument(
+        "--skip-generate",
+        action="store_true",
+        help="Reuse the warehouse written by a previous run",
+    )
+    parser.add_argument("--models", nargs="*", help="Models to run, defaults to all")
+    parser.add_argument("--output", help="Where to write the results as JSON")
+    args = parser.parse_args()
+
+    if args.source_schema == "jira_data":
+        parser.error("--source-schema must not be the schema dlt loads to")
+    if args.histories is None:
+        args.histories = args.issues * 8
+
+    results = run_benchmark(args)
+
+    output = Path(args.output or RESULTS_DIR / f"dbt_models_{args.issues}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "issues": args.issues,
+                "histories": args.histories,
+                "users": args.users,
+                "projects": args.projects,
+                "models": results,
+            },
+            f,
+            indent=2,
+        )
+
+    print(f"\n{'model':<24} {'status':<8} {'seconds':>10} {'rows':>12}")
+    for result in results:
+        seconds = result["execution_time"]
+        print(
+            f"{result['model']:<24} {result['status']:<8} "
+            f"{seconds if seconds is None else round(seconds, 2)!s:>10} "
+            f"{result['rows']!s:>12}"
+        )
+    logger.info(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Synthetic warehouse generator that writes Jira data in the dlt `jira_data` layout.
+
+Issues, their inline changelog histories and history items, users and projects are
+generated deterministically from a seed and bulk loaded with `COPY`, so the dbt
+models can be measured at millions of issues without extracting them from Jira.
+"""
+
+import csv
+import io
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LOAD_ID = "1700000000.000000"
+START_DATE = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+# the statuses an issue walks through, one status change per history
+STATUS_FLOW = [
+    ("1", "To Do", "To Do"),
+    ("3", "In Progress", "In Progress"),
+    ("4", "In Review", "In Progress"),
+    ("5", "Done", "Done"),
+]
+PRIORITIES = [("1", "Highest"), ("2", "High"), ("3", "Medium"), ("4", "Low")]
+ISSUE_TYPES = [("10001", "Story"), ("10002", "Task"), ("10003", "Bug")]
+
+TABLES: Dict[str, Sequence[Tuple[str, str]]] = {
+    "users": (
+        ("account_id", "varchar"),
+        ("display_name", "varchar"),
+        ("email_address", "varchar"),
+        ("active", "boolean"),
+        ("time_zone", "varchar"),
+        ("_dlt_load_id", "varchar"),
+        ("_dlt_id", "varchar"),
+    ),
+    "projects": (
+        ("id", "varchar"),
+        ("key", "varchar"),
+        ("name", "varchar"),
+        ("description", "varchar"),
+        ("lead__account_id", "varchar"),
+        ("lead__display_name", "varchar"),
+        ("project_type_key", "varchar"),
+        ("_dlt_load_id", "varchar"),
+        ("_dlt_id", "varchar"),
+    ),
+    "issues": (
+        ("id", "varchar"),
+        ("key", "varchar"),
+        ("fields__summary", "varchar"),
+        ("fields__issuetype__id", "varchar"),
+        ("fields__issuetype__name", "varchar"),
+        ("fields__status__id", "varchar"),
+        ("fields__status__name", "varchar"),
+        ("fields__status__status_category__name", "varchar"),
+        ("fields__priority__id", "varchar"),
+        ("fields__priority__name", "varchar"),
+        ("fields__assignee__account_id", "varchar"),
+        ("fields__assignee__display_name", "varchar"),
+        ("fields__assignee__email_address", "varchar"),
+        ("fields__reporter__account_id", "varchar"),
+        ("fields__reporter__display_name", "varchar"),
+        ("fields__reporter__email_address", "varchar"),
+        ("fields__project__id", "varchar"),
+        ("fields__project__key", "varchar"),
+        ("fields__project__name", "varchar"),
+        ("fields__created", "timestamp with time zone"),
+        ("fields__updated", "timestamp with time zone"),
+        ("fields__resolutiondate", "timestamp with time zone"),
+        ("fields__duedate", "timestamp with time zone"),
+        ("fields__resolution__name", "varchar"),
+        ("_dlt_load_id", "varchar"),
+        ("_dlt_id", "varchar"),
+    ),
+    "issues__changelog__histories": (
+        ("id", "varchar"),
+        ("author__account_id", "varchar"),
+        ("author__display_name", "varchar"),
+        ("created", "timestamp with time zone"),
+        ("_dlt_root_id", "varchar"),
+        ("_dlt_parent_id", "varchar"),
+        ("_dlt_list_idx", "bigint"),
+        ("_dlt_id", "varchar"),
+    ),
+    "issues__changelog__histories__items": (
+        ("field", "varchar"),
+        ("fieldtype", "varchar"),
+        ("from_string", "varchar"),
+        ("to_string", "varchar"),
+        ("_dlt_root_id", "varchar"),
+        ("_dlt_parent_id", "varchar"),
+        ("_dlt_list_idx", "bigint"),
+        ("_dlt_id", "varchar"),
+    ),
+}
+
+Row = Tuple[Any, ...]
+
+
+class WarehouseGenerator:
+    """
+    Deterministic generator of the rows of the dlt `jira_data` tables.
+
+    Issues are spread round robin over the projects and get `histories` changelog
+    histories in total, spread evenly over the issues. Histories alternate status
+    changes, which walk the issue through `STATUS_FLOW`, and assignee changes.
+    """
+
+    def __init__(
+        self,
+        issues: int,
+        histories: int,
+        users: int,
+        projects: int = 10,
+        seed: int = 0,
+    ) -> None:
+        """
+        Args:
+            issues: Number of issues.
+            histories: Total number of changelog histories.
+            users: Number of users.
+            projects: Number of projects.
+            seed: Seed of the random generator, equal seeds give equal warehouses.
+        """
+        self.issues = issues
+        self.histories = histories
+        self.users = max(users, 1)
+        self.projects = max(projects, 1)
+        self.seed = seed
+
+    def user_rows(self) -> List[Row]:
+        """Returns the rows of the `users` table."""
+        return [
+            (
+                f"user-{n}",
+                f"User {n}",
+                f"user{n}@example.com",
+                n % 20 != 0,
+                "UTC",
+                LOAD_ID,
+                f"u{n:013x}",
+            )
+            for n in range(self.users)
+        ]
+
+    def project_rows(self) -> List[Row]:
+        """Returns the rows of the `projects` table."""
+        return [
+            (
+                str(10000 + n),
+                project_key(n),
+                f"Project {project_key(n)}",
+                None,
+                f"user-{n % self.users}",
+                f"User {n % self.users}",
+                "software",
+                LOAD_ID,
+                f"p{n:013x}",
+            )
+            for n in range(self.projects)
+        ]
+
+    def issue_rows(
+        self, start: int, stop: int
+    ) -> Tuple[List[Row], List[Row], List[Row]]:
+        """
+        Returns the rows of a range of issues and of their changelogs.
+
+        The rows of an issue only depend on the seed and on its number, so ranges can
+        be generated independently.
+
+        Args:
+            start: Number of the first issue.
+            stop: Number after the last issue.
+        Returns:
+            Tuple[List[Row], List[Row], List[Row]]: Rows of `issues`,
+                `issues__changelog__histories` and
+                `issues__changelog__histories__items`.
+        """
+        issues: List[Row] = []
+        histories: List[Row] = []
+        items: List[Row] = []
+        per_issue, extra = divmod(self.histories, max(self.issues, 1))
+
+        for n in range(start, min(stop, self.issues)):
+            rng = random.Random(self.seed * 1_000_003 + n)
+            issue_dlt_id = f"i{n:013x}"
+            project = n % self.projects
+            assignee = rng.randrange(self.users)
+            reporter = rng.randrange(self.users)
+            created = START_DATE + timedelta(minutes=rng.randrange(2 * 365 * 24 * 60))
+            changed = created
+            status = 0
+
+            for h in range(per_issue + (1 if n < extra else 0)):
+                changed += timedelta(minutes=rng.randrange(10, 5 * 24 * 60))
+                author = rng.randrange(self.users)
+                history_dlt_id = f"h{n:09x}{h:04x}"
+                histories.append(
+                    (
+                        f"{n}{h:04d}",
+                        f"user-{author}",
+                        f"User {author}",
+                        changed,
+                        issue_dlt_id,
+                        issue_dlt_id,
+                        h,
+                        history_dlt_id,
+                    )
+                )
+                if h % 2 == 0:
+                    previous, status = status, (status + 1) % len(STATUS_FLOW)
+                    item = (
+                        "status",
+                        "jira",
+                        STATUS_FLOW[previous][1],
+                        STATUS_FLOW[status][1],
+                    )
+                else:
+                    previous, assignee = assignee, rng.randrange(self.users)
+                    item = ("assignee", "jira", f"User {previous}", f"User {assignee}")
+                items.append(
+                    item + (issue_dlt_id, history_dlt_id, 0, f"c{n:09x}{h:04x}")
+                )
+
+            status_id, status_name, category = STATUS_FLOW[status]
+            priority_id, priority = rng.choice(PRIORITIES)
+            type_id, issue_type = rng.choice(ISSUE_TYPES)
+            resolved = changed if category == "Done" else None
+            issues.append(
+                (
+                    str(100000 + n),
+                    f"{project_key(project)}-{n // self.projects + 1}",
+                    f"Synthetic issue {n}",
+                    type_id,
+                    issue_type,
+                    status_id,
+                    status_name,
+                    category,
+                    priority_id,
+                    priority,
+                    f"user-{assignee}",
+                    f"User {assignee}",
+                    f"user{assignee}@example.com",
+                    f"user-{reporter}",
+                    f"User {reporter}",
+                    f"user{reporter}@example.com",
+                    str(10000 + project),
+                    project_key(project),
+                    f"Project {project_key(project)}",
+                    created,
+                    changed,
+                    resolved,
+                    created + timedelta(days=rng.randrange(7, 60)),
+                    "Done" if resolved else None,
+                    LOAD_ID,
+                    issue_dlt_id,
+                )
+            )
+        return issues, histories, items
+
+    def chunks(
+        self, chunk_size: int
+    ) -> Iterator[Tuple[List[Row], List[Row], List[Row]]]:
+        """
+        Yields the issue rows in chunks of `chunk_size` issues.
+
+        Args:
+            chunk_size: Number of issues per chunk.
+        Yields:
+            Tuple[List[Row], List[Row], List[Row]]: The rows of a chunk, see
+                `issue_rows`.
+        """
+        for start in range(0, self.issues, chunk_size):
+            yield self.issue_rows(start, start + chunk_size)
+
+
+def project_key(n: int) -> str:
+    """Returns the key of the n-th project, e.g. `PA`, `PB`, ..., `PBA`."""
+    letters = ""
+    while True:
+        n, rest = divmod(n, 26)
+        letters = chr(ord("A") + rest) + letters
+        if not n:
+            return f"P{letters}"
+
+
+def create_tables(cursor: Any, schema: str) -> None:
+    """
+    Recreates the schema and its tables, dropping any previous data.
+
+    Args:
+        cursor: A psycopg2 cursor.
+        schema: The schema of the generated tables.
+    """
+    cursor.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+    cursor.execute(f'CREATE SCHEMA "{schema}"')
+    for table, columns in TABLES.items():
+        definition = ", ".join(f'"{name}" {type_}' for name, type_ in columns)
+        cursor.execute(f'CREATE TABLE "{schema}"."{table}" ({definition})')
+    cursor.execute(
+        f'CREATE TABLE "{schema}"."_dlt_loads" (load_id varchar NOT NULL, '
+        "schema_name varchar, status bigint NOT NULL, "
+        "inserted_at timestamp with time zone NOT NULL, schema_version_hash varchar)"
+    )
+    cursor.execute(
+        f'INSERT INTO "{schema}"."_dlt_loads" VALUES (%s, %s, 0, now(), NULL)',
+        (LOAD_ID, "jira"),
+    )
+
+
+def copy_rows(cursor: Any, schema: str, table: str, rows: Sequence[Row]) -> None:
+    """
+    Bulk loads rows into a table with `COPY ... FROM STDIN`.
+
+    Args:
+        cursor: A psycopg2 cursor.
+        schema: The schema of the table.
+        table: A table of `TABLES`.
+        rows: The rows, in the column order of `TABLES`.
+    """
+    buffer = io.StringIO()
+    # unquoted empty fields, which is how None is written, are read back as NULL
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    columns = ", ".join(f'"{name}"' for name, _ in TABLES[table])
+    cursor.copy_expert(
+        f'COPY "{schema}"."{table}" ({columns}) FROM STDIN WITH (FORMAT csv)', buffer
+    )
+
+
+def generate_warehouse(
+    connection: Any,
+    generator: WarehouseGenerator,
+    schema: str = "jira_bench",
+    chunk_size: int = 50_000,
+) -> Dict[str, int]:
+    """
+    Writes a synthetic warehouse and analyzes its tables.
+
+    Args:
+        connection: A psycopg2 connection, committed after each chunk.
+        generator: Generates the rows.
+        schema: The schema to write the tables to. It is dropped first, so never
+            point it at the schema dlt loads real data to.
+        chunk_size: Number of issues generated and copied at a time.
+    Returns:
+        Dict[str, int]: Number of rows written per table.
+    """
+    counts = {table: 0 for table in TABLES}
+    with connection.cursor() as cursor:
+        create_tables(cursor, schema)
+        for table, rows in (
+            ("users", generator.user_rows()),
+            ("projects", generator.project_rows()),
+        ):
+            copy_rows(cursor, schema, table, rows)
+            counts[table] = len(rows)
+    connection.commit()
+
+    tables = (
+        "issues",
+        "issues__changelog__histories",
+        "issues__changelog__histories__items",
+    )
+    for chunk in generator.chunks(chunk_size):
+        with connection.cursor() as cursor:
+            for table, rows in zip(tables, chunk):
+                copy_rows(cursor, schema, table, rows)
+                counts[table] += len(rows)
+        connection.commit()
+        logger.info(f"Generated {counts['issues']}/{generator.issues} issues")
+
+    with connection.cursor() as cursor:
+        for table in TABLES:
+            cursor.execute(f'ANALYZE "{schema}"."{table}"')
+    connection.commit()
+    return counts
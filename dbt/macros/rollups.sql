@@ -0,0 +1,26 @@
+{#
+    Projects with issues loaded after the last run of an incremental rollup.
+
+    Rollups are kept per project and rebuilt with delete+insert on project_id, so an
+    issue changing priority, assignee or resolution moves between groups of the same
+    project without the rollup having to know its previous values. The project an
+    issue moved out of is rebuilt too, through previous_project_id. load_id is the
+    column compared with the watermark, so a rollup can also follow other loads.
+#}
+{% macro rollup_changed_projects(load_id='dlt_load_id') %}
+    SELECT
+        project_id
+    FROM
+        {{ ref('fct_issues_details') }}
+    WHERE
+        {{ load_id }} > (SELECT COALESCE(MAX(dlt_load_id), '') FROM {{ this }})
+
+    UNION
+
+    SELECT
+        previous_project_id
+    FROM
+        {{ ref('fct_issues_details') }}
+    WHERE
+        {{ load_id }} > (SELECT COALESCE(MAX(dlt_load_id), '') FROM {{ this }})
+{% endmacro %}
@@ -1,12 +1,57 @@
 {{
     config(
-        materialized='table',
+        materialized='incremental',
+        incremental_strategy='merge',
         unique_key='issue_key',
-        on_schema_change='append_new_columns'
+        on_schema_change='append_new_columns',
+        indexes=[
+            {'columns': ['issue_key'], 'unique': True},
+            {'columns': ['project_id']},
+            {'columns': ['dlt_load_id']},
+            {'columns': ['created_date']}
+        ]
     )
 }}
 
-WITH issue_changelog AS (
+-- Incremental runs merge the issues written by loads newer than the last one in this
+-- table and aggregate the changelog of those issues only. Unchanged issues whose
+-- CURRENT_DATE based columns can still move (created in the last 90 days, or open
+-- with a due date) are rebuilt too, keeping their stored changelog counts, as are
+-- unchanged issues whose assignee, reporter or project was loaded again since, so
+-- that renames reach the denormalized names. previous_project_id keeps the project
+-- each issue had before the merge, so rollups also rebuild the project an issue
+-- moved out of.
+
+WITH changed_issues AS (
+    SELECT
+        *
+    FROM
+        {{ ref('stg_jira_issues') }}
+    {% if is_incremental() %}
+    WHERE
+        _dlt_load_id > (SELECT COALESCE(MAX(dlt_load_id), '') FROM {{ this }})
+    {% endif %}
+),
+
+{% if is_incremental() %}
+renamed_issues AS (
+    SELECT
+        t.issue_key
+    FROM
+        {{ this }} t
+    LEFT JOIN
+        {{ ref('stg_jira_users') }} u ON t.assignee_id = u.account_id
+    LEFT JOIN
+        {{ ref('stg_jira_users') }} r ON t.reporter_id = r.account_id
+    LEFT JOIN
+        {{ ref('stg_jira_projects') }} p ON t.project_id = p.project_id
+    WHERE
+        GREATEST(u._dlt_load_id, r._dlt_load_id, p._dlt_load_id)
+            > COALESCE(t.names_dlt_load_id, '')
+),
+{% endif %}
+
+issue_changelog AS (
     SELECT
         issue_dlt_id,
         COUNT(DISTINCT history_id) AS change_count,
@@ -16,8 +61,50 @@ WITH issue_changelog AS (
         MAX(change_date) AS last_change_date
     FROM
         {{ ref('stg_jira_changelog') }}
+    {% if is_incremental() %}
+    WHERE
+        issue_dlt_id IN (SELECT _dlt_id FROM changed_issues)
+    {% endif %}
     GROUP BY
         issue_dlt_id
+),
+
+issues AS (
+    SELECT
+        ci.*,
+        ic.change_count,
+        ic.status_change_count,
+        ic.assignee_change_count
+    FROM
+        changed_issues ci
+    LEFT JOIN
+        issue_changelog ic ON ci._dlt_id = ic.issue_dlt_id
+    {% if is_incremental() %}
+
+    UNION ALL
+
+    SELECT
+        i.*,
+        t.change_count,
+        t.status_change_count,
+        t.assignee_change_count
+    FROM
+        {{ ref('stg_jira_issues') }} i
+    INNER JOIN
+        {{ this }} t ON t.issue_key = i.issue_key
+    WHERE
+        i._dlt_load_id = t.dlt_load_id
+        AND (
+            (
+                t.snapshot_date < CURRENT_DATE
+                AND (
+                    t.age_bucket <> 'Older'
+                    OR (i.due_date IS NOT NULL AND i.resolution_date IS NULL)
+                )
+            )
+            OR t.issue_key IN (SELECT issue_key FROM renamed_issues)
+        )
+    {% endif %}
 )
 
 SELECT 
@@ -30,6 +117,11 @@ SELECT
     i.status,
     i.priority,
     i.project_id,
+    {% if is_incremental() %}
+    COALESCE(prev.project_id, i.project_id) AS previous_project_id,
+    {% else %}
+    i.project_id AS previous_project_id,
+    {% endif %}
     i.assignee_id,
     i.reporter_id,
     
@@ -90,9 +182,9 @@ SELECT
     END AS is_recent,
     
     -- Activity Metrics
-    COALESCE(ic.change_count, 0) AS change_count,
-    COALESCE(ic.status_change_count, 0) AS status_change_count,
-    COALESCE(ic.assignee_change_count, 0) AS assignee_change_count,
+    COALESCE(i.change_count, 0) AS change_count,
+    COALESCE(i.status_change_count, 0) AS status_change_count,
+    COALESCE(i.assignee_change_count, 0) AS assignee_change_count,
     
     -- Additional Categorization
     CASE
@@ -110,17 +202,21 @@ SELECT
     END AS age_bucket,
     
     -- Snapshot Metadata
+    i._dlt_load_id AS dlt_load_id,
+    GREATEST(u._dlt_load_id, r._dlt_load_id, p._dlt_load_id) AS names_dlt_load_id,
     CURRENT_TIMESTAMP AS snapshot_dttm,
     CURRENT_DATE AS snapshot_date,
     'CUMULATIVE_SNAPSHOT' AS fact_type
 
 FROM 
-    {{ ref('stg_jira_issues') }} i
-LEFT JOIN
-    issue_changelog ic ON i._dlt_id = ic.issue_dlt_id
+    issues i
 LEFT JOIN
     {{ ref('stg_jira_users') }} u ON i.assignee_id = u.account_id
 LEFT JOIN
     {{ ref('stg_jira_users') }} r ON i.reporter_id = r.account_id
 LEFT JOIN
-    {{ ref('stg_jira_projects') }} p ON i.project_id = p.project_id
\ No newline at end of file
+    {{ ref('stg_jira_projects') }} p ON i.project_id = p.project_id
+{% if is_incremental() %}
+LEFT JOIN
+    {{ this }} prev ON i.issue_key = prev.issue_key
+{% endif %}
\ No newline at end of file
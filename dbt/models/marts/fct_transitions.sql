@@ -1,11 +1,17 @@
 {{
     config(
-        materialized='table',
-        unique_key='transition_key',
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='issue_id',
         on_schema_change='append_new_columns'
     )
 }}
 
+-- Incremental runs rebuild every transition of the issues written by loads newer
+-- than the last one in this table. An issue is reloaded with all of its changelog
+-- whenever it changes, so recomputing whole issues keeps LAG over its history exact
+-- and delete+insert on issue_id drops the rows of its previous version.
+
 WITH issue_transitions AS (
     SELECT
         cl.history_id,
@@ -24,6 +30,7 @@ WITH issue_transitions AS (
         i.priority,
         i.created_date,
         i.resolution_date,
+        i._dlt_load_id,
         -- Create a unique key for each transition
         CONCAT(cl.issue_dlt_id, '_', cl.history_id, '_', cl.field) AS transition_key
     FROM
@@ -32,6 +39,9 @@ WITH issue_transitions AS (
         {{ ref('stg_jira_issues') }} i ON cl.issue_dlt_id = i._dlt_id
     WHERE
         cl.field IN ('status', 'assignee', 'priority', 'issuetype')
+        {% if is_incremental() %}
+        AND i._dlt_load_id > (SELECT COALESCE(MAX(dlt_load_id), '') FROM {{ this }})
+        {% endif %}
 ),
 
 status_transitions AS (
@@ -146,6 +156,7 @@ SELECT
     END AS workflow_stage,
     
     -- Metadata
+    _dlt_load_id AS dlt_load_id,
     CURRENT_TIMESTAMP AS dbt_updated_at,
     'TRANSACTION_FACT' AS fact_type
 
@@ -0,0 +1,31 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='project_id',
+        on_schema_change='append_new_columns'
+    )
+}}
+
+SELECT
+    project_id,
+    COALESCE(priority, 'Unclassified') AS priority,
+    issue_type,
+    status_category,
+    COUNT(*) AS issue_count,
+    COUNT(CASE WHEN resolution_date IS NULL THEN 1 END) AS open_count,
+    COUNT(days_to_resolution) AS resolved_count,
+    SUM(days_to_resolution) AS total_days_to_resolution,
+    MAX(dlt_load_id) AS dlt_load_id,
+    CURRENT_TIMESTAMP AS dbt_updated_at
+FROM
+    {{ ref('fct_issues_details') }}
+{% if is_incremental() %}
+WHERE
+    project_id IN ({{ rollup_changed_projects() }})
+{% endif %}
+GROUP BY
+    project_id,
+    COALESCE(priority, 'Unclassified'),
+    issue_type,
+    status_category
@@ -0,0 +1,60 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='project_id',
+        on_schema_change='append_new_columns',
+        indexes=[{'columns': ['flow_date']}]
+    )
+}}
+
+WITH issues AS (
+    SELECT
+        project_id,
+        created_date,
+        resolution_date,
+        dlt_load_id
+    FROM
+        {{ ref('fct_issues_details') }}
+    {% if is_incremental() %}
+    WHERE
+        project_id IN ({{ rollup_changed_projects() }})
+    {% endif %}
+),
+
+flow AS (
+    SELECT
+        project_id,
+        created_date::date AS flow_date,
+        1 AS created,
+        0 AS resolved,
+        dlt_load_id
+    FROM
+        issues
+
+    UNION ALL
+
+    SELECT
+        project_id,
+        resolution_date::date AS flow_date,
+        0 AS created,
+        1 AS resolved,
+        dlt_load_id
+    FROM
+        issues
+    WHERE
+        resolution_date IS NOT NULL
+)
+
+SELECT
+    project_id,
+    flow_date,
+    SUM(created) AS created_count,
+    SUM(resolved) AS resolved_count,
+    MAX(dlt_load_id) AS dlt_load_id,
+    CURRENT_TIMESTAMP AS dbt_updated_at
+FROM
+    flow
+GROUP BY
+    project_id,
+    flow_date
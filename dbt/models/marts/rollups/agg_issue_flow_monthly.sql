@@ -0,0 +1,26 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='project_id',
+        on_schema_change='append_new_columns',
+        indexes=[{'columns': ['flow_month']}]
+    )
+}}
+
+SELECT
+    project_id,
+    DATE_TRUNC('month', flow_date)::date AS flow_month,
+    SUM(created_count) AS created_count,
+    SUM(resolved_count) AS resolved_count,
+    MAX(dlt_load_id) AS dlt_load_id,
+    CURRENT_TIMESTAMP AS dbt_updated_at
+FROM
+    {{ ref('agg_issue_flow_daily') }}
+{% if is_incremental() %}
+WHERE
+    project_id IN ({{ rollup_changed_projects() }})
+{% endif %}
+GROUP BY
+    project_id,
+    DATE_TRUNC('month', flow_date)::date
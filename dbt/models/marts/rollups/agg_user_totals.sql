@@ -0,0 +1,34 @@
+{{
+    config(
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='project_id',
+        on_schema_change='append_new_columns'
+    )
+}}
+
+-- The watermark also follows the loads of the user names, so renamed assignees reach
+-- the rollup even when their issues were not loaded again.
+
+SELECT
+    project_id,
+    assignee_id AS user_id,
+    COALESCE(assignee_name, 'Unassigned') AS user_name,
+    status_category,
+    COUNT(*) AS assigned_issues,
+    COUNT(CASE WHEN status_category = 'Done' THEN 1 END) AS completed_issues,
+    COUNT(days_to_resolution) AS resolved_issues,
+    SUM(days_to_resolution) AS total_days_to_resolution,
+    MAX(GREATEST(dlt_load_id, names_dlt_load_id)) AS dlt_load_id,
+    CURRENT_TIMESTAMP AS dbt_updated_at
+FROM
+    {{ ref('fct_issues_details') }}
+{% if is_incremental() %}
+WHERE
+    project_id IN ({{ rollup_changed_projects('GREATEST(dlt_load_id, names_dlt_load_id)') }})
+{% endif %}
+GROUP BY
+    project_id,
+    assignee_id,
+    COALESCE(assignee_name, 'Unassigned'),
+    status_category
@@ -1,18 +1,57 @@
 {{
     config(
-        materialized='view'
+        materialized='incremental',
+        incremental_strategy='delete+insert',
+        unique_key='issue_id',
+        on_schema_change='append_new_columns',
+        indexes=[
+            {'columns': ['issue_dlt_id']},
+            {'columns': ['issue_id']},
+            {'columns': ['field']},
+            {'columns': ['change_date']}
+        ]
     )
 }}
 
+-- Persisted once per run so that the marts scan an indexed table instead of each
+-- re-evaluating the histories/items join. An issue is reloaded with a new _dlt_id
+-- and its whole changelog whenever it changes, so incremental runs replace all rows
+-- of the issues written by loads newer than the last one in this table.
+
 WITH changelog_histories AS (
+    {% if var('bulk_changelog', true) %}
+    -- Complete histories loaded by the issue_changelogs transformer
     SELECT 
-        id AS history_id,
-        _dlt_parent_id AS issue_dlt_id,
-        author__account_id AS author_id,
-        created::timestamp AS change_date,
-        _dlt_id
+        h.id AS history_id,
+        i._dlt_id AS issue_dlt_id,
+        i.id AS issue_id,
+        h.author__account_id AS author_id,
+        h.created::timestamp AS change_date,
+        h._dlt_id,
+        i._dlt_load_id
+    FROM 
+        {{ source('jira_data', 'issue_changelogs') }} h
+    INNER JOIN 
+        {{ source('jira_data', 'issues') }} i ON i.id = h.issue_id
+    {% else %}
+    -- Histories expanded inline with each issue (truncated by Jira)
+    SELECT 
+        h.id AS history_id,
+        h._dlt_parent_id AS issue_dlt_id,
+        i.id AS issue_id,
+        h.author__account_id AS author_id,
+        h.created::timestamp AS change_date,
+        h._dlt_id,
+        i._dlt_load_id
     FROM 
-        {{ source('jira_data', 'issues__changelog__histories') }}
+        {{ source('jira_data', 'issues__changelog__histories') }} h
+    INNER JOIN 
+        {{ source('jira_data', 'issues') }} i ON i._dlt_id = h._dlt_parent_id
+    {% endif %}
+    {% if is_incremental() %}
+    WHERE
+        i._dlt_load_id > (SELECT COALESCE(MAX(_dlt_load_id), '') FROM {{ this }})
+    {% endif %}
 ),
 
 changelog_items AS (
@@ -23,13 +62,18 @@ changelog_items AS (
         to_string,
         _dlt_id
     FROM 
+        {% if var('bulk_changelog', true) %}
+        {{ source('jira_data', 'issue_changelogs__items') }}
+        {% else %}
         {{ source('jira_data', 'issues__changelog__histories__items') }}
+        {% endif %}
 )
 
 SELECT 
     -- Primary keys
     ch.history_id,
     ch.issue_dlt_id,
+    ch.issue_id,
     
     -- Change information
     ch.author_id,
@@ -40,7 +84,8 @@ SELECT
     
     -- Additional metadata
     ch._dlt_id AS history_dlt_id,
-    ci._dlt_id AS item_dlt_id
+    ci._dlt_id AS item_dlt_id,
+    ch._dlt_load_id
 
 FROM 
     changelog_histories ch
@@ -48,7 +48,8 @@ SELECT
     fields__resolution__name AS resolution,
     
     -- Additional metadata
-    _dlt_id
+    _dlt_id,
+    _dlt_load_id
 
 FROM 
     {{ source('jira_data', 'issues') }}
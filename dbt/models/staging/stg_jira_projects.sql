@@ -25,11 +25,12 @@ SELECT
     NULL AS last_issue_update_time,
     
     -- Additional metadata
+    _dlt_load_id,
     _dlt_id
 
 FROM 
     {% if var('load_projects', true) %}
         {{ source('jira_data', 'projects') }}
     {% else %}
-        (SELECT NULL::text AS id, NULL::text AS key, NULL::text AS name, NULL::text AS description, NULL::text AS lead__account_id, NULL::text AS lead__display_name, NULL::text AS project_type_key, NULL::text AS _dlt_id WHERE 1=0) AS projects
+        (SELECT NULL::text AS id, NULL::text AS key, NULL::text AS name, NULL::text AS description, NULL::text AS lead__account_id, NULL::text AS lead__display_name, NULL::text AS project_type_key, NULL::text AS _dlt_load_id, NULL::text AS _dlt_id WHERE 1=0) AS projects
     {% endif %}
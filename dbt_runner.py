@@ -0,0 +1,206 @@
+"""
+In-process dbt execution with a cached manifest and per-model results
+"""
+
+import json
+import logging
+import shlex
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 30 * 60
+
+# commands that accept --threads
+THREADED_COMMANDS = ("run", "build", "test", "seed", "snapshot")
+
+# project files whose changes invalidate the cached manifest
+PROJECT_PATHS = ("dbt_project.yml", "packages.yml", "models", "macros", "tests")
+
+
+class DbtRunResult(NamedTuple):
+    """Outcome of a dbt invocation"""
+
+    success: bool
+    models: List[Dict[str, Any]]
+    error: Optional[str]
+    elapsed: float
+
+
+def _dbt_runner_class() -> Any:
+    """Imports the programmatic runner of dbt-core"""
+    from dbt.cli.main import dbtRunner
+
+    return dbtRunner
+
+
+def node_results(execution_result: Any) -> List[Dict[str, Any]]:
+    """
+    Extracts the per-node timings and row counts of a dbt execution result.
+
+    Args:
+        execution_result: The `result` of a `dbtRunnerResult` of a run, build or test.
+    Returns:
+        List[Dict[str, Any]]: `model`, `unique_id`, `status`, `execution_time` in
+            seconds and `rows_affected` (None when the adapter does not report it).
+    """
+    models = []
+    for result in getattr(execution_result, "results", None) or []:
+        adapter_response = getattr(result, "adapter_response", None) or {}
+        models.append(
+            {
+                "model": result.node.name,
+                "unique_id": result.node.unique_id,
+                "status": str(getattr(result.status, "value", result.status)),
+                "execution_time": result.execution_time,
+                "rows_affected": adapter_response.get("rows_affected"),
+            }
+        )
+    return models
+
+
+class DbtRunner:
+    """
+    Runs dbt commands in the current process.
+
+    The project is parsed once (dbt keeps partial parsing state in `target/`) and the
+    manifest is reused by later invocations until a project file changes. Every
+    invocation runs in a daemon thread that is given up on after `timeout` seconds,
+    since dbt cannot be interrupted from the outside. Until that thread finished,
+    later invocations fail right away instead of running dbt concurrently, as the
+    runner is not re-entrant and all invocations write the same `target/`.
+    """
+
+    def __init__(
+        self,
+        project_dir: str,
+        profiles_dir: Optional[str] = None,
+        threads: Optional[int] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        log_path: Optional[str] = None,
+        target: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Args:
+            project_dir: Directory of dbt_project.yml.
+            profiles_dir: Directory of profiles.yml, defaults to the project directory.
+            threads: Number of threads dbt builds models with, defaults to the profile.
+            timeout: Seconds to wait for an invocation to finish.
+            log_path: Directory of the dbt logs.
+            target: Profile target to run against, defaults to the profile's.
+            variables: Project variables passed with `--vars`, e.g. how the
+                changelog was loaded.
+        """
+        self.project_dir = Path(project_dir)
+        self.profiles_dir = Path(profiles_dir) if profiles_dir else self.project_dir
+        self.threads = threads
+        self.timeout = timeout
+        self.log_path = log_path
+        self.target = target
+        self.variables = variables
+        self._manifest: Any = None
+        self._manifest_mtime = 0.0
+        self._lock = threading.Lock()
+        # the thread of the last invocation, possibly still running after a timeout
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def _common_args(self) -> List[str]:
+        args = ["--project-dir", str(self.project_dir)]
+        args += ["--profiles-dir", str(self.profiles_dir)]
+        if self.target:
+            args += ["--target", self.target]
+        if self.log_path:
+            args += ["--log-path", self.log_path]
+        if self.variables:
+            args += ["--vars", json.dumps(self.variables, sort_keys=True)]
+        return args
+
+    def _project_mtime(self) -> float:
+        """Returns the latest modification time of the project files"""
+        mtime = 0.0
+        for name in PROJECT_PATHS:
+            path = self.project_dir / name
+            files = path.rglob("*") if path.is_dir() else [path]
+            for file in files:
+                try:
+                    mtime = max(mtime, file.stat().st_mtime)
+                except OSError:
+                    continue
+        return mtime
+
+    def manifest(self) -> Any:
+        """
+        Returns the parsed manifest, parsing the project again if it changed.
+
+        Returns:
+            Any: The dbt `Manifest`.
+        """
+        with self._lock:
+            mtime = self._project_mtime()
+            if self._manifest is None or mtime > self._manifest_mtime:
+                started = time.monotonic()
+                result = _dbt_runner_class()().invoke(["parse", *self._common_args()])
+                if not result.success:
+                    raise RuntimeError(f"dbt parse failed: {result.exception}")
+                self._manifest = result.result
+                self._manifest_mtime = mtime
+                logger.info(f"dbt project parsed in {time.monotonic() - started:.1f}s")
+            return self._manifest
+
+    def invoke(
+        self, command: str, select: Optional[Sequence[str]] = None
+    ) -> DbtRunResult:
+        """
+        Runs a dbt command, e.g. `run`, `test` or `docs generate`.
+
+        Args:
+            command: The dbt command and its arguments.
+            select: Node selectors passed with `--select`.
+        Returns:
+            DbtRunResult: Whether the command succeeded, the per-model results, the
+                error if it failed and the elapsed seconds.
+        """
+        args = shlex.split(command)
+        if select:
+            args += ["--select", *select]
+        if self.threads and args[0] in THREADED_COMMANDS:
+            args += ["--threads", str(self.threads)]
+        args += self._common_args()
+
+        outcome: Dict[str, Any] = {}
+
+        def run() -> None:
+            try:
+                runner = _dbt_runner_class()(manifest=self.manifest())
+                outcome["result"] = runner.invoke(args)
+            except BaseException as e:
+                outcome["error"] = e
+
+        started = time.monotonic()
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return DbtRunResult(
+                    False, [], "a previous dbt invocation is still running", 0.0
+                )
+            thread = threading.Thread(target=run, name="dbt", daemon=True)
+            self._thread = thread
+            thread.start()
+        thread.join(self.timeout)
+        elapsed = time.monotonic() - started
+
+        if thread.is_alive():
+            return DbtRunResult(False, [], f"timed out after {self.timeout}s", elapsed)
+        if "error" in outcome:
+            return DbtRunResult(False, [], str(outcome["error"]), elapsed)
+
+        result = outcome["result"]
+        models = node_results(result.result)
+        error = None
+        if not result.success:
+            error = str(result.exception or "one or more nodes failed")
+        return DbtRunResult(result.success, models, error, elapsed)
@@ -0,0 +1,187 @@
+"""
+Index management for the raw tables dlt loads into Postgres
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+POSTGRES_MAX_IDENTIFIER_LENGTH = 63
+
+
+class IndexSpec(NamedTuple):
+    """An index declared on a raw table"""
+
+    table: str
+    columns: Tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        """Deterministic index name, shortened with a hash beyond 63 characters"""
+        name = f"idx_{self.table}__{'__'.join(self.columns)}"
+        if len(name) > POSTGRES_MAX_IDENTIFIER_LENGTH:
+            digest = hashlib.sha256(name.encode()).hexdigest()[:8]
+            name = f"{name[:POSTGRES_MAX_IDENTIFIER_LENGTH - 9]}_{digest}"
+        return name
+
+
+# Join keys of the nested tables, the keys the staging models look issues up by and
+# the columns probed by the incremental models and monitor.py
+RAW_INDEXES: Sequence[IndexSpec] = (
+    IndexSpec("issues", ("_dlt_id",)),
+    IndexSpec("issues", ("id",)),
+    IndexSpec("issues", ("_dlt_load_id",)),
+    IndexSpec("issues", ("fields__updated",)),
+    IndexSpec("issues", ("fields__project__id",)),
+    IndexSpec("issues__changelog__histories", ("_dlt_parent_id",)),
+    IndexSpec("issues__changelog__histories", ("_dlt_id",)),
+    IndexSpec("issues__changelog__histories__items", ("_dlt_parent_id",)),
+    IndexSpec("issue_changelogs", ("issue_id",)),
+    IndexSpec("issue_changelogs", ("_dlt_id",)),
+    IndexSpec("issue_changelogs__items", ("_dlt_parent_id",)),
+    IndexSpec("users", ("account_id",)),
+    IndexSpec("projects", ("id",)),
+)
+
+EXISTING_COLUMNS_SQL = """
+    SELECT table_name, column_name
+    FROM information_schema.columns
+    WHERE table_schema = %s
+"""
+
+INDEX_STATE_SQL = """
+    SELECT c.relname, x.indisvalid
+    FROM pg_index x
+    JOIN pg_class c ON c.oid = x.indexrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = %s
+"""
+
+INDEX_USAGE_COLUMNS = (
+    "table_name",
+    "index_name",
+    "idx_scan",
+    "idx_tup_read",
+    "idx_tup_fetch",
+    "size_bytes",
+)
+
+INDEX_USAGE_SQL = """
+    SELECT
+        s.relname AS table_name,
+        s.indexrelname AS index_name,
+        s.idx_scan,
+        s.idx_tup_read,
+        s.idx_tup_fetch,
+        pg_relation_size(s.indexrelid) AS size_bytes
+    FROM pg_stat_user_indexes s
+    WHERE s.schemaname = %s
+    ORDER BY s.relname, s.indexrelname
+"""
+
+
+def ensure_indexes(
+    sql_client: Any,
+    schema: str,
+    indexes: Sequence[IndexSpec] = RAW_INDEXES,
+) -> List[str]:
+    """
+    Creates the declared indexes that are missing, without blocking writes.
+
+    Indexes are built with `CREATE INDEX CONCURRENTLY IF NOT EXISTS`, so running this
+    after every load is cheap once they exist. Indexes on tables or columns that were
+    not loaded yet are skipped, and an index left invalid by an interrupted concurrent
+    build is dropped and built again.
+
+    Args:
+        sql_client: An open sql client of a Postgres destination in autocommit mode,
+            e.g. `pipeline.sql_client()`.
+        schema: The schema of the raw tables.
+        indexes: The declared indexes.
+    Returns:
+        List[str]: The names of the indexes created.
+    """
+    columns = {
+        (table, column)
+        for table, column in sql_client.execute_sql(EXISTING_COLUMNS_SQL, schema) or []
+    }
+    state = dict(sql_client.execute_sql(INDEX_STATE_SQL, schema) or [])
+
+    created = []
+    for index in indexes:
+        if not all((index.table, column) in columns for column in index.columns):
+            continue
+        if state.get(index.name) is True:
+            continue
+        if state.get(index.name) is False:
+            logger.warning(f"Rebuilding invalid index {index.name}")
+            sql_client.execute_sql(
+                f'DROP INDEX CONCURRENTLY IF EXISTS "{schema}"."{index.name}"'
+            )
+
+        column_list = ", ".join(f'"{column}"' for column in index.columns)
+        sql_client.execute_sql(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{index.name}" '
+            f'ON "{schema}"."{index.table}" ({column_list})'
+        )
+        logger.info(f"Created index {index.name} on {index.table}({column_list})")
+        created.append(index.name)
+    return created
+
+
+def index_usage(sql_client: Any, schema: str) -> List[Dict[str, Any]]:
+    """
+    Returns the usage statistics of the indexes of a schema.
+
+    Args:
+        sql_client: An open sql client of a Postgres destination.
+        schema: The schema of the tables.
+    Returns:
+        List[Dict[str, Any]]: `table_name`, `index_name`, `idx_scan`, `idx_tup_read`,
+            `idx_tup_fetch` and `size_bytes` per index.
+    """
+    rows = sql_client.execute_sql(INDEX_USAGE_SQL, schema) or []
+    return [dict(zip(INDEX_USAGE_COLUMNS, row)) for row in rows]
+
+
+def log_index_usage(usage: List[Dict[str, Any]]) -> None:
+    """
+    Logs the usage of each index and warns about the ones never scanned.
+
+    Args:
+        usage: The statistics returned by `index_usage`.
+    """
+    for index in usage:
+        logger.info(
+            f"Index {index['index_name']} on {index['table_name']}: "
+            f"{index['idx_scan']} scans, {index['idx_tup_read']} tuples read, "
+            f"{index['size_bytes'] / 1024 / 1024:.1f} MB"
+        )
+    unused = [index["index_name"] for index in usage if not index["idx_scan"]]
+    if unused:
+        logger.warning(f"Indexes never scanned: {', '.join(unused)}")
+
+
+def maintain_indexes(
+    pipeline: Any, indexes: Optional[Sequence[IndexSpec]] = None
+) -> List[str]:
+    """
+    Ensures the declared indexes on the dataset of a pipeline and logs their usage.
+
+    Does nothing for destinations other than Postgres.
+
+    Args:
+        pipeline: A dlt pipeline that loaded the raw tables.
+        indexes: The declared indexes, defaults to `RAW_INDEXES`.
+    Returns:
+        List[str]: The names of the indexes created.
+    """
+    if pipeline.destination.destination_type != "dlt.destinations.postgres":
+        return []
+    with pipeline.sql_client() as client:
+        schema = client.dataset_name
+        created = ensure_indexes(client, schema, indexes or RAW_INDEXES)
+        log_index_usage(index_usage(client, schema))
+    return created
@@ -1,13 +1,34 @@
 """This source uses Jira API and dlt to load data such as Issues, Users, Workflows and Projects to the database."""
 
-from typing import Iterable, List, Optional
+from datetime import datetime
+from typing import AsyncIterator, Iterable, List, Optional, Sequence
 
 import dlt
+from dlt.common.time import ensure_pendulum_datetime
 from dlt.common.typing import DictStrAny, TDataItem
 from dlt.sources import DltResource
-from dlt.sources.helpers import requests
 
-from .settings import DEFAULT_ENDPOINTS, DEFAULT_PAGE_SIZE
+from .client import JiraClient, get_client
+from .helpers import (
+    batched,
+    build_jql_shards,
+    incremental_jql,
+    iter_parallel,
+    skip_unchanged_rows,
+)
+from .settings import (
+    BATCH_SIZE,
+    CACHED_ENDPOINTS,
+    CHANGELOG_PAGE_SIZE,
+    CONNECT_TIMEOUT,
+    DEFAULT_ENDPOINTS,
+    DEFAULT_ISSUE_FIELDS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_POOL_SIZE,
+    MIN_ISSUE_AGE_HOURS,
+    READ_TIMEOUT,
+)
 
 
 @dlt.source(max_table_nesting=3)
@@ -16,6 +37,13 @@ def jira(
     email: str = dlt.secrets.value,
     api_token: str = dlt.secrets.value,
     page_size: int = DEFAULT_PAGE_SIZE,
+    stream: bool = False,
+    use_cache: bool = False,
+    cache_scope: Optional[str] = None,
+    skip_unchanged: bool = False,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
 ) -> Iterable[DltResource]:
     """
     Jira source function that generates a list of resource functions based on endpoints.
@@ -25,30 +53,51 @@ def jira(
         email: The email to authenticate with.
         api_token: The API token to authenticate with.
         page_size: Maximum number of results per page
+        stream: Parse responses incrementally and yield items one by one, which
+            bounds memory use by the largest item instead of the largest page.
+        use_cache: Skip the pages of `CACHED_ENDPOINTS` that did not change since
+            the previous run. Not applied when streaming. Call
+            `jira.cache.discard_pending_pages` before the run and
+            `jira.cache.commit_loaded_pages` once the pages were loaded.
+        cache_scope: Identifies where the pages are loaded to, e.g. the pipeline
+            and dataset names. Each scope has its own cache, so a new destination
+            is not missing the pages cached for another one.
+        skip_unchanged: Drop rows whose content hash matches the last load before
+            they are normalized, and add the hash as a `_row_hash` column.
+        pool_size: Maximum number of pooled connections kept alive per host.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
     Returns:
         Iterable[DltResource]: List of resource functions.
     """
     resources = []
     for endpoint_name, endpoint_parameters in DEFAULT_ENDPOINTS.items():
-        if endpoint_name == "users":
-            primary_key = "accountId"
-        elif endpoint_name in ["issues", "projects"]:
-            primary_key = "id"
-        else:
-            primary_key = None
-
+        if endpoint_name in CACHED_ENDPOINTS:
+            endpoint_parameters = {
+                **endpoint_parameters,
+                "cache": use_cache,
+                "cache_scope": cache_scope,
+            }
         res_function = dlt.resource(
-            get_paginated_data,
+            get_issues if endpoint_name == "issues" else get_paginated_data,
             name=endpoint_name,
             write_disposition="merge",
-            primary_key=primary_key,
+            primary_key=_endpoint_primary_key(endpoint_name),
         )(
             **endpoint_parameters,  # type: ignore[arg-type]
             subdomain=subdomain,
             email=email,
             api_token=api_token,
             page_size=page_size,
+            stream=stream,
+            pool_size=pool_size,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
         )
+        if skip_unchanged:
+            res_function = skip_unchanged_rows(
+                res_function, _endpoint_primary_key(endpoint_name)
+            )
         resources.append(res_function)
 
     return resources
@@ -60,6 +109,15 @@ def jira_search(
     email: str = dlt.secrets.value,
     api_token: str = dlt.secrets.value,
     page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    bulk_changelog: bool = True,
+    fields: Sequence[str] = DEFAULT_ISSUE_FIELDS,
+    custom_fields: Optional[Sequence[str]] = None,
+    stream: bool = False,
+    skip_unchanged: bool = False,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
 ) -> Iterable[DltResource]:
     """
     Jira search source function that generates a resource function for searching issues.
@@ -69,35 +127,310 @@ def jira_search(
         email: The email to authenticate with.
         api_token: The API token to authenticate with.
         page_size: Maximum number of results per page
+        max_workers: Maximum number of JQL queries or shards fetched concurrently
+        bulk_changelog: Load complete changelogs of the searched issues with the
+            `issue_changelogs` transformer instead of inline with each issue. The
+            dbt project reads the changelog from the tables of the same mode, pass
+            it the same value as the `bulk_changelog` var.
+        fields: Issue fields to request, defaults to the fields read by the dbt
+            staging models. Pass `["*all"]` to load every field.
+        custom_fields: Optional custom field IDs (e.g. `customfield_10016`) to
+            request in addition to `fields`.
+        stream: Parse search responses incrementally and yield issues one by one,
+            or in lists of `BATCH_SIZE` with `bulk_changelog`, so that every bulk
+            changelog request still covers a full batch.
+        skip_unchanged: Drop issues whose content hash matches the last load before
+            they are normalized, and add the hash as a `_row_hash` column.
+        pool_size: Maximum number of pooled connections kept alive per host.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
     Returns:
-        Iterable[DltResource]: Resource function for searching issues.
+        Iterable[DltResource]: Resource function for searching issues, followed by
+            the `issue_changelogs` transformer if `bulk_changelog` is set.
     """
 
+    client = get_client(
+        subdomain, email, api_token, pool_size, connect_timeout, read_timeout
+    )
+    search_params = _search_params(fields, custom_fields, changelog=not bulk_changelog)
+
     @dlt.resource(write_disposition="merge", primary_key="id")
-    def issues(jql_queries: List[str]) -> Iterable[TDataItem]:
+    def issues(
+        jql_queries: List[str],
+        project_keys: Optional[Sequence[str]] = None,
+        updated_since: Optional[datetime] = None,
+        window_days: Optional[int] = None,
+        updated: dlt.sources.incremental[str] = dlt.sources.incremental(
+            "fields.updated", lag=MIN_ISSUE_AGE_HOURS * 3600
+        ),
+    ) -> Iterable[TDataItem]:
+        """
+        Searches issues for each JQL query, optionally split into disjoint shards.
+
+        Once a run has completed, the `updated` lower bound of every query is moved
+        to the last loaded `fields.updated` minus `MIN_ISSUE_AGE_HOURS`.
+
+        Args:
+            jql_queries: JQL queries to search.
+            project_keys: Optional project keys to shard each query by, plus a
+                shard for all other projects.
+            updated_since: Start of the range sharded into `updated` windows,
+                defaults to the cursor value.
+            window_days: Size of each `updated` window in days.
+            updated: Incremental cursor on `fields.updated`, kept in dlt state.
+        Yields:
+            Iterable[TDataItem]: Pages of issues, each issue yielded once.
+        """
         api_path = "rest/api/3/search/jql"
 
-        for jql in jql_queries:
-            params = {
-                "fields": "*all",
-                "expand": "fields,changelog,operations,transitions,names",
-                "validateQuery": "strict",
-                "jql": jql,
-            }
+        shards = _search_shards(
+            jql_queries, project_keys, updated_since, window_days, updated.last_value
+        )
 
-            yield from get_paginated_data(
+        def fetch(jql: str) -> Iterable[TDataItem]:
+            params = {**search_params, "jql": jql}
+
+            if stream:
+                return batched(
+                    client.get_paginated_items(
+                        api_path=api_path,
+                        params=params,
+                        page_size=page_size,
+                        data_path="issues",
+                        paginator="token",
+                    ),
+                    BATCH_SIZE if bulk_changelog else 1,
+                )
+            return client.get_paginated_data(
                 api_path=api_path,
                 params=params,
-                subdomain=subdomain,
-                email=email,
-                api_token=api_token,
                 page_size=page_size,
                 data_path="issues",
+                paginator="token",
             )
 
+        seen_ids = set()
+        producers = [lambda jql=jql: fetch(jql) for jql in shards]
+        for page in iter_parallel(producers, max_workers=max_workers):
+            unique_page = [issue for issue in page if issue["id"] not in seen_ids]
+            seen_ids.update(issue["id"] for issue in unique_page)
+            if unique_page:
+                yield unique_page
+
+    if skip_unchanged:
+        issues = skip_unchanged_rows(issues, "id", updated_path="fields.updated")
+
+    @dlt.transformer(
+        data_from=issues,
+        name="issue_changelogs",
+        write_disposition="merge",
+        primary_key="id",
+    )
+    def issue_changelogs(issues_page: List[TDataItem]) -> Iterable[TDataItem]:
+        """
+        Fetches the complete changelog of each searched issue in bulk.
+
+        Inline changelogs are truncated by Jira, the bulk endpoint pages through all
+        histories of up to `BATCH_SIZE` issues per request.
+
+        Args:
+            issues_page: A page of issues yielded by the `issues` resource.
+        Yields:
+            Iterable[TDataItem]: Change histories, each tagged with its `issue_id`.
+        """
+        issue_ids = [issue["id"] for issue in issues_page]
+        for start in range(0, len(issue_ids), BATCH_SIZE):
+            yield from get_changelogs(client, issue_ids[start : start + BATCH_SIZE])
+
+    if bulk_changelog:
+        return issues, issue_changelogs
+    return issues
+
+
+@dlt.source(max_table_nesting=3)
+def jira_async(
+    subdomain: str = dlt.secrets.value,
+    email: str = dlt.secrets.value,
+    api_token: str = dlt.secrets.value,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterable[DltResource]:
+    """
+    Async variant of the `jira` source. Its resources are async generators, which dlt
+    evaluates concurrently, so all endpoints are fetched at the same time.
+
+    Args:
+        subdomain: The subdomain for the Jira instance.
+        email: The email to authenticate with.
+        api_token: The API token to authenticate with.
+        page_size: Maximum number of results per page
+    Returns:
+        Iterable[DltResource]: List of resource functions.
+    """
+    resources = []
+    for endpoint_name, endpoint_parameters in DEFAULT_ENDPOINTS.items():
+        res_function = dlt.resource(
+            (
+                get_issues_async
+                if endpoint_name == "issues"
+                else get_paginated_data_async
+            ),
+            name=endpoint_name,
+            write_disposition="merge",
+            primary_key=_endpoint_primary_key(endpoint_name),
+        )(
+            **endpoint_parameters,  # type: ignore[arg-type]
+            subdomain=subdomain,
+            email=email,
+            api_token=api_token,
+            page_size=page_size,
+        )
+        resources.append(res_function)
+
+    return resources
+
+
+@dlt.source(max_table_nesting=3)
+def jira_search_async(
+    subdomain: str = dlt.secrets.value,
+    email: str = dlt.secrets.value,
+    api_token: str = dlt.secrets.value,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    fields: Sequence[str] = DEFAULT_ISSUE_FIELDS,
+    custom_fields: Optional[Sequence[str]] = None,
+) -> Iterable[DltResource]:
+    """
+    Async variant of the `jira_search` source.
+
+    Args:
+        subdomain: The subdomain for the Jira instance.
+        email: The email to authenticate with.
+        api_token: The API token to authenticate with.
+        page_size: Maximum number of results per page
+        max_workers: Maximum number of JQL queries or shards fetched concurrently
+        fields: Issue fields to request, defaults to the fields read by the dbt
+            staging models. Pass `["*all"]` to load every field.
+        custom_fields: Optional custom field IDs to request in addition to `fields`.
+    Returns:
+        Iterable[DltResource]: Resource function for searching issues.
+    """
+    search_params = _search_params(fields, custom_fields, changelog=True)
+
+    @dlt.resource(write_disposition="merge", primary_key="id")
+    async def issues(
+        jql_queries: List[str],
+        project_keys: Optional[Sequence[str]] = None,
+        updated_since: Optional[datetime] = None,
+        window_days: Optional[int] = None,
+        updated: dlt.sources.incremental[str] = dlt.sources.incremental(
+            "fields.updated", lag=MIN_ISSUE_AGE_HOURS * 3600
+        ),
+    ) -> AsyncIterator[TDataItem]:
+        """
+        Searches issues for each JQL query, optionally split into disjoint shards.
+
+        Once a run has completed, the `updated` lower bound of every query is moved
+        to the last loaded `fields.updated` minus `MIN_ISSUE_AGE_HOURS`.
+
+        Args:
+            jql_queries: JQL queries to search.
+            project_keys: Optional project keys to shard each query by, plus a
+                shard for all other projects.
+            updated_since: Start of the range sharded into `updated` windows,
+                defaults to the cursor value.
+            window_days: Size of each `updated` window in days.
+            updated: Incremental cursor on `fields.updated`, kept in dlt state.
+        Yields:
+            AsyncIterator[TDataItem]: Pages of issues, each issue yielded once.
+        """
+        from .async_client import AsyncJiraClient, iter_parallel_async
+
+        api_path = "rest/api/3/search/jql"
+
+        shards = _search_shards(
+            jql_queries, project_keys, updated_since, window_days, updated.last_value
+        )
+
+        async with AsyncJiraClient(subdomain, email, api_token) as client:
+
+            def fetch(jql: str) -> AsyncIterator[TDataItem]:
+                params = {**search_params, "jql": jql}
+
+                return client.get_paginated_data(
+                    api_path=api_path,
+                    params=params,
+                    page_size=page_size,
+                    data_path="issues",
+                    paginator="token",
+                )
+
+            seen_ids = set()
+            producers = [lambda jql=jql: fetch(jql) for jql in shards]
+            async for page in iter_parallel_async(producers, max_workers=max_workers):
+                unique_page = [issue for issue in page if issue["id"] not in seen_ids]
+                seen_ids.update(issue["id"] for issue in unique_page)
+                if unique_page:
+                    yield unique_page
+
     return issues
 
 
+def _search_shards(
+    jql_queries: List[str],
+    project_keys: Optional[Sequence[str]],
+    updated_since: Optional[datetime],
+    window_days: Optional[int],
+    cursor_value: Optional[str],
+) -> List[str]:
+    """Moves each query to the cursor and splits it into shards."""
+    if window_days and updated_since is None and cursor_value is not None:
+        updated_since = ensure_pendulum_datetime(cursor_value)
+    return [
+        shard
+        for jql in jql_queries
+        for shard in build_jql_shards(
+            incremental_jql(jql, cursor_value),
+            project_keys=project_keys,
+            updated_since=updated_since,
+            window_days=window_days,
+        )
+    ]
+
+
+def _search_params(
+    fields: Sequence[str], custom_fields: Optional[Sequence[str]], changelog: bool
+) -> DictStrAny:
+    """
+    Builds the search parameters that project issues on the requested fields.
+
+    `updated` is always requested as it is the incremental cursor.
+
+    Args:
+        fields: Issue fields to request.
+        custom_fields: Optional custom field IDs to request in addition to `fields`.
+        changelog: Whether to expand the changelog inline with each issue.
+    Returns:
+        DictStrAny: The `fields`, `expand` and `validateQuery` search parameters.
+    """
+    requested = list(dict.fromkeys([*fields, *(custom_fields or [])]))
+    if "*all" not in requested and "updated" not in requested:
+        requested.append("updated")
+
+    params = {"fields": ",".join(requested), "validateQuery": "strict"}
+    if changelog:
+        params["expand"] = "changelog"
+    return params
+
+
+def _endpoint_primary_key(endpoint_name: str) -> Optional[str]:
+    """Returns the primary key of a `DEFAULT_ENDPOINTS` resource."""
+    if endpoint_name == "users":
+        return "accountId"
+    if endpoint_name in ["issues", "projects"]:
+        return "id"
+    return None
+
+
 def get_paginated_data(
     subdomain: str,
     email: str,
@@ -106,9 +439,16 @@ def get_paginated_data(
     api_path: str = "rest/api/3/search",
     data_path: Optional[str] = None,
     params: Optional[DictStrAny] = None,
+    paginator: str = "offset",
+    stream: bool = False,
+    cache: bool = False,
+    cache_scope: Optional[str] = None,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
 ) -> Iterable[TDataItem]:
     """
-    Function to fetch paginated data from a Jira API endpoint with improved error handling and rate limiting.
+    Function to fetch paginated data from a Jira API endpoint through the shared client.
 
     Args:
         subdomain: The subdomain for the Jira instance.
@@ -118,76 +458,194 @@ def get_paginated_data(
         api_path: The API path for the Jira endpoint.
         data_path: Optional data path to extract from the response.
         params: Optional parameters for the API request.
+        paginator: Pagination strategy of the endpoint, `offset` or `token`.
+        stream: Parse responses incrementally and yield items one by one.
+        cache: Skip pages that did not change since the previous run. Not applied
+            when streaming.
+        cache_scope: Keeps the cached pages apart per destination, see `jira`.
+        pool_size: Maximum number of pooled connections kept alive per host.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
     Yields:
-        Iterable[TDataItem]: Yields pages of data from the API.
+        Iterable[TDataItem]: Yields pages of data from the API, or single items
+            when streaming.
     """
-    import time
+    client = get_client(
+        subdomain, email, api_token, pool_size, connect_timeout, read_timeout
+    )
+    if stream:
+        yield from client.get_paginated_items(
+            page_size=page_size,
+            api_path=api_path,
+            data_path=data_path,
+            params=params,
+            paginator=paginator,
+        )
+    else:
+        yield from client.get_paginated_data(
+            page_size=page_size,
+            api_path=api_path,
+            data_path=data_path,
+            params=params,
+            paginator=paginator,
+            cache=cache,
+            cache_scope=cache_scope,
+        )
 
-    from .settings import MAX_RETRIES, RATE_LIMIT_DELAY, RETRY_DELAY
 
-    if api_path == "jql":
-        url = f"https://{subdomain}.atlassian.net/rest/api/3/search"
-    elif api_path.startswith("/"):
-        url = f"https://{subdomain}.atlassian.net{api_path}"
-    else:
-        url = f"https://{subdomain}.atlassian.net/{api_path}"
+def get_issues(
+    subdomain: str,
+    email: str,
+    api_token: str,
+    page_size: int,
+    api_path: str = "rest/api/3/search/jql",
+    data_path: Optional[str] = None,
+    params: Optional[DictStrAny] = None,
+    paginator: str = "token",
+    stream: bool = False,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
+    updated: dlt.sources.incremental[str] = dlt.sources.incremental(
+        "fields.updated", lag=MIN_ISSUE_AGE_HOURS * 3600
+    ),
+) -> Iterable[TDataItem]:
+    """
+    Fetches issues changed since the last loaded `fields.updated`.
 
-    headers = {"Accept": "application/json", "User-Agent": "dlt-jira-pipeline/1.0"}
-    auth = (email, api_token)
-    params = {} if params is None else params.copy()
+    The `updated` lower bound of the JQL in `params` is only used on the first run.
+    Later runs start at the cursor value minus `MIN_ISSUE_AGE_HOURS`.
 
-    if api_path == "jql":
-        params["startAt"] = start_at = 0
-        params["maxResults"] = page_size
-    else:
-        if "startAt" not in params:
-            params["startAt"] = start_at = 0
-        if "maxResults" not in params:
-            params["maxResults"] = page_size
-        start_at = params.get("startAt", 0)
-
-    while True:
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.get(
-                    url, auth=auth, headers=headers, params=params, timeout=30
-                )
-                response.raise_for_status()
-                result = response.json()
-                break
-            except requests.exceptions.RequestException as e:
-                if attempt == MAX_RETRIES - 1:
-                    raise e
-                time.sleep(RETRY_DELAY * (2**attempt))
-                continue
-
-        if data_path and data_path in result:
-            results_page = result[data_path]
-        elif isinstance(result, list):
-            results_page = result
-        elif isinstance(result, dict) and "values" in result:
-            results_page = result["values"]
-        else:
-            results_page = result
-
-        if not results_page or len(results_page) == 0:
-            break
-
-        yield results_page
-
-        if isinstance(result, dict):
-            if result.get("isLast", False):
-                break
-            if "nextPage" in result:
-                params["startAt"] = result["nextPage"]
-                continue
-            if not result.get("hasMore", True):
-                break
-
-        start_at += len(results_page)
-        params["startAt"] = start_at
-
-        if len(results_page) < page_size:
-            break
-
-        time.sleep(RATE_LIMIT_DELAY)
+    Args:
+        subdomain: The subdomain for the Jira instance.
+        email: The email to authenticate with.
+        api_token: The API token to authenticate with.
+        page_size: Maximum number of results per page
+        api_path: The API path for the Jira endpoint.
+        data_path: Optional data path to extract from the response.
+        params: Optional parameters for the API request.
+        paginator: Pagination strategy of the endpoint, `offset` or `token`.
+        stream: Parse responses incrementally and yield issues one by one.
+        pool_size: Maximum number of pooled connections kept alive per host.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
+        updated: Incremental cursor on `fields.updated`, kept in dlt state.
+    Yields:
+        Iterable[TDataItem]: Yields pages of issues.
+    """
+    params = dict(params or {})
+    params["jql"] = incremental_jql(params.get("jql", ""), updated.last_value)
+    yield from get_paginated_data(
+        subdomain,
+        email,
+        api_token,
+        page_size,
+        api_path,
+        data_path,
+        params,
+        paginator,
+        stream,
+        pool_size=pool_size,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+    )
+
+
+def get_changelogs(client: JiraClient, issue_ids: List[str]) -> Iterable[TDataItem]:
+    """
+    Fetches all change histories of a batch of issues from the bulk changelog endpoint.
+
+    Args:
+        client: The client to send the requests with.
+        issue_ids: IDs or keys of at most 1000 issues.
+    Yields:
+        Iterable[TDataItem]: Pages of change histories, each tagged with its `issue_id`.
+    """
+    for page in client.post_paginated_data(
+        page_size=CHANGELOG_PAGE_SIZE,
+        api_path="rest/api/3/changelog/bulkfetch",
+        data_path="issueChangeLogs",
+        body={"issueIdsOrKeys": issue_ids},
+    ):
+        histories = [
+            {**history, "issue_id": changelog["issueId"]}
+            for changelog in page
+            for history in changelog.get("changeHistories", [])
+        ]
+        if histories:
+            yield histories
+
+
+async def get_paginated_data_async(
+    subdomain: str,
+    email: str,
+    api_token: str,
+    page_size: int,
+    api_path: str = "rest/api/3/search",
+    data_path: Optional[str] = None,
+    params: Optional[DictStrAny] = None,
+    paginator: str = "offset",
+) -> AsyncIterator[TDataItem]:
+    """
+    Async variant of `get_paginated_data` that prefetches the next page.
+
+    Args:
+        subdomain: The subdomain for the Jira instance.
+        email: The email to authenticate with.
+        api_token: The API token to authenticate with.
+        page_size: Maximum number of results per page
+        api_path: The API path for the Jira endpoint.
+        data_path: Optional data path to extract from the response.
+        params: Optional parameters for the API request.
+        paginator: Pagination strategy of the endpoint, `offset` or `token`.
+    Yields:
+        AsyncIterator[TDataItem]: Yields pages of data from the API.
+    """
+    from .async_client import AsyncJiraClient
+
+    async with AsyncJiraClient(subdomain, email, api_token) as client:
+        async for page in client.get_paginated_data(
+            page_size=page_size,
+            api_path=api_path,
+            data_path=data_path,
+            params=params,
+            paginator=paginator,
+        ):
+            yield page
+
+
+async def get_issues_async(
+    subdomain: str,
+    email: str,
+    api_token: str,
+    page_size: int,
+    api_path: str = "rest/api/3/search/jql",
+    data_path: Optional[str] = None,
+    params: Optional[DictStrAny] = None,
+    paginator: str = "token",
+    updated: dlt.sources.incremental[str] = dlt.sources.incremental(
+        "fields.updated", lag=MIN_ISSUE_AGE_HOURS * 3600
+    ),
+) -> AsyncIterator[TDataItem]:
+    """
+    Async variant of `get_issues`.
+
+    Args:
+        subdomain: The subdomain for the Jira instance.
+        email: The email to authenticate with.
+        api_token: The API token to authenticate with.
+        page_size: Maximum number of results per page
+        api_path: The API path for the Jira endpoint.
+        data_path: Optional data path to extract from the response.
+        params: Optional parameters for the API request.
+        paginator: Pagination strategy of the endpoint, `offset` or `token`.
+        updated: Incremental cursor on `fields.updated`, kept in dlt state.
+    Yields:
+        AsyncIterator[TDataItem]: Yields pages of issues.
+    """
+    params = dict(params or {})
+    params["jql"] = incremental_jql(params.get("jql", ""), updated.last_value)
+    async for page in get_paginated_data_async(
+        subdomain, email, api_token, page_size, api_path, data_path, params, paginator
+    ):
+        yield page
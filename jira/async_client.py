@@ -0,0 +1,220 @@
+"""Asyncio extraction engine that keeps many Jira page requests in flight at once."""
+
+import asyncio
+import base64
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence
+
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.typing import DictStrAny, TDataItem
+
+from .client import build_url, extract_page, jira_base_url
+from .paginators import get_paginator
+from .rate_limit import (
+    RATE_LIMITED_STATUS_CODES,
+    RateLimiter,
+    backoff_delay,
+    get_rate_limiter,
+)
+from .settings import (
+    CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    MAX_RATE_LIMITED_RETRIES,
+    MAX_RETRIES,
+    READ_TIMEOUT,
+)
+
+try:
+    import aiohttp
+except ImportError:
+    raise MissingDependencyException("Jira async source", ["aiohttp"])
+
+_DONE = object()
+
+
+class AsyncJiraClient:
+    """Async Jira REST API client, used as `async with AsyncJiraClient(...) as client`."""
+
+    def __init__(
+        self,
+        subdomain: str,
+        email: str,
+        api_token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        """
+        Args:
+            subdomain: The subdomain for the Jira instance, or a full base URL.
+            email: The email to authenticate with.
+            api_token: The API token to authenticate with.
+            pool_size: Maximum number of requests in flight at the same time.
+            connect_timeout: Seconds to wait for a connection to be established.
+            read_timeout: Seconds to wait for the server to send a response.
+            rate_limiter: Limiter to use, defaults to the one shared by the process.
+        """
+        self.base_url = jira_base_url(subdomain)
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.base_url)
+        credentials = base64.b64encode(f"{email}:{api_token}".encode()).decode()
+        self.headers = {
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Authorization": f"Basic {credentials}",
+            "User-Agent": "dlt-jira-pipeline/1.0",
+        }
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(
+            sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncJiraClient":
+        self.session = aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=self.timeout,
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.session.close()
+        self.session = None
+
+    async def get_json(self, url: str, params: DictStrAny) -> TDataItem:
+        """
+        Requests one page through the shared rate limiter and decodes it.
+
+        Throttled responses (429/503) are retried once the limiter allows it, server
+        errors and connection problems are retried with exponential backoff.
+
+        Args:
+            url: The absolute URL to request.
+            params: The query parameters of the request.
+        Returns:
+            TDataItem: The decoded response body.
+        """
+        query = {
+            key: str(value).lower() if isinstance(value, bool) else value
+            for key, value in params.items()
+        }
+        attempt = 0
+        throttled = 0
+        while True:
+            await asyncio.sleep(self.rate_limiter.reserve())
+            try:
+                async with self.session.get(url, params=query) as response:
+                    self.rate_limiter.update(response.status, response.headers)
+                    if (
+                        response.status in RATE_LIMITED_STATUS_CODES
+                        and throttled < MAX_RATE_LIMITED_RETRIES
+                    ):
+                        throttled += 1
+                        continue
+                    if response.status < 500 or attempt >= MAX_RETRIES - 1:
+                        response.raise_for_status()
+                        return await response.json()
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt >= MAX_RETRIES - 1:
+                    raise
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+
+    async def get_paginated_data(
+        self,
+        page_size: int,
+        api_path: str = "rest/api/3/search",
+        data_path: Optional[str] = None,
+        params: Optional[DictStrAny] = None,
+        paginator: str = "offset",
+    ) -> AsyncIterator[TDataItem]:
+        """
+        Async variant of `JiraClient.get_paginated_data` that prefetches the next page.
+
+        The request for the next page is sent before the current page is yielded, so
+        the network round trip overlaps with the processing of the current page.
+
+        Args:
+            page_size: Maximum number of results per page
+            api_path: The API path for the Jira endpoint.
+            data_path: Optional data path to extract from the response.
+            params: Optional parameters for the API request.
+            paginator: Pagination strategy of the endpoint, `offset` or `token`.
+        Yields:
+            AsyncIterator[TDataItem]: Yields pages of data from the API.
+        """
+        url = build_url(self.base_url, api_path)
+        pages = get_paginator(paginator)
+        params = pages.initial_params(api_path, params, page_size)
+        pending = asyncio.ensure_future(self.get_json(url, params))
+
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+
+                results_page = extract_page(result, data_path)
+                if not results_page:
+                    break
+
+                params = pages.next_params(params, result, len(results_page), page_size)
+                if params is not None:
+                    pending = asyncio.ensure_future(self.get_json(url, params))
+
+                yield results_page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+async def iter_parallel_async(
+    producers: Sequence[Callable[[], AsyncIterator[TDataItem]]],
+    max_workers: int,
+    queue_size: Optional[int] = None,
+) -> AsyncIterator[TDataItem]:
+    """
+    Async counterpart of `iter_parallel`: drains up to `max_workers` producers at once.
+
+    Args:
+        producers: Callables returning async page iterators, e.g. one per JQL shard.
+        max_workers: Maximum number of producers running at the same time.
+        queue_size: Maximum number of pages buffered ahead of the consumer.
+    Yields:
+        AsyncIterator[TDataItem]: Pages from all producers, in completion order.
+    """
+    pages: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size or max_workers * 2)
+    todo: "asyncio.Queue[Callable[[], AsyncIterator[TDataItem]]]" = asyncio.Queue()
+    for producer in producers:
+        todo.put_nowait(producer)
+
+    async def worker() -> None:
+        error: Optional[BaseException] = None
+        try:
+            while not todo.empty():
+                producer = todo.get_nowait()
+                async for page in producer():
+                    await pages.put(page)
+        except Exception as e:
+            error = e
+        await pages.put((_DONE, error))
+
+    workers: List["asyncio.Task[None]"] = [
+        asyncio.ensure_future(worker())
+        for _ in range(max(1, min(max_workers, len(producers))))
+    ]
+    try:
+        running = len(workers)
+        while running:
+            item = await pages.get()
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is _DONE:
+                running -= 1
+                if item[1] is not None:
+                    raise item[1]
+                continue
+            yield item
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
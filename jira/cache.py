@@ -0,0 +1,274 @@
+"""On-disk cache of page validators used to skip unchanged pages of slowly changing endpoints."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional, Tuple
+
+from dlt.common.typing import DictStrAny, TDataItem
+
+from .settings import CACHE_DIR, CACHE_MAX_ENTRIES, CACHE_TTL_HOURS
+
+
+def cache_key(url: str, params: Optional[Mapping[str, object]]) -> str:
+    """
+    Returns the cache key of a page request.
+
+    Args:
+        url: The absolute URL of the request.
+        params: The query parameters of the request.
+    Returns:
+        str: A key that is equal for requests of the same page.
+    """
+    query = json.dumps(params or {}, sort_keys=True, default=str)
+    return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+
+def page_metadata(result: TDataItem) -> DictStrAny:
+    """
+    Keeps the top-level scalar fields of a page, which are all the paginators read.
+
+    Args:
+        result: The decoded response body.
+    Returns:
+        DictStrAny: The pagination metadata of the page.
+    """
+    if not isinstance(result, dict):
+        return {}
+    return {k: v for k, v in result.items() if not isinstance(v, (dict, list))}
+
+
+class ResponseCache:
+    """
+    Validators of the pages seen by previous runs, persisted as one JSON file.
+
+    Each entry keeps the `ETag` and `Last-Modified` headers of a page, a hash of its
+    body and what is needed to request the next page. A page is unchanged if the
+    server answers a conditional request with 304 Not Modified or if the hash of
+    its body matches. Entries older than `ttl_hours` are ignored, so every page is
+    loaded again at least once per TTL. The least recently used entries are evicted
+    beyond `max_entries`.
+
+    The entries of a page read by an extraction are only staged: they are committed
+    once the pages were loaded (see `commit_loaded_pages`), so that the pages of a
+    failed load are not skipped by the next run.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl_hours: float = CACHE_TTL_HOURS,
+    ) -> None:
+        """
+        Args:
+            path: Path of the JSON file the cache is persisted to.
+            max_entries: Maximum number of pages kept.
+            ttl_hours: Hours after which an entry is no longer trusted.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, DictStrAny]" = OrderedDict()
+        self._pending: Dict[str, DictStrAny] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self._entries.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def get(self, key: str) -> Optional[DictStrAny]:
+        """
+        Returns the entry of a page if it is still fresh.
+
+        Args:
+            key: The cache key of the page request.
+        Returns:
+            Optional[DictStrAny]: The entry, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry["stored_at"] > self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def conditional_headers(self, entry: Optional[DictStrAny]) -> Dict[str, str]:
+        """
+        Returns the headers that revalidate a cached page.
+
+        Args:
+            entry: The cached entry of the page, if any.
+        Returns:
+            Dict[str, str]: `If-None-Match`/`If-Modified-Since` headers.
+        """
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def check(
+        self,
+        key: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        metadata: DictStrAny,
+        page_length: int,
+    ) -> Tuple[bool, DictStrAny]:
+        """
+        Tells if a page changed since it was cached and builds its new entry.
+
+        Args:
+            key: The cache key of the page request.
+            headers: The response headers.
+            body: The raw response body.
+            metadata: The pagination metadata of the page.
+            page_length: The number of items in the page.
+        Returns:
+            Tuple[bool, DictStrAny]: Whether the body hash matches a fresh entry, and
+                the entry to `commit` once the page is loaded.
+        """
+        content_hash = hashlib.sha256(body).hexdigest()
+        previous = self.get(key)
+        unchanged = previous is not None and previous["hash"] == content_hash
+        entry = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "hash": content_hash,
+            "metadata": metadata,
+            "page_length": page_length,
+            # an unchanged page keeps its age so that it expires with the TTL
+            "stored_at": previous["stored_at"] if unchanged else time.time(),
+        }
+        return unchanged, entry
+
+    def commit(self, entries: Mapping[str, DictStrAny]) -> None:
+        """
+        Stores the entries of the pages of an endpoint and writes the cache to disk.
+
+        Args:
+            entries: New entries by cache key.
+        """
+        with self._lock:
+            for key, entry in entries.items():
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self.save()
+
+    def stage(self, entries: Mapping[str, DictStrAny]) -> None:
+        """
+        Keeps the entries of the pages of an endpoint until they were loaded.
+
+        Args:
+            entries: New entries by cache key.
+        """
+        with self._lock:
+            self._pending.update(entries)
+
+    def commit_pending(self) -> None:
+        """Commits the staged entries, once the pages they describe were loaded"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if pending:
+            self.commit(pending)
+
+    def discard_pending(self) -> None:
+        """Drops the staged entries, so that their pages are loaded again"""
+        with self._lock:
+            self._pending = {}
+
+    def record(self, hit: bool) -> None:
+        """
+        Counts a cache hit or miss.
+
+        Args:
+            hit: Whether the page was unchanged.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of the requested pages that were unchanged."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def save(self) -> None:
+        """Writes the cache to disk, atomically replacing the previous file."""
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(key: str, cache_dir: Optional[str] = None) -> ResponseCache:
+    """
+    Returns the process-wide response cache of a Jira instance and scope.
+
+    Args:
+        key: Identifies the Jira instance, e.g. its base URL, and the cache scope.
+        cache_dir: Directory the cache files are kept in, defaults to `CACHE_DIR`.
+    Returns:
+        ResponseCache: The shared cache.
+    """
+    name = hashlib.sha256(key.encode()).hexdigest()[:16]
+    path = os.path.join(cache_dir or CACHE_DIR, f"{name}.json")
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ResponseCache(path)
+        return _caches[path]
+
+
+def commit_loaded_pages() -> None:
+    """Commits the staged entries of all response caches, after a successful load"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.commit_pending()
+
+
+def discard_pending_pages() -> None:
+    """Drops the staged entries of all response caches, after a failed load"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.discard_pending()
+
+
+def cache_stats() -> DictStrAny:
+    """
+    Returns the hit and miss counts of all response caches of the process.
+
+    Returns:
+        DictStrAny: `hits`, `misses` and `hit_ratio`.
+    """
+    with _caches_lock:
+        hits = sum(cache.hits for cache in _caches.values())
+        misses = sum(cache.misses for cache in _caches.values())
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / total if total else 0.0,
+    }
@@ -0,0 +1,470 @@
+"""Pooled, keep-alive HTTP client shared by all Jira resources of a run."""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+
+from dlt.common.typing import DictStrAny, TDataItem
+from dlt.sources.helpers import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import ResponseCache, cache_key, get_response_cache, page_metadata
+from .paginators import get_paginator
+from .rate_limit import (
+    RATE_LIMITED_STATUS_CODES,
+    RateLimiter,
+    backoff_delay,
+    get_rate_limiter,
+)
+from .settings import (
+    CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    MAX_RATE_LIMITED_RETRIES,
+    MAX_RETRIES,
+    READ_TIMEOUT,
+)
+
+# request statistics kept per endpoint by every client
+CLIENT_STAT_NAMES = ("requests", "pages", "bytes", "retries")
+
+
+def jira_base_url(subdomain: str) -> str:
+    """
+    Builds the base URL of a Jira instance.
+
+    Args:
+        subdomain: The subdomain for the Jira instance, or a full base URL
+            (e.g. for Jira Data Center or a local test server).
+    Returns:
+        str: The base URL without a trailing slash.
+    """
+    if subdomain.startswith(("http://", "https://")):
+        return subdomain.rstrip("/")
+    return f"https://{subdomain}.atlassian.net"
+
+
+def build_url(base_url: str, api_path: str) -> str:
+    """
+    Builds the absolute URL of a Jira API path.
+
+    Args:
+        base_url: The base URL of the Jira instance.
+        api_path: The API path for the Jira endpoint.
+    Returns:
+        str: The absolute URL.
+    """
+    if api_path == "jql":
+        return f"{base_url}/rest/api/3/search"
+    if api_path.startswith("/"):
+        return f"{base_url}{api_path}"
+    return f"{base_url}/{api_path}"
+
+
+def extract_page(result: TDataItem, data_path: Optional[str] = None) -> TDataItem:
+    """
+    Extracts the page of items from a decoded Jira response.
+
+    Args:
+        result: The decoded response body.
+        data_path: Optional data path to extract from the response.
+    Returns:
+        TDataItem: The items of the page.
+    """
+    if data_path and data_path in result:
+        return result[data_path]
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict) and "values" in result:
+        return result["values"]
+    return result
+
+
+def response_size(response: requests.Response) -> int:
+    """
+    Returns the number of bytes of a response body received over the wire.
+
+    Args:
+        response: A response whose body was read, streamed or not.
+    Returns:
+        int: The compressed size of the body, or 0 if it is unknown.
+    """
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return int(response.headers.get("Content-Length", 0))
+
+
+class JiraClient:
+    """Jira REST API client that keeps warm connections across pages and resources."""
+
+    def __init__(
+        self,
+        subdomain: str,
+        email: str,
+        api_token: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        read_timeout: float = READ_TIMEOUT,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ) -> None:
+        """
+        Args:
+            subdomain: The subdomain for the Jira instance, or a full base URL
+                (e.g. for Jira Data Center or a local test server).
+            email: The email to authenticate with.
+            api_token: The API token to authenticate with.
+            pool_size: Maximum number of pooled connections kept alive per host.
+            connect_timeout: Seconds to wait for a connection to be established.
+            read_timeout: Seconds to wait for the server to send a response.
+            rate_limiter: Limiter to use, defaults to the one shared by the process.
+            response_cache: Cache of the pages fetched with `cache=True`, defaults to
+                the on-disk cache of the Jira instance.
+        """
+        self.base_url = jira_base_url(subdomain)
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.base_url)
+        self.response_cache = response_cache or get_response_cache(self.base_url)
+
+        self.session = requests.Session(
+            timeout=(connect_timeout, read_timeout), raise_for_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # requests, pages, bytes and retries per endpoint path
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+        self._stats_lock = threading.Lock()
+        self.session.auth = (email, api_token)
+        self.session.headers.update(
+            {
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "dlt-jira-pipeline/1.0",
+            }
+        )
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Sends a request through the rate limiter, retrying throttled and failed requests.
+
+        Throttled responses (429/503) are retried once the limiter allows it, server
+        errors and connection problems are retried with exponential backoff.
+
+        Args:
+            method: The HTTP method.
+            url: The absolute URL to request.
+            **kwargs: Passed to `requests.Session.request`.
+        Returns:
+            requests.Response: The successful response.
+        """
+        attempt = 0
+        throttled = 0
+        while True:
+            self.rate_limiter.acquire()
+            self.count(url, requests=1)
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException:
+                if attempt >= MAX_RETRIES - 1:
+                    raise
+                self.count(url, retries=1)
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            self.rate_limiter.update(response.status_code, response.headers)
+
+            if (
+                response.status_code in RATE_LIMITED_STATUS_CODES
+                and throttled < MAX_RATE_LIMITED_RETRIES
+            ):
+                response.close()
+                self.count(url, retries=1)
+                throttled += 1
+                continue
+            if response.status_code >= 500 and attempt < MAX_RETRIES - 1:
+                response.close()
+                self.count(url, retries=1)
+                time.sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            response.raise_for_status()
+            return response
+
+    def count(self, url: str, **counts: int) -> None:
+        """
+        Adds to the request statistics of the endpoint of a URL.
+
+        Args:
+            url: The requested URL, its query string is ignored.
+            **counts: Increments of `requests`, `pages`, `bytes` or `retries`.
+        """
+        endpoint = urlsplit(url).path
+        with self._stats_lock:
+            self._stats[endpoint].update(counts)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the request statistics of the client since it was created.
+
+        Returns:
+            Dict[str, Dict[str, int]]: `requests` sent including retries, `pages`
+                received, `bytes` received and `retries` per endpoint path.
+        """
+        with self._stats_lock:
+            return {
+                endpoint: {name: counts[name] for name in CLIENT_STAT_NAMES}
+                for endpoint, counts in self._stats.items()
+            }
+
+    def get_paginated_data(
+        self,
+        page_size: int,
+        api_path: str = "rest/api/3/search",
+        data_path: Optional[str] = None,
+        params: Optional[DictStrAny] = None,
+        paginator: str = "offset",
+        cache: bool = False,
+        cache_scope: Optional[str] = None,
+    ) -> Iterable[TDataItem]:
+        """
+        Function to fetch paginated data from a Jira API endpoint with improved error handling and rate limiting.
+
+        Args:
+            page_size: Maximum number of results per page
+            api_path: The API path for the Jira endpoint.
+            data_path: Optional data path to extract from the response.
+            params: Optional parameters for the API request.
+            paginator: Pagination strategy of the endpoint, `offset` or `token`.
+            cache: Skip pages that did not change since a previous run, see
+                `ResponseCache`. The pages read are only remembered once
+                `commit_loaded_pages` is called after loading them.
+            cache_scope: Uses the cache of this scope instead of `response_cache`,
+                e.g. one per pipeline and dataset.
+        Yields:
+            Iterable[TDataItem]: Yields pages of data from the API.
+        """
+        if cache:
+            yield from self._paginate_cached(
+                page_size, api_path, data_path, params, paginator, cache_scope
+            )
+        else:
+            yield from self._paginate(
+                "GET", page_size, api_path, data_path, params, paginator
+            )
+
+    def post_paginated_data(
+        self,
+        page_size: int,
+        api_path: str,
+        data_path: Optional[str] = None,
+        body: Optional[DictStrAny] = None,
+        paginator: str = "token",
+    ) -> Iterable[TDataItem]:
+        """
+        Fetches paginated data from a Jira endpoint that takes its query as a JSON body.
+
+        Args:
+            page_size: Maximum number of results per page
+            api_path: The API path for the Jira endpoint.
+            data_path: Optional data path to extract from the response.
+            body: The JSON body of the request, paging fields are added to it.
+            paginator: Pagination strategy of the endpoint, `offset` or `token`.
+        Yields:
+            Iterable[TDataItem]: Yields pages of data from the API.
+        """
+        yield from self._paginate(
+            "POST", page_size, api_path, data_path, body, paginator
+        )
+
+    def get_paginated_items(
+        self,
+        page_size: int,
+        api_path: str = "rest/api/3/search",
+        data_path: Optional[str] = None,
+        params: Optional[DictStrAny] = None,
+        paginator: str = "offset",
+    ) -> Iterable[TDataItem]:
+        """
+        Streaming variant of `get_paginated_data` that yields items one by one.
+
+        Each response body is parsed incrementally while it is received, so memory use
+        is bounded by the largest item instead of the largest page. Requires `ijson`.
+
+        Args:
+            page_size: Maximum number of results per page
+            api_path: The API path for the Jira endpoint.
+            data_path: Optional data path to extract from the response.
+            params: Optional parameters for the API request.
+            paginator: Pagination strategy of the endpoint, `offset` or `token`.
+        Yields:
+            Iterable[TDataItem]: Yields the items of all pages.
+        """
+        from .streaming import iter_page_items
+
+        url = build_url(self.base_url, api_path)
+        pages = get_paginator(paginator)
+        params = pages.initial_params(api_path, params, page_size)
+
+        while True:
+            metadata: DictStrAny = {}
+            page_length = 0
+            with self.request("GET", url, params=params, stream=True) as response:
+                response.raw.decode_content = True
+                for item in iter_page_items(response.raw, data_path, metadata):
+                    page_length += 1
+                    yield item
+                self.count(url, pages=1, bytes=response_size(response))
+
+            if not page_length:
+                break
+            params = pages.next_params(params, metadata, page_length, page_size)
+            if params is None:
+                break
+
+    def _paginate(
+        self,
+        method: str,
+        page_size: int,
+        api_path: str,
+        data_path: Optional[str],
+        params: Optional[DictStrAny],
+        paginator: str,
+    ) -> Iterable[TDataItem]:
+        url = build_url(self.base_url, api_path)
+        pages = get_paginator(paginator)
+        params = pages.initial_params(api_path, params, page_size)
+        payload = "params" if method == "GET" else "json"
+
+        while True:
+            response = self.request(method, url, **{payload: params})
+            self.count(url, pages=1, bytes=response_size(response))
+            result = response.json()
+
+            results_page = extract_page(result, data_path)
+            if not results_page:
+                break
+
+            next_params = pages.next_params(
+                params, result, len(results_page), page_size
+            )
+
+            yield results_page
+
+            if next_params is None:
+                break
+            params = next_params
+
+    def _paginate_cached(
+        self,
+        page_size: int,
+        api_path: str,
+        data_path: Optional[str],
+        params: Optional[DictStrAny],
+        paginator: str,
+        cache_scope: Optional[str] = None,
+    ) -> Iterable[TDataItem]:
+        url = build_url(self.base_url, api_path)
+        pages = get_paginator(paginator)
+        params = pages.initial_params(api_path, params, page_size)
+        cache = self.response_cache
+        if cache_scope:
+            cache = get_response_cache(f"{self.base_url} {cache_scope}")
+        entries: Dict[str, DictStrAny] = {}
+
+        while params is not None:
+            key = cache_key(url, params)
+            entry = cache.get(key)
+            response = self.request(
+                "GET", url, params=params, headers=cache.conditional_headers(entry)
+            )
+            self.count(url, pages=1, bytes=response_size(response))
+
+            if response.status_code == 304 and entry is not None:
+                cache.record(hit=True)
+                entries[key] = entry
+                metadata, page_length = entry["metadata"], entry["page_length"]
+            else:
+                result = response.json()
+                results_page = extract_page(result, data_path)
+                metadata, page_length = page_metadata(result), len(results_page)
+                unchanged, entries[key] = cache.check(
+                    key, response.headers, response.content, metadata, page_length
+                )
+                cache.record(hit=unchanged)
+                if results_page and not unchanged:
+                    yield results_page
+
+            if not page_length:
+                break
+            params = pages.next_params(params, metadata, page_length, page_size)
+
+        # entries are only staged once the endpoint was read to the end, and stored
+        # once loaded, so the pages of an interrupted or failed run are loaded again
+        cache.stage(entries)
+
+    def close(self) -> None:
+        """Closes the pooled connections."""
+        self.session.close()
+
+
+_clients: Dict[Tuple[Any, ...], JiraClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(
+    subdomain: str,
+    email: str,
+    api_token: str,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    read_timeout: float = READ_TIMEOUT,
+) -> JiraClient:
+    """
+    Returns the process-wide client for a Jira instance, creating it on first use.
+
+    Args:
+        subdomain: The subdomain for the Jira instance.
+        email: The email to authenticate with.
+        api_token: The API token to authenticate with.
+        pool_size: Maximum number of pooled connections kept alive per host.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
+    Returns:
+        JiraClient: The shared client, one per instance, credentials and settings.
+    """
+    key = (subdomain, email, api_token, pool_size, connect_timeout, read_timeout)
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = JiraClient(
+                subdomain,
+                email,
+                api_token,
+                pool_size=pool_size,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+            )
+        return _clients[key]
+
+
+def client_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Returns the request statistics of all shared clients of the process.
+
+    Returns:
+        Dict[str, Dict[str, int]]: `requests`, `pages`, `bytes` and `retries` per
+            endpoint path, summed over the clients.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+    totals: Dict[str, Counter] = defaultdict(Counter)
+    for client in clients:
+        for endpoint, counts in client.stats().items():
+            totals[endpoint].update(counts)
+    return {
+        endpoint: {name: counts[name] for name in CLIENT_STAT_NAMES}
+        for endpoint, counts in totals.items()
+    }
@@ -0,0 +1,333 @@
+"""Helpers for splitting Jira searches into shards, fetching them concurrently and skipping unchanged rows."""
+
+import hashlib
+import json
+import math
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import dlt
+from dlt.common.time import ensure_pendulum_datetime
+from dlt.common.typing import TDataItem
+from dlt.sources import DltResource
+
+from .settings import ROW_HASH_PRUNE_SIZE, ROW_HASH_RETENTION_HOURS
+
+JQL_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+_ORDER_BY_RE = re.compile(r"\s+ORDER\s+BY\s+", re.IGNORECASE)
+_UPDATED_LOWER_BOUND_RE = re.compile(
+    r"\bupdated\s*>=?\s*(\"[^\"]*\"|'[^']*'|[^\s()]+)", re.IGNORECASE
+)
+_DONE = object()
+
+
+def split_order_by(jql: str) -> Tuple[str, str]:
+    """
+    Splits a JQL string into its filter and its ORDER BY clause.
+
+    Args:
+        jql: The JQL string.
+    Returns:
+        Tuple[str, str]: The filter part and the ORDER BY clause ("" if absent).
+    """
+    parts = _ORDER_BY_RE.split(jql, maxsplit=1)
+    if len(parts) == 1:
+        return jql.strip(), ""
+    return parts[0].strip(), f"ORDER BY {parts[1].strip()}"
+
+
+def incremental_jql(
+    jql: str,
+    updated_since: Optional[Union[str, datetime]],
+    now: Optional[datetime] = None,
+) -> str:
+    """
+    Rewrites the `updated >=` lower bound of a JQL query to start at a cursor value.
+
+    The bound is written relative to now (`updated >= "-90m"`), so it does not depend
+    on the timezone Jira uses to interpret absolute dates. Queries without an
+    `updated` lower bound get one appended.
+
+    Args:
+        jql: The JQL query.
+        updated_since: The cursor value, e.g. the last `fields.updated` loaded. The
+            query is returned unchanged when it is None.
+        now: Current time, defaults to the current UTC time.
+    Returns:
+        str: The rewritten JQL query.
+    """
+    if updated_since is None:
+        return jql
+
+    since = ensure_pendulum_datetime(updated_since)
+    now = (
+        ensure_pendulum_datetime(now)
+        if now
+        else ensure_pendulum_datetime(datetime.now(timezone.utc))
+    )
+    minutes = max(1, math.ceil((now - since).total_seconds() / 60))
+    bound = f'updated >= "-{minutes}m"'
+
+    base, order_by = split_order_by(jql)
+    if _UPDATED_LOWER_BOUND_RE.search(base):
+        base = _UPDATED_LOWER_BOUND_RE.sub(bound, base)
+    elif base:
+        base = f"({base}) AND {bound}"
+    else:
+        base = bound
+    return f"{base} {order_by}".strip()
+
+
+def _quote_jql(value: str) -> str:
+    """Quotes a value for use as a JQL string literal."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def build_jql_shards(
+    jql: str,
+    project_keys: Optional[Sequence[str]] = None,
+    updated_since: Optional[datetime] = None,
+    window_days: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    Splits a JQL query into disjoint slices by project key and/or `updated` window.
+
+    Each project key gets its own slice and a last `project not in (...)` slice holds
+    the issues of every other project. The first time window has no lower bound and
+    the last one has no upper bound, so together the slices cover exactly the issues
+    matched by the original query no matter which timezone Jira uses to interpret
+    the boundaries.
+
+    Args:
+        jql: The JQL query to split.
+        project_keys: Optional project keys, one slice per project plus a remainder.
+        updated_since: Start of the time range split into `updated` windows.
+        window_days: Size of each `updated` window in days.
+        now: End of the time range, defaults to the current time.
+    Returns:
+        List[str]: The JQL query of each slice.
+    """
+    if window_days is not None and updated_since is None:
+        raise ValueError("window_days requires updated_since to be set")
+
+    base, order_by = split_order_by(jql)
+
+    project_clauses: List[Optional[str]] = [None]
+    if project_keys:
+        quoted = [_quote_jql(key) for key in project_keys]
+        project_clauses = [f"project = {key}" for key in quoted]
+        project_clauses.append(f"project not in ({', '.join(quoted)})")
+
+    window_clauses: List[Optional[str]] = [None]
+    if window_days and updated_since is not None:
+        end = now or datetime.now(updated_since.tzinfo)
+        step = timedelta(days=window_days)
+        boundaries = []
+        boundary = updated_since + step
+        while boundary < end:
+            boundaries.append(boundary.strftime(JQL_DATETIME_FORMAT))
+            boundary += step
+        if boundaries:
+            window_clauses = [f'updated < "{boundaries[0]}"']
+            for lower, upper in zip(boundaries, boundaries[1:]):
+                window_clauses.append(f'updated >= "{lower}" AND updated < "{upper}"')
+            window_clauses.append(f'updated >= "{boundaries[-1]}"')
+
+    shards = []
+    for project_clause in project_clauses:
+        for window_clause in window_clauses:
+            clauses = [f"({base})" if base else None, project_clause, window_clause]
+            shard = " AND ".join(clause for clause in clauses if clause)
+            shards.append(f"{shard} {order_by}".strip())
+    return shards
+
+
+def iter_parallel(
+    producers: Sequence[Callable[[], Iterable[TDataItem]]],
+    max_workers: int,
+    queue_size: Optional[int] = None,
+) -> Iterator[TDataItem]:
+    """
+    Runs page producers in a bounded thread pool and yields their pages as they arrive.
+
+    Args:
+        producers: Callables returning page iterators, e.g. one per JQL shard.
+        max_workers: Maximum number of producers running at the same time.
+        queue_size: Maximum number of pages buffered ahead of the consumer.
+    Yields:
+        Iterator[TDataItem]: Pages from all producers, in completion order.
+    """
+    if max_workers <= 1 or len(producers) <= 1:
+        for producer in producers:
+            yield from producer()
+        return
+
+    pages: "queue.Queue[object]" = queue.Queue(maxsize=queue_size or max_workers * 2)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(producer: Callable[[], Iterable[TDataItem]]) -> None:
+        error: Optional[BaseException] = None
+        try:
+            for page in producer():
+                if not put(page):
+                    return
+        except BaseException as e:
+            error = e
+        put((_DONE, error))
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(producers)),
+        thread_name_prefix="jira-shard",
+    )
+    try:
+        for producer in producers:
+            executor.submit(drain, producer)
+        pending = len(producers)
+        while pending:
+            item = pages.get()
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is _DONE:
+                pending -= 1
+                if item[1] is not None:
+                    raise item[1]
+                continue
+            yield item
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def batched(items: Iterable[TDataItem], size: int) -> Iterator[List[TDataItem]]:
+    """
+    Groups items into lists of at most `size` items.
+
+    Args:
+        items: The items to group.
+        size: Maximum number of items per list.
+    Yields:
+        Iterator[List[TDataItem]]: The lists, in the order of the items.
+    """
+    batch: List[TDataItem] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def row_hash(item: TDataItem) -> str:
+    """
+    Returns a compact content hash of a row.
+
+    Args:
+        item: The row, a JSON-serializable dict.
+    Returns:
+        str: 16 hex characters that change whenever any value of the row changes.
+    """
+    content = json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+def skip_unchanged_rows(
+    resource: DltResource,
+    primary_key: str,
+    updated_path: Optional[str] = None,
+    retention_hours: float = ROW_HASH_RETENTION_HOURS,
+) -> DltResource:
+    """
+    Drops the rows of a resource whose content did not change since the last load.
+
+    The hash of every loaded row is kept by primary key in the resource state, which
+    dlt commits together with the load, so rows of a failed load are sent again.
+    Changed rows get their hash in a `_row_hash` column.
+
+    The state is serialized with every load, so for resources that grow without
+    bound `updated_path` names the timestamp each hash is kept with: whenever the
+    hashes doubled since they were last pruned, the ones of rows updated more than
+    `retention_hours` before the newest row are dropped. Such rows are only
+    returned again by an incremental search once they changed.
+
+    Args:
+        resource: The resource to filter.
+        primary_key: The field that identifies a row.
+        updated_path: Dotted path of the last update time of a row, e.g.
+            `fields.updated`. Without it the hashes are never pruned.
+        retention_hours: Hours before the newest update whose hashes are kept.
+    Returns:
+        DltResource: The resource with the filter step added.
+    """
+
+    def changed(item: TDataItem) -> bool:
+        state = dlt.current.resource_state()
+        hashes = state.setdefault("row_hashes", {})
+        digest = row_hash(item)
+        key = str(item[primary_key])
+        stored = hashes.get(key)
+        if (stored[0] if isinstance(stored, list) else stored) == digest:
+            return False
+        item["_row_hash"] = digest
+        if updated_path is None:
+            hashes[key] = digest
+            return True
+
+        hashes[key] = [digest, _get_path(item, updated_path)]
+        if len(hashes) > state.get("row_hashes_prune_size", ROW_HASH_PRUNE_SIZE):
+            _prune_row_hashes(hashes, retention_hours)
+            state["row_hashes_prune_size"] = max(ROW_HASH_PRUNE_SIZE, 2 * len(hashes))
+        return True
+
+    return resource.add_filter(changed)
+
+
+def _get_path(item: TDataItem, path: str) -> Optional[str]:
+    """Returns the value at a dotted path of a row, None if missing"""
+    for name in path.split("."):
+        if not isinstance(item, dict):
+            return None
+        item = item.get(name)
+    return None if item is None else str(item)
+
+
+def _prune_row_hashes(hashes: Dict[str, Any], retention_hours: float) -> None:
+    """Drops the hashes of rows updated long before the newest, or at unknown times"""
+    updated = {}
+    for key, stored in hashes.items():
+        if isinstance(stored, list) and stored[1] is not None:
+            try:
+                updated[key] = ensure_pendulum_datetime(stored[1])
+            except (TypeError, ValueError):
+                pass
+    if not updated:
+        return
+    cutoff = max(updated.values()) - timedelta(hours=retention_hours)
+    for key in list(hashes):
+        if key not in updated or updated[key] < cutoff:
+            del hashes[key]
@@ -0,0 +1,141 @@
+"""Pagination strategies of the Jira REST API endpoints."""
+
+from typing import Dict, Optional
+
+from dlt.common.typing import DictStrAny, TDataItem
+
+
+class BasePaginator:
+    """Works out the query parameters of each page request of an endpoint."""
+
+    def initial_params(
+        self, api_path: str, params: Optional[DictStrAny], page_size: int
+    ) -> DictStrAny:
+        """
+        Builds the query parameters of the first page request.
+
+        Args:
+            api_path: The API path for the Jira endpoint.
+            params: Optional parameters for the API request.
+            page_size: Maximum number of results per page
+        Returns:
+            DictStrAny: A copy of the parameters with the paging parameters set.
+        """
+        raise NotImplementedError()
+
+    def next_params(
+        self,
+        params: DictStrAny,
+        result: TDataItem,
+        page_length: int,
+        page_size: int,
+    ) -> Optional[DictStrAny]:
+        """
+        Works out the query parameters of the next page request.
+
+        Args:
+            params: The parameters of the current page request.
+            result: The decoded response body of the current page.
+            page_length: The number of items in the current page.
+            page_size: Maximum number of results per page
+        Returns:
+            Optional[DictStrAny]: The parameters of the next request, or None on the last page.
+        """
+        raise NotImplementedError()
+
+
+class OffsetPaginator(BasePaginator):
+    """`startAt`/`maxResults` paging, used by most Jira endpoints."""
+
+    def initial_params(
+        self, api_path: str, params: Optional[DictStrAny], page_size: int
+    ) -> DictStrAny:
+        params = {} if params is None else params.copy()
+        if api_path == "jql":
+            params["startAt"] = 0
+            params["maxResults"] = page_size
+        else:
+            params.setdefault("startAt", 0)
+            params.setdefault("maxResults", page_size)
+        return params
+
+    def next_params(
+        self,
+        params: DictStrAny,
+        result: TDataItem,
+        page_length: int,
+        page_size: int,
+    ) -> Optional[DictStrAny]:
+        params = params.copy()
+
+        if isinstance(result, dict):
+            if result.get("isLast", False):
+                return None
+            if "nextPage" in result:
+                params["startAt"] = result["nextPage"]
+                return params
+            if not result.get("hasMore", True):
+                return None
+
+        params["startAt"] = params.get("startAt", 0) + page_length
+
+        if page_length < page_size:
+            return None
+        return params
+
+
+class TokenPaginator(BasePaginator):
+    """
+    `nextPageToken` paging of the enhanced search endpoint `/rest/api/3/search/jql`.
+
+    Each page carries the token of the next one, so deep result sets are paged in
+    constant time per page and without the duplicates or gaps of shifting offsets.
+    """
+
+    def initial_params(
+        self, api_path: str, params: Optional[DictStrAny], page_size: int
+    ) -> DictStrAny:
+        params = {} if params is None else params.copy()
+        params.pop("startAt", None)
+        params.pop("nextPageToken", None)
+        params["maxResults"] = page_size
+        return params
+
+    def next_params(
+        self,
+        params: DictStrAny,
+        result: TDataItem,
+        page_length: int,
+        page_size: int,
+    ) -> Optional[DictStrAny]:
+        if not isinstance(result, dict) or result.get("isLast", False):
+            return None
+        next_page_token = result.get("nextPageToken")
+        if not next_page_token:
+            return None
+        params = params.copy()
+        params["nextPageToken"] = next_page_token
+        return params
+
+
+PAGINATORS: Dict[str, BasePaginator] = {
+    "offset": OffsetPaginator(),
+    "token": TokenPaginator(),
+}
+
+
+def get_paginator(name: str) -> BasePaginator:
+    """
+    Returns the pagination strategy registered under a name.
+
+    Args:
+        name: The name of the strategy, `offset` or `token`.
+    Returns:
+        BasePaginator: The strategy.
+    """
+    try:
+        return PAGINATORS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown paginator '{name}', expected one of {sorted(PAGINATORS)}"
+        )
@@ -0,0 +1,232 @@
+"""Adaptive token-bucket rate limiter shared by all Jira requests of a process."""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from .settings import (
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_JITTER,
+    RATE_LIMIT_MAX_BACKOFF,
+    RATE_LIMIT_MIN_PER_SECOND,
+    RATE_LIMIT_PER_SECOND,
+    RETRY_DELAY,
+)
+
+RATE_LIMITED_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Parses a `Retry-After` header given either in seconds or as an HTTP date.
+
+    Args:
+        value: The header value.
+        now: Current unix time, defaults to `time.time()`.
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+def parse_rate_limit_reset(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Parses `X-RateLimit-Reset`, which Jira sends as an ISO 8601 timestamp.
+
+    Args:
+        value: The header value, an ISO 8601 timestamp or unix epoch seconds.
+        now: Current unix time, defaults to `time.time()`.
+    Returns:
+        Optional[float]: Seconds until the limit resets, or None if missing or invalid.
+    """
+    if not value:
+        return None
+    now = time.time() if now is None else now
+    try:
+        return max(0.0, float(value) - now)
+    except ValueError:
+        pass
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if reset_at.tzinfo is None:
+        reset_at = reset_at.replace(tzinfo=timezone.utc)
+    return max(0.0, reset_at.timestamp() - now)
+
+
+def backoff_delay(attempt: int, jitter: float = RATE_LIMIT_JITTER) -> float:
+    """
+    Returns the exponential backoff delay of a failed request, with jitter.
+
+    Args:
+        attempt: Zero-based number of the failed attempt.
+        jitter: Maximum fraction of the delay added at random.
+    Returns:
+        float: Seconds to wait before the next attempt.
+    """
+    delay = RETRY_DELAY * (2**attempt)
+    return delay * (1 + random.uniform(0, jitter))
+
+
+class RateLimiter:
+    """
+    Token bucket that adapts its rate to the rate-limit headers returned by Jira.
+
+    Every request reserves a token with `reserve()` and sleeps for the returned delay.
+    Responses are fed back with `update()`. A `Retry-After` header pauses all callers,
+    `X-RateLimit-Remaining`/`X-RateLimit-Reset` spread the remaining budget until the
+    reset, and successful responses raise the rate again step by step. A 429 or 503
+    without these headers halves the rate and pauses all callers with exponential
+    backoff, so that the tokens left in the bucket are not spent on a throttling
+    server. A budget announced by the headers replaces the configured ceiling `rate`
+    until its reset, after which the configured ceiling applies again.
+    """
+
+    def __init__(
+        self,
+        rate: float = RATE_LIMIT_PER_SECOND,
+        burst: int = RATE_LIMIT_BURST,
+        min_rate: float = RATE_LIMIT_MIN_PER_SECOND,
+        jitter: float = RATE_LIMIT_JITTER,
+    ) -> None:
+        """
+        Args:
+            rate: Maximum requests per second, outside of a window announced by
+                the headers.
+            burst: Maximum number of requests sent back to back.
+            min_rate: Lowest rate the limiter slows down to.
+            jitter: Maximum fraction of a wait added at random to spread callers.
+        """
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.jitter = jitter
+        self.rate = rate
+        self._tokens = float(burst)
+        # consecutive throttled responses without rate-limit headers
+        self._backoffs = 0
+        # rate announced by the rate-limit headers and when its window resets
+        self._window_rate: Optional[float] = None
+        self._window_end = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes one token from the bucket.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.rate = min(self.rate, self._ceiling(now))
+            if now > self._updated:
+                refill = (now - self._updated) * self.rate
+                self._tokens = min(float(self.burst), self._tokens + refill)
+                self._updated = now
+            self._tokens -= 1
+            wait = (self._updated - now) + max(0.0, -self._tokens) / self.rate
+        if wait <= 0:
+            return 0.0
+        return wait * (1 + random.uniform(0, self.jitter))
+
+    def _ceiling(self, now: float) -> float:
+        """Returns the highest rate allowed, the one of the current window if any"""
+        if self._window_rate is not None and now < self._window_end:
+            return self._window_rate
+        return self.max_rate
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent."""
+        time.sleep(self.reserve())
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stops all callers from sending requests for the given time.
+
+        Args:
+            seconds: How long to pause.
+        """
+        with self._lock:
+            self._updated = max(self._updated, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Adapts the rate to a response.
+
+        Args:
+            status_code: The HTTP status code of the response.
+            headers: The response headers.
+        """
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        reset_in = parse_rate_limit_reset(headers.get("X-RateLimit-Reset"))
+        try:
+            remaining: Optional[float] = float(headers["X-RateLimit-Remaining"])
+        except (KeyError, TypeError, ValueError):
+            remaining = None
+
+        throttled = status_code in RATE_LIMITED_STATUS_CODES
+        if retry_after is not None and (throttled or remaining == 0):
+            self.pause(retry_after)
+        elif remaining == 0 and reset_in is not None:
+            self.pause(reset_in)
+        elif throttled:
+            # nothing tells when the limit resets, back off before any retry
+            with self._lock:
+                attempt, self._backoffs = self._backoffs, self._backoffs + 1
+            self.pause(min(backoff_delay(attempt, self.jitter), RATE_LIMIT_MAX_BACKOFF))
+
+        with self._lock:
+            now = time.monotonic()
+            if not throttled:
+                self._backoffs = 0
+            if remaining is not None and reset_in:
+                # the budget only holds until the reset, it may exceed `max_rate`
+                self.rate = self._window_rate = remaining / reset_in
+                self._window_end = now + reset_in
+            elif throttled:
+                self.rate = self.rate / 2
+            else:
+                self.rate = self.rate + self.max_rate * 0.1
+            self.rate = min(self._ceiling(now), max(self.min_rate, self.rate))
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str) -> RateLimiter:
+    """
+    Returns the process-wide rate limiter for a Jira instance.
+
+    Args:
+        key: Identifies the Jira instance, e.g. its base URL.
+    Returns:
+        RateLimiter: The shared limiter.
+    """
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter()
+        return _limiters[key]
@@ -1,9 +1,26 @@
+# Issue fields read by the dbt staging models (`stg_jira_issues`)
+DEFAULT_ISSUE_FIELDS = (
+    "summary",
+    "issuetype",
+    "status",
+    "priority",
+    "assignee",
+    "reporter",
+    "project",
+    "created",
+    "updated",
+    "resolutiondate",
+    "duedate",
+    "resolution",
+)
+
 DEFAULT_ENDPOINTS = {
     "issues": {
         "data_path": "issues",
         "api_path": "rest/api/3/search/jql",
+        "paginator": "token",
         "params": {
-            "fields": "id,key,summary,issuetype,status,priority,assignee,reporter,project,created,updated,resolutiondate,duedate,resolution",
+            "fields": ",".join(("id", "key") + DEFAULT_ISSUE_FIELDS),
             "expand": "fields,changelog",
             "validateQuery": "strict",
             "jql": "updated >= -90d",
@@ -11,6 +28,7 @@ DEFAULT_ENDPOINTS = {
     },
     "users": {
         "api_path": "rest/api/3/users",
+        "paginator": "offset",
         "params": {
             "includeInactiveUsers": True,
             "fields": "accountId,displayName,emailAddress,active,timeZone",
@@ -19,6 +37,7 @@ DEFAULT_ENDPOINTS = {
     "projects": {
         "data_path": "values",
         "api_path": "rest/api/3/project/search",
+        "paginator": "offset",
         "params": {
             "status": "live,archived,deleted",
             "fields": "id,key,name,description,lead,projectTypeKey",
@@ -28,10 +47,32 @@ DEFAULT_ENDPOINTS = {
 }
 
 DEFAULT_PAGE_SIZE = 50
+DEFAULT_MAX_WORKERS = 4
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
-RATE_LIMIT_DELAY = 0.1
+MAX_RATE_LIMITED_RETRIES = 10
+RATE_LIMIT_PER_SECOND = 10.0
+RATE_LIMIT_MIN_PER_SECOND = 0.5
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_JITTER = 0.1
+RATE_LIMIT_MAX_BACKOFF = 60.0
 BATCH_SIZE = 50
+CHANGELOG_PAGE_SIZE = 1000
+
+DEFAULT_POOL_SIZE = 10
+CONNECT_TIMEOUT = 10.0
+READ_TIMEOUT = 30.0
+
+# Conditional-request cache of the slowly changing endpoints
+CACHED_ENDPOINTS = ("users", "projects")
+CACHE_DIR = ".jira_cache"
+CACHE_MAX_ENTRIES = 1000
+CACHE_TTL_HOURS = 24
 
 MIN_ISSUE_AGE_HOURS = 1
+# Row hashes of issues updated this long before the newest one are dropped from the
+# state, as the incremental search only returns them again once they change
+ROW_HASH_RETENTION_HOURS = 24
+# The row hashes are pruned whenever they doubled since, starting at this size
+ROW_HASH_PRUNE_SIZE = 10000
 MAX_ISSUES_PER_RUN = 10000
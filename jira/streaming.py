@@ -0,0 +1,61 @@
+"""Incremental parsing of Jira page responses, one item at a time."""
+
+from typing import IO, Any, Iterator, Optional
+
+from dlt.common.exceptions import MissingDependencyException
+from dlt.common.typing import DictStrAny, TDataItem
+
+try:
+    import ijson
+except ImportError:
+    raise MissingDependencyException("Jira streaming extraction", ["ijson"])
+
+# Bytes read from the body at a time, the parser buffers the events of one read
+READ_SIZE = 16 * 1024
+
+_START_EVENTS = ("start_map", "start_array")
+_END_EVENTS = ("end_map", "end_array")
+_STRUCTURE_EVENTS = _START_EVENTS + _END_EVENTS + ("map_key",)
+
+
+def iter_page_items(
+    body: IO[bytes], data_path: Optional[str], metadata: DictStrAny
+) -> Iterator[TDataItem]:
+    """
+    Parses a page response incrementally and yields its items as they are read.
+
+    Only one item is held in memory at a time. Top-level scalar fields such as
+    `isLast` or `nextPageToken` are collected into `metadata` as they are found, they
+    are complete once the generator is exhausted.
+
+    Args:
+        body: File-like object with the raw response body.
+        data_path: Optional data path of the items array, as in `extract_page`.
+        metadata: Dict that receives the top-level scalar fields of the page.
+    Yields:
+        Iterator[TDataItem]: The items of the page.
+    """
+    item_prefix: Optional[str] = None
+    builder: Any = None
+
+    for prefix, event, value in ijson.parse(body, buf_size=READ_SIZE, use_float=True):
+        if item_prefix is None:
+            # a list body is the page itself, objects carry it under a data path
+            item_prefix = "item" if event == "start_array" else None
+            if item_prefix is None:
+                item_prefix = f"{data_path or 'values'}.item"
+            continue
+
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == item_prefix and event in _END_EVENTS:
+                yield builder.value
+                builder = None
+        elif prefix == item_prefix:
+            if event in _START_EVENTS:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+        elif prefix and "." not in prefix and event not in _STRUCTURE_EVENTS:
+            metadata[prefix] = value
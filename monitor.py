@@ -1,58 +1,395 @@
 #!/usr/bin/env python3
 """
 Pipeline data monitoring script
+
+Runs the checks once and logs their results, or with `--serve` keeps running and
+exposes the pipeline state in the OpenMetrics format on `/metrics`.
 """
 
+import argparse
 import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from psycopg2.pool import ThreadedConnectionPool
 
-import psycopg2
+from indexes import INDEX_USAGE_COLUMNS, INDEX_USAGE_SQL, log_index_usage
+from watermarks import (
+    DEFAULT_STALENESS_HOURS,
+    STALENESS_HOURS,
+    WATERMARK_FIELDS,
+    WATERMARKS_SQL,
+    parse_watermark,
+    stale_resources,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# schemas whose tables are reported by the exporter
+MONITORED_SCHEMAS = ("jira_data", "jira_analytics", "jira_ops")
+
+# columns whose share of nulls is reported, (schema, table, column)
+NULL_CHECKS = (
+    ("jira_data", "issues", "fields__summary"),
+    ("jira_data", "issues", "fields__status__name"),
+    ("jira_data", "issues", "fields__project__id"),
+    ("jira_data", "users", "display_name"),
+)
+
+# Everything the exporter reports, read in two round trips. Row counts and null
+# fractions are the planner estimates kept by ANALYZE and the statistics collector,
+# freshness comes from the one row per resource the extractor keeps in
+# jira_ops.resource_watermarks and the small _dlt_loads table, so the queries never
+# scan a data table. Those two tables only exist after the first load: the catalog
+# query reports which ones exist, and only these are queried afterwards.
+SNAPSHOT_SQL = """
+    SELECT
+        'rows' AS metric,
+        n.nspname AS schema_name,
+        c.relname AS table_name,
+        c.relkind::text AS detail,
+        CASE
+            WHEN c.relkind = 'v' THEN NULL
+            -- never analyzed tables have no estimate yet (-1)
+            WHEN c.reltuples < 0 THEN COALESCE(s.n_live_tup, 0)::float8
+            ELSE c.reltuples::float8
+        END AS value
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE n.nspname IN %(schemas)s
+        AND c.relkind IN ('r', 'p', 'm', 'v')
+    UNION ALL
+    SELECT 'null_fraction', st.schemaname, st.tablename, st.attname, st.null_frac
+    FROM pg_stats st
+    WHERE (st.schemaname, st.tablename, st.attname) IN %(null_checks)s
+    UNION ALL
+    SELECT 'relation', NULL, r.name, NULL, NULL
+    FROM unnest(%(relations)s::text[]) AS r(name)
+    WHERE to_regclass(r.name) IS NOT NULL
+"""
+
+# the freshness queries, by the table they read
+FRESHNESS_SQL = {
+    "jira_ops.resource_watermarks": """
+        SELECT
+            'watermark', 'jira_ops', w.resource, NULL,
+            EXTRACT(EPOCH FROM w.high_watermark)::float8
+        FROM jira_ops.resource_watermarks w
+        UNION ALL
+        SELECT
+            'loaded_at', 'jira_ops', w.resource, NULL,
+            EXTRACT(EPOCH FROM w.loaded_at)::float8
+        FROM jira_ops.resource_watermarks w
+        UNION ALL
+        SELECT 'rows_loaded', 'jira_ops', w.resource, NULL, w.rows_loaded::float8
+        FROM jira_ops.resource_watermarks w
+    """,
+    "jira_data._dlt_loads": """
+        SELECT
+            'last_load', 'jira_data', '_dlt_loads', 'inserted_at',
+            EXTRACT(EPOCH FROM (
+                SELECT MAX(inserted_at) FROM jira_data._dlt_loads WHERE status = 0
+            ))::float8
+    """,
+}
+
+
+def build_snapshot(rows: List[Tuple[Any, ...]]) -> Dict[str, Any]:
+    """
+    Arranges the rows of `SNAPSHOT_SQL` by metric.
+
+    Args:
+        rows: The rows of the query, `metric`, `schema_name`, `table_name`, `detail`
+            and `value`.
+    Returns:
+        Dict[str, Any]: `rows` per (schema, table), `nulls` estimated per
+            (schema, table, column), `dbt_models` built in jira_analytics, the
+            `watermark`, `loaded_at` and `rows_loaded` per resource and the
+            `last_load` Unix timestamp, None when unknown.
+    """
+    snapshot: Dict[str, Any] = {
+        "rows": {},
+        "nulls": {},
+        "dbt_models": 0,
+        "resources": {},
+        "last_load": None,
+    }
+    null_fractions = []
+    for metric, schema, table, detail, value in rows:
+        if metric == "relation":
+            continue
+        if metric in ("watermark", "loaded_at", "rows_loaded"):
+            resource = snapshot["resources"].setdefault(table, {})
+            resource[metric] = None if value is None else float(value)
+        elif metric == "rows":
+            if schema == "jira_analytics" and table.startswith(("dim_", "fct_")):
+                snapshot["dbt_models"] += 1
+            if value is not None:
+                snapshot["rows"][(schema, table)] = float(value)
+        elif metric == "null_fraction":
+            null_fractions.append((schema, table, detail, float(value)))
+        elif value is not None:
+            snapshot[metric] = float(value)
+
+    for schema, table, column, fraction in null_fractions:
+        table_rows = snapshot["rows"].get((schema, table), 0.0)
+        snapshot["nulls"][(schema, table, column)] = round(fraction * table_rows)
+    return snapshot
+
+
+def _labels(**labels: str) -> str:
+    """Formats OpenMetrics labels, escaping their values"""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def render_openmetrics(
+    snapshot: Optional[Dict[str, Any]], age: float, duration: float
+) -> str:
+    """
+    Renders a snapshot in the OpenMetrics text format.
+
+    Args:
+        snapshot: The result of `build_snapshot`, None if the database was unreachable.
+        age: Seconds since the snapshot was read.
+        duration: Seconds the snapshot query took.
+    Returns:
+        str: The exposition, terminated by `# EOF`.
+    """
+    lines = [
+        "# TYPE jira_monitor_up gauge",
+        "# HELP jira_monitor_up Whether the last snapshot query succeeded.",
+        f"jira_monitor_up {int(snapshot is not None)}",
+        "# TYPE jira_monitor_snapshot_age_seconds gauge",
+        "# UNIT jira_monitor_snapshot_age_seconds seconds",
+        "# HELP jira_monitor_snapshot_age_seconds Seconds since the snapshot was read.",
+        f"jira_monitor_snapshot_age_seconds {age:.3f}",
+        "# TYPE jira_monitor_snapshot_duration_seconds gauge",
+        "# UNIT jira_monitor_snapshot_duration_seconds seconds",
+        "# HELP jira_monitor_snapshot_duration_seconds Seconds the query took.",
+        f"jira_monitor_snapshot_duration_seconds {duration:.3f}",
+    ]
+    if snapshot is not None:
+        name = "jira_data_last_load_timestamp_seconds"
+        lines += [
+            f"# TYPE {name} gauge",
+            f"# UNIT {name} seconds",
+            f"# HELP {name} Completion time of the latest successful dlt load.",
+        ]
+        if snapshot["last_load"] is not None:
+            lines.append(f"{name} {snapshot['last_load']:.3f}")
+
+        resources = sorted(snapshot["resources"].items())
+        for metric, name, unit, help_text in (
+            (
+                "watermark",
+                "jira_resource_watermark_timestamp_seconds",
+                "seconds",
+                "Latest cursor value loaded for a resource.",
+            ),
+            (
+                "loaded_at",
+                "jira_resource_loaded_timestamp_seconds",
+                "seconds",
+                "Completion time of the latest load of a resource.",
+            ),
+            (
+                "rows_loaded",
+                "jira_resource_last_load_rows",
+                None,
+                "Rows written by the latest load of a resource, not its total.",
+            ),
+        ):
+            lines.append(f"# TYPE {name} gauge")
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {help_text}")
+            for resource, values in resources:
+                if values.get(metric) is not None:
+                    labels = _labels(resource=resource)
+                    lines.append(f"{name}{labels} {values[metric]:.3f}")
+
+        name = "jira_resource_staleness_threshold_seconds"
+        lines += [
+            f"# TYPE {name} gauge",
+            f"# UNIT {name} seconds",
+            f"# HELP {name} Age of the latest load after which a resource is stale.",
+        ]
+        for resource, _ in resources:
+            hours = STALENESS_HOURS.get(resource, DEFAULT_STALENESS_HOURS)
+            lines.append(f"{name}{_labels(resource=resource)} {hours * 3600}")
+
+        lines += [
+            "# TYPE jira_table_rows_estimate gauge",
+            "# HELP jira_table_rows_estimate Planner estimate of the rows of a table.",
+        ]
+        for (schema, table), rows in sorted(snapshot["rows"].items()):
+            labels = _labels(schema=schema, table=table)
+            lines.append(f"jira_table_rows_estimate{labels} {rows:.0f}")
+
+        lines += [
+            "# TYPE jira_null_values_estimate gauge",
+            "# HELP jira_null_values_estimate Estimated rows with a null column.",
+        ]
+        for (schema, table, column), nulls in sorted(snapshot["nulls"].items()):
+            labels = _labels(schema=schema, table=table, column=column)
+            lines.append(f"jira_null_values_estimate{labels} {nulls}")
+
+        lines += [
+            "# TYPE jira_dbt_models gauge",
+            "# HELP jira_dbt_models Dimension and fact models built in jira_analytics.",
+            f"jira_dbt_models {snapshot['dbt_models']}",
+        ]
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
 
 class PipelineMonitor:
     """Monitors the data pipeline status"""
 
-    def __init__(self, db_config):
+    def __init__(self, db_config, max_connections=2, snapshot_ttl=60.0):
+        """
+        Args:
+            db_config: Keyword arguments of `psycopg2.connect`.
+            max_connections: Size of the connection pool.
+            snapshot_ttl: Seconds the snapshot served by the exporter is reused.
+        """
         self.db_config = db_config
+        self.max_connections = max_connections
+        self.snapshot_ttl = snapshot_ttl
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_read_at = float("-inf")
+        self._snapshot_duration = 0.0
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Borrows a connection of the pool, opened on first use.
+
+        Yields:
+            Any: An autocommit psycopg2 connection, returned to the pool afterwards.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadedConnectionPool(
+                    1, self.max_connections, **self.db_config
+                )
+        conn = self._pool.getconn()
+        try:
+            conn.autocommit = True
+            yield conn
+        finally:
+            # connections dropped by the server are discarded instead of reused
+            self._pool.putconn(conn, close=bool(conn.closed))
+
+    def close(self):
+        """Closes the pooled connections"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.closeall()
+                self._pool = None
+
+    def snapshot(self) -> Tuple[Optional[Dict[str, Any]], float, float]:
+        """
+        Returns the pipeline state, read again once it is older than the TTL.
+
+        Concurrent callers wait for a single query instead of each running their own,
+        and a failed query is not retried before the TTL expires either.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], float, float]: The snapshot (None if the
+                query failed), its age and the duration of its query in seconds.
+        """
+        with self._snapshot_lock:
+            if time.monotonic() - self._snapshot_read_at >= self.snapshot_ttl:
+                started = time.monotonic()
+                try:
+                    with self.connection() as conn, conn.cursor() as cursor:
+                        cursor.execute(
+                            SNAPSHOT_SQL,
+                            {
+                                "schemas": MONITORED_SCHEMAS,
+                                "null_checks": NULL_CHECKS,
+                                "relations": list(FRESHNESS_SQL),
+                            },
+                        )
+                        rows = cursor.fetchall()
+                        queries = [
+                            FRESHNESS_SQL[row[2]]
+                            for row in rows
+                            if row[0] == "relation"
+                        ]
+                        # before the first load there is no freshness to report
+                        if queries:
+                            cursor.execute(" UNION ALL ".join(queries))
+                            rows += cursor.fetchall()
+                        self._snapshot = build_snapshot(rows)
+                except Exception as e:
+                    logger.error(f"Error reading monitoring snapshot: {e}")
+                    self._snapshot = None
+                self._snapshot_read_at = time.monotonic()
+                self._snapshot_duration = self._snapshot_read_at - started
+            age = time.monotonic() - self._snapshot_read_at
+            return self._snapshot, age, self._snapshot_duration
+
+    def openmetrics(self) -> str:
+        """Returns the pipeline state in the OpenMetrics text format"""
+        return render_openmetrics(*self.snapshot())
 
     def check_data_freshness(self):
-        """Checks data freshness"""
+        """Checks data freshness from the watermarks the extractor records"""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                SELECT MAX(fields__updated) as last_update
-                FROM jira_data.issues
-            """
-            )
-
-            result = cursor.fetchone()
-            if result and result[0]:
-                last_update = result[0]
-
-                # Handle timezone-aware datetime comparison
-                if last_update.tzinfo is None:
-                    last_update = last_update.replace(tzinfo=timezone.utc)
+            with self.connection() as conn:
+                cursor = conn.cursor()
+
+                watermarks = []
+                # the table is created by the first load
+                cursor.execute(
+                    "SELECT to_regclass('jira_ops.resource_watermarks') IS NOT NULL"
+                )
+                if cursor.fetchone()[0]:
+                    cursor.execute(WATERMARKS_SQL)
+                    watermarks = [
+                        dict(zip(WATERMARK_FIELDS, row)) for row in cursor.fetchall()
+                    ]
+                if not watermarks:
+                    logger.warning("No watermarks recorded yet")
 
                 now = datetime.now(timezone.utc)
-                hours_ago = (now - last_update).total_seconds() / 3600
-
-                logger.info(f"Last issues update: {last_update}")
-                logger.info(f"Data is {hours_ago:.1f} hours old")
-
-                if hours_ago > 24:
-                    logger.warning("Data is outdated (more than 24h)")
-                else:
+                for row in watermarks:
+                    loaded_at = parse_watermark(row["loaded_at"])
+                    hours_ago = (now - loaded_at).total_seconds() / 3600
+                    logger.info(
+                        f"Resource {row['resource']}: loaded {hours_ago:.1f} hours "
+                        f"ago, {row['rows_loaded']} rows in that load, "
+                        f"watermark {row['high_watermark']}"
+                    )
+
+                stale = stale_resources(watermarks, now)
+                for resource, hours in stale.items():
+                    logger.warning(
+                        f"Resource {resource} is outdated (loaded {hours:.1f}h ago)"
+                    )
+                if watermarks and not stale:
                     logger.info("Data is up to date")
 
-            cursor.close()
-            conn.close()
+                cursor.close()
 
         except Exception as e:
             logger.error(f"Error checking data: {e}")
@@ -60,78 +397,158 @@ class PipelineMonitor:
     def check_dbt_models(self):
         """Checks if dbt models were executed"""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
-
-            cursor.execute(
+            with self.connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    """
+                    SELECT table_name 
+                    FROM information_schema.tables 
+                    WHERE table_schema = 'jira_analytics'
+                    AND (table_name LIKE 'dim_%' OR table_name LIKE 'fct_%')
                 """
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'jira_analytics'
-                AND (table_name LIKE 'dim_%' OR table_name LIKE 'fct_%')
-            """
-            )
+                )
 
-            tables = cursor.fetchall()
-            logger.info(f"dbt models found: {len(tables)}")
+                tables = cursor.fetchall()
+                logger.info(f"dbt models found: {len(tables)}")
 
-            for table in tables:
-                logger.info(f"  - {table[0]}")
+                for table in tables:
+                    logger.info(f"  - {table[0]}")
 
-            cursor.close()
-            conn.close()
+                cursor.close()
 
         except Exception as e:
             logger.error(f"Error checking dbt models: {e}")
 
     def check_data_quality(self):
-        """Checks data quality"""
+        """Checks data volume and quality from the planner estimates of the snapshot"""
+        snapshot, _, _ = self.snapshot()
+        if snapshot is None:
+            logger.error("Error checking data quality: snapshot unavailable")
+            return
+
+        for table in ("issues", "projects", "users"):
+            rows = snapshot["rows"].get(("jira_data", table))
+            if rows is None:
+                logger.warning(f"Table jira_data.{table} not found")
+            else:
+                logger.info(f"Total {table}: ~{rows:.0f}")
+
+        null_summaries = snapshot["nulls"].get(
+            ("jira_data", "issues", "fields__summary"), 0
+        )
+        if null_summaries > 0:
+            logger.warning(f"~{null_summaries} issues without summary")
+
+    def check_index_usage(self):
+        """Checks how often the indexes of the raw tables are used"""
         try:
-            conn = psycopg2.connect(**self.db_config)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
 
-            cursor.execute("SELECT COUNT(*) FROM jira_data.issues")
-            issues_count = cursor.fetchone()[0]
-            logger.info(f"Total issues: {issues_count}")
+                cursor.execute(INDEX_USAGE_SQL, ("jira_data",))
+                usage = [
+                    dict(zip(INDEX_USAGE_COLUMNS, row)) for row in cursor.fetchall()
+                ]
+                logger.info(f"Indexes on raw tables: {len(usage)}")
+                log_index_usage(usage)
 
-            cursor.execute("SELECT COUNT(*) FROM jira_data.projects")
-            projects_count = cursor.fetchone()[0]
-            logger.info(f"Total projects: {projects_count}")
-
-            cursor.execute("SELECT COUNT(*) FROM jira_data.users")
-            users_count = cursor.fetchone()[0]
-            logger.info(f"Total users: {users_count}")
-
-            cursor.execute(
-                """
-                SELECT COUNT(*) 
-                FROM jira_data.issues 
-                WHERE fields__summary IS NULL
-            """
-            )
-            null_summaries = cursor.fetchone()[0]
-            if null_summaries > 0:
-                logger.warning(f"{null_summaries} issues without summary")
-
-            cursor.close()
-            conn.close()
+                cursor.close()
 
         except Exception as e:
-            logger.error(f"Error checking data quality: {e}")
-
-
-def main():
+            logger.error(f"Error checking index usage: {e}")
+
+
+def metrics_server(
+    monitor: PipelineMonitor, host: str = "0.0.0.0", port: int = 9108
+) -> ThreadingHTTPServer:
+    """
+    Creates the HTTP server of the exporter, serving `/metrics`.
+
+    Args:
+        monitor: The monitor whose snapshot is served.
+        host: The address to listen on.
+        port: The port to listen on, 0 picks a free one.
+    Returns:
+        ThreadingHTTPServer: The server, not started yet.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = monitor.openmetrics().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return ThreadingHTTPServer((host, port), MetricsHandler)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main monitoring function"""
+    parser = argparse.ArgumentParser(description="Jira pipeline monitoring")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep running and serve the pipeline state on /metrics",
+    )
+    parser.add_argument("--host", default="0.0.0.0", help="Address of the exporter")
+    parser.add_argument("--port", type=int, default=9108, help="Port of the exporter")
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=60.0,
+        help="Seconds a snapshot is served before the database is queried again",
+    )
+    parser.add_argument(
+        "--check-freshness", action="store_true", help="Only check data freshness"
+    )
+    parser.add_argument(
+        "--check-volume", action="store_true", help="Only check data volume and nulls"
+    )
+    parser.add_argument(
+        "--generate-report",
+        action="store_true",
+        help="Run every check, the default when no check is selected",
+    )
+    args = parser.parse_args(argv)
 
     db_config = {
-        "host": "localhost",
-        "port": 5432,
-        "database": "jira_dw",
-        "user": "dlt_user",
-        "password": "dlt_password",
+        "host": os.getenv("POSTGRES_HOST", "localhost"),
+        "port": int(os.getenv("POSTGRES_PORT", "5432")),
+        "database": os.getenv("POSTGRES_DB", "jira_dw"),
+        "user": os.getenv("POSTGRES_USER", "dlt_user"),
+        "password": os.getenv("POSTGRES_PASSWORD", "dlt_password"),
     }
 
-    monitor = PipelineMonitor(db_config)
+    monitor = PipelineMonitor(db_config, snapshot_ttl=args.ttl)
+
+    if args.serve:
+        server = metrics_server(monitor, args.host, args.port)
+        logger.info(f"Serving metrics on http://{args.host}:{args.port}/metrics")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Exporter stopped")
+        finally:
+            server.server_close()
+            monitor.close()
+        return
+
+    if not args.generate_report and (args.check_freshness or args.check_volume):
+        if args.check_freshness:
+            monitor.check_data_freshness()
+        if args.check_volume:
+            monitor.check_data_quality()
+        monitor.close()
+        return
 
     logger.info("Starting pipeline monitoring...")
     logger.info("=" * 50)
@@ -141,9 +558,12 @@ def main():
     monitor.check_dbt_models()
     print()
     monitor.check_data_quality()
+    print()
+    monitor.check_index_usage()
 
     logger.info("=" * 50)
     logger.info("Monitoring completed")
+    monitor.close()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,20 @@
 import logging
 import os
-import subprocess
+import signal
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 import dlt
 
+if TYPE_CHECKING:
+    from dlt.sources import DltSource
+
+    from dbt_runner import DbtRunner
+    from run_metrics import RunMetrics
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -15,67 +22,194 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# dbt commands that build models and can be restricted to the changed sources
+SELECTIVE_DBT_COMMANDS = ("run", "build")
+# resources extract_data can extract, also the names accepted by --schedule
+DATA_TYPES = ("all", "issues", "projects", "users")
+
 
 class JiraDataPipeline:
     """Complete Jira data ingestion and transformation pipeline"""
 
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        self.extraction_results: Dict[str, bool] = {}
+        # tables that received rows in the last extraction, None before extracting
+        self.loaded_tables: Optional[Set[str]] = None
+        # watermark rows of the resources loaded by the last extraction
+        self.watermarks: List[Dict[str, Any]] = []
+        # per-model timings and row counts of the last dbt invocation
+        self.dbt_results: List[Dict[str, Any]] = []
+        self._dbt_runner: Optional["DbtRunner"] = None
+        self._pipelines: Dict[str, dlt.Pipeline] = {}
+        # measurements of the current or last run, see run_metrics.py
+        self.run_metrics: Optional["RunMetrics"] = None
+        # changelogs are loaded by the issue_changelogs transformer, and read from
+        # its tables by dbt, unless disabled
+        self.bulk_changelog: bool = config.get("bulk_changelog", True)
+        # skip the unchanged pages of users and projects, see jira/cache.py
+        self.use_cache: bool = config.get("use_cache", True)
         self.dbt_project_dir = "/app/dbt"
         self.logs_dir = Path("logs")
         self.logs_dir.mkdir(exist_ok=True)
 
     def get_dlt_pipeline(self, pipeline_name: str) -> dlt.Pipeline:
-        """Creates configured dlt pipeline"""
-        return dlt.pipeline(
-            pipeline_name=pipeline_name,
-            destination="postgres",
-            dataset_name="jira_data",
-            progress="log",
-            dev_mode=False,
-        )
+        """Creates configured dlt pipeline, reused by later runs of this instance"""
+        if pipeline_name not in self._pipelines:
+            self._pipelines[pipeline_name] = dlt.pipeline(
+                pipeline_name=pipeline_name,
+                destination="postgres",
+                dataset_name="jira_data",
+                progress="log",
+                dev_mode=False,
+            )
+        return self._pipelines[pipeline_name]
+
+    def get_metrics_pipeline(self) -> dlt.Pipeline:
+        """Creates the dlt pipeline of the jira_ops run metrics and watermarks"""
+        from run_metrics import get_metrics_pipeline
+
+        return get_metrics_pipeline()
 
     def extract_data(self, data_type: str = "all") -> bool:
         """Executes data extraction using dlt"""
         logger.info(f"Starting data extraction: {data_type}")
+        self.loaded_tables = set()
+        self.watermarks = []
 
         try:
             pipeline = self.get_dlt_pipeline(f"jira_{data_type}")
 
-            if data_type == "all":
-                return self._extract_all_data(pipeline)
+            if data_type == "all" and self.config.get("parallel_extraction"):
+                success = self._extract_all_data_parallel(pipeline)
+            elif data_type == "all":
+                success = self._extract_all_data(pipeline)
             elif data_type == "issues":
-                return self._extract_issues_only(pipeline)
+                success = self._extract_issues_only(pipeline)
             elif data_type == "projects":
-                return self._extract_projects_only(pipeline)
+                success = self._extract_projects_only(pipeline)
             elif data_type == "users":
-                return self._extract_users_only(pipeline)
+                success = self._extract_users_only(pipeline)
             else:
                 logger.error(f"Unsupported data type: {data_type}")
                 return False
 
+            if success and self.config.get("track_watermarks", True):
+                self._save_watermarks()
+            if success and self.config.get("manage_indexes", True):
+                self._maintain_indexes(pipeline)
+            return success
+
         except Exception as e:
             logger.error(f"Error in data extraction: {e}")
             return False
 
+    def _run(self, pipeline: dlt.Pipeline, data: Any) -> Any:
+        """Runs the pipeline and records the tables that received rows"""
+        from jira.cache import commit_loaded_pages, discard_pending_pages
+        from watermarks import incremental_watermarks, watermark_rows
+
+        # pages staged by an extraction that was never loaded, e.g. a standalone
+        # pipeline.run, must not be committed by this run
+        discard_pending_pages()
+        try:
+            load_info = pipeline.run(data)
+        except Exception:
+            # pages read by a failed run must not be skipped by the next one
+            discard_pending_pages()
+            raise
+        else:
+            commit_loaded_pages()
+        finally:
+            if self.run_metrics is not None and pipeline.last_trace is not None:
+                self.run_metrics.record_trace(pipeline.last_trace)
+        normalize_info = pipeline.last_trace.last_normalize_info
+        row_counts = normalize_info.row_counts if normalize_info else {}
+        load_ids = normalize_info.loads_ids if normalize_info else []
+        self.loaded_tables.update(
+            table
+            for table, count in row_counts.items()
+            if count and not table.startswith("_dlt")
+        )
+        self.watermarks += watermark_rows(
+            _resource_names(data),
+            row_counts,
+            incremental_watermarks(pipeline.state),
+            load_id=load_ids[-1] if load_ids else None,
+        )
+        return load_info
+
+    def dbt_selectors(self, dbt_command: str = "run") -> Optional[List[str]]:
+        """
+        Returns the dbt selectors of the models affected by the last extraction
+
+        None selects every model: nothing was extracted by this instance or the
+        command does not build models. An empty list means no table changed.
+        """
+        if self.loaded_tables is None or not self.config.get(
+            "selective_transform", True
+        ):
+            return None
+        if dbt_command.split()[0] not in SELECTIVE_DBT_COMMANDS:
+            return None
+        return [f"source:jira_data.{table}+" for table in sorted(self.loaded_tables)]
+
+    def _save_watermarks(self) -> None:
+        """Records the watermark and row count of each loaded resource in jira_ops"""
+        from watermarks import save_watermarks
+
+        try:
+            save_watermarks(self.get_metrics_pipeline(), self.watermarks)
+            for row in self.watermarks:
+                logger.info(
+                    f"Resource {row['resource']}: {row['rows_loaded']} rows loaded, "
+                    f"watermark {row['high_watermark']}"
+                )
+        except Exception as e:
+            # monitoring reads the watermarks, the loaded data is complete without
+            logger.warning(f"Error recording watermarks: {e}")
+
+    def _maintain_indexes(self, pipeline: dlt.Pipeline) -> None:
+        """Creates the missing indexes on the raw tables and logs index usage"""
+        from indexes import maintain_indexes
+
+        try:
+            created = maintain_indexes(pipeline)
+            if created:
+                logger.info(f"Created {len(created)} indexes on raw tables")
+        except Exception as e:
+            # a missing index slows queries down but does not invalidate the load
+            logger.warning(f"Error maintaining indexes: {e}")
+
+    def _jira_source(self, pipeline: dlt.Pipeline) -> "DltSource":
+        """Creates the jira source, caching pages per pipeline and dataset"""
+        from jira import jira
+
+        return jira(
+            use_cache=self.use_cache,
+            cache_scope=f"{pipeline.pipeline_name}/{pipeline.dataset_name}",
+        )
+
     def _extract_all_data(self, pipeline: dlt.Pipeline) -> bool:
         """Extracts all Jira data"""
-        from jira import jira, jira_search
+        from jira import jira_search
 
         try:
             logger.info("Extracting projects...")
-            projects_resource = jira().projects
-            pipeline.run([projects_resource])
+            projects_resource = self._jira_source(pipeline).projects
+            self._run(pipeline, [projects_resource])
             logger.info("Projects extracted successfully")
 
             logger.info("Extracting users...")
-            users_resource = jira().users
-            pipeline.run([users_resource])
+            users_resource = self._jira_source(pipeline).users
+            self._run(pipeline, [users_resource])
             logger.info("Users extracted successfully")
+            _log_cache_stats()
 
             logger.info("Extracting issues...")
-            issues_resource = jira_search().issues(jql_queries=['updated >= "-5d"'])
-            pipeline.run([issues_resource])
+            issues_source = jira_search(bulk_changelog=self.bulk_changelog)
+            issues_source.issues.bind(jql_queries=['updated >= "-5d"'])
+            self._run(pipeline, issues_source)
             logger.info("Issues extracted successfully")
 
             return True
@@ -84,13 +218,50 @@ class JiraDataPipeline:
             logger.error(f"Error in complete extraction: {e}")
             return False
 
+    def _extract_all_data_parallel(self, pipeline: dlt.Pipeline) -> bool:
+        """Extracts all Jira data in one run, evaluating the resources in parallel"""
+        from dlt.pipeline.exceptions import PipelineStepFailed
+
+        from jira import jira_search
+
+        source = self._jira_source(pipeline)
+        issues_source = jira_search(bulk_changelog=self.bulk_changelog)
+        issues_source.issues.bind(jql_queries=['updated >= "-5d"'])
+        resources = [
+            source.projects,
+            source.users,
+            *issues_source.selected_resources.values(),
+        ]
+        resource_names = [resource.name for resource in resources]
+
+        logger.info(f"Extracting {', '.join(resource_names)} in parallel...")
+        try:
+            self._run(pipeline, [resource.parallelize() for resource in resources])
+        except PipelineStepFailed as e:
+            failed = _failed_resource(e)
+            for name in resource_names:
+                if name == failed:
+                    logger.error(f"Resource {name} failed: {e.exception}")
+                else:
+                    logger.error(f"Resource {name} not loaded: run aborted")
+            self.extraction_results = {name: False for name in resource_names}
+            return False
+
+        row_counts = pipeline.last_trace.last_normalize_info.row_counts
+        for name in resource_names:
+            logger.info(f"Resource {name} extracted: {row_counts.get(name, 0)} rows")
+        self.extraction_results = {name: True for name in resource_names}
+        _log_cache_stats()
+        return True
+
     def _extract_issues_only(self, pipeline: dlt.Pipeline) -> bool:
         """Extracts only issues"""
         from jira import jira_search
 
         try:
-            issues_resource = jira_search().issues(jql_queries=['updated >= "-30d"'])
-            pipeline.run([issues_resource])
+            issues_source = jira_search(bulk_changelog=self.bulk_changelog)
+            issues_source.issues.bind(jql_queries=['updated >= "-30d"'])
+            self._run(pipeline, issues_source)
             logger.info("Issues extracted successfully")
             return True
         except Exception as e:
@@ -99,11 +270,9 @@ class JiraDataPipeline:
 
     def _extract_projects_only(self, pipeline: dlt.Pipeline) -> bool:
         """Extracts only projects"""
-        from jira import jira
-
         try:
-            projects_resource = jira().projects
-            pipeline.run([projects_resource])
+            projects_resource = self._jira_source(pipeline).projects
+            self._run(pipeline, [projects_resource])
             logger.info("Projects extracted successfully")
             return True
         except Exception as e:
@@ -112,64 +281,115 @@ class JiraDataPipeline:
 
     def _extract_users_only(self, pipeline: dlt.Pipeline) -> bool:
         """Extracts only users"""
-        from jira import jira
-
         try:
-            users_resource = jira().users
-            pipeline.run([users_resource])
+            users_resource = self._jira_source(pipeline).users
+            self._run(pipeline, [users_resource])
             logger.info("Users extracted successfully")
             return True
         except Exception as e:
             logger.error(f"Error in users extraction: {e}")
             return False
 
-    def transform_data(self, dbt_command: str = "run") -> bool:
-        """Executes transformations using dbt"""
+    def transform_data(
+        self, dbt_command: str = "run", select: Optional[List[str]] = None
+    ) -> bool:
+        """Executes transformations using dbt, optionally only the selected models"""
         logger.info(f"Starting data transformation: dbt {dbt_command}")
 
         try:
-            if os.path.exists("/app/dbt"):
-                dbt_dir = Path("/app/dbt")
-            else:
-                dbt_dir = Path("/home/alfprado/dev/Flexiana/dlt_jira/dbt")
-
-            if not dbt_dir.exists():
-                logger.error(f"dbt directory not found: {dbt_dir.absolute()}")
+            runner = self.get_dbt_runner()
+            if runner is None:
                 return False
 
-            env = os.environ.copy()
-            env["DBT_LOG_PATH"] = "/tmp/dbt_logs"
-
-            original_cwd = os.getcwd()
-            os.chdir(dbt_dir)
-
-            try:
-                cmd = f"dbt {dbt_command} --log-level info"
-                logger.info(f"Executing: {cmd} in {dbt_dir}")
-
-                result_code = os.system(cmd)
-
-                if result_code == 0:
-                    logger.info(f"dbt {dbt_command} executed successfully")
-                    return True
-                else:
-                    logger.error(f"dbt {dbt_command} failed with code {result_code}")
-                    return False
-
-            finally:
-                os.chdir(original_cwd)
-
-        except subprocess.TimeoutExpired:
-            logger.error("dbt timeout - process took more than 30 minutes")
+            if select:
+                logger.info(f"Selected models: {' '.join(select)}")
+            result = runner.invoke(dbt_command, select)
+            self.dbt_results = result.models
+            if self.run_metrics is not None:
+                self.run_metrics.record_dbt(dbt_command, result)
+
+            for model in result.models:
+                rows = model["rows_affected"]
+                logger.info(
+                    f"dbt {model['model']}: {model['status']} in "
+                    f"{model['execution_time']:.2f}s"
+                    # views and tests report no rows (None or -1)
+                    + (f", {rows} rows" if rows is not None and rows >= 0 else "")
+                )
+
+            if result.success:
+                logger.info(
+                    f"dbt {dbt_command} executed successfully in {result.elapsed:.1f}s"
+                )
+                return True
+            logger.error(f"dbt {dbt_command} failed: {result.error}")
             return False
+
         except Exception as e:
             logger.error(f"Error executing dbt: {e}")
             return False
 
+    def get_dbt_runner(self) -> Optional["DbtRunner"]:
+        """Returns the in-process dbt runner, kept to reuse the parsed project"""
+        from dbt_runner import DEFAULT_TIMEOUT_SECONDS, DbtRunner
+
+        if self._dbt_runner is None:
+            if os.path.exists(self.dbt_project_dir):
+                dbt_dir = Path(self.dbt_project_dir)
+            else:
+                dbt_dir = Path(__file__).resolve().parent / "dbt"
+
+            if not dbt_dir.exists():
+                logger.error(f"dbt directory not found: {dbt_dir.absolute()}")
+                return None
+
+            self._dbt_runner = DbtRunner(
+                project_dir=str(dbt_dir),
+                threads=self.config.get("dbt_threads"),
+                timeout=self.config.get("dbt_timeout", DEFAULT_TIMEOUT_SECONDS),
+                log_path="/tmp/dbt_logs",
+                # the changelog is read from the tables the extraction loads
+                variables={"bulk_changelog": self.bulk_changelog},
+            )
+        return self._dbt_runner
+
+    def _measured(self, mode: str, run: Callable[[], bool]) -> bool:
+        """Executes a run, recording its timings and volumes in jira_ops.run_metrics"""
+        if not self.config.get("record_metrics", True):
+            return run()
+
+        from run_metrics import RunMetrics
+
+        self.run_metrics = RunMetrics(mode)
+        success = False
+        try:
+            success = run()
+            return success
+        finally:
+            self.run_metrics.finish(success)
+            durations = self.run_metrics.stage_seconds()
+            logger.info(
+                "Stage durations: "
+                + ", ".join(
+                    f"{stage} {seconds:.1f}s" for stage, seconds in durations.items()
+                )
+            )
+            try:
+                self.run_metrics.save(self.get_metrics_pipeline())
+            except Exception as e:
+                # the metrics describe the run, losing them must not fail it
+                logger.warning(f"Error recording run metrics: {e}")
+
     def run_full_pipeline(
         self, data_type: str = "all", dbt_command: str = "run"
     ) -> bool:
         """Executes complete pipeline: extraction + transformation"""
+        return self._measured(
+            "full", lambda: self._run_full_pipeline(data_type, dbt_command)
+        )
+
+    def _run_full_pipeline(self, data_type: str, dbt_command: str) -> bool:
+        """Extracts the data, then transforms the models it affects"""
         logger.info("Starting complete Jira data pipeline")
         logger.info("=" * 60)
 
@@ -183,7 +403,10 @@ class JiraDataPipeline:
 
         logger.info("\nSTEP 2: DATA TRANSFORMATION")
         logger.info("-" * 40)
-        if not self.transform_data(dbt_command):
+        select = self.dbt_selectors(dbt_command)
+        if select == []:
+            logger.info("No new data loaded, skipping transformation")
+        elif not self.transform_data(dbt_command, select):
             logger.error("Data transformation failed.")
             return False
 
@@ -202,12 +425,103 @@ class JiraDataPipeline:
     def run_dbt_only(self, dbt_command: str = "run") -> bool:
         """Executes only dbt transformations (without extraction)"""
         logger.info(f"Executing only dbt {dbt_command}")
-        return self.transform_data(dbt_command)
+        return self._measured("transform", lambda: self.transform_data(dbt_command))
 
     def run_extraction_only(self, data_type: str = "all") -> bool:
         """Executes only data extraction (without transformation)"""
         logger.info(f"Executing only extraction: {data_type}")
-        return self.extract_data(data_type)
+        return self._measured("extract", lambda: self.extract_data(data_type))
+
+    def run_daemon(
+        self,
+        schedules: Optional[Dict[str, str]] = None,
+        dbt_command: str = "run",
+        stop: Optional[threading.Event] = None,
+    ) -> bool:
+        """
+        Keeps running the pipeline of each resource on its own schedule
+
+        Every scheduled run extracts one resource and transforms the models it
+        changed, in this process: imports, HTTP connections, dlt pipelines and the
+        parsed dbt project are reused by all runs, and runs never overlap. SIGTERM
+        and SIGINT stop the daemon once the current run finished, a second signal
+        stops it right away.
+        """
+        from scheduler import DEFAULT_SCHEDULES, Scheduler, parse_schedule
+
+        schedules = schedules or self.config.get("schedules") or DEFAULT_SCHEDULES
+        unknown = sorted(set(schedules) - set(DATA_TYPES))
+        if unknown:
+            logger.error(f"Unsupported scheduled data types: {', '.join(unknown)}")
+            return False
+        stop = stop or threading.Event()
+        scheduler = Scheduler()
+        for data_type, spec in schedules.items():
+            scheduler.add(
+                data_type,
+                parse_schedule(spec),
+                lambda data_type=data_type: self.run_full_pipeline(
+                    data_type, dbt_command
+                ),
+            )
+
+        def handle_signal(signum: int, frame: Any) -> None:
+            if stop.is_set():
+                raise SystemExit(128 + signum)
+            logger.info(
+                f"Received {signal.Signals(signum).name}, "
+                "stopping after the current run"
+            )
+            stop.set()
+
+        handled = (signal.SIGTERM, signal.SIGINT)
+        previous = {}
+        # signal handlers can only be installed by the main thread
+        if threading.current_thread() is threading.main_thread():
+            previous = {sig: signal.signal(sig, handle_signal) for sig in handled}
+
+        logger.info("Pipeline daemon started")
+        try:
+            scheduler.run_forever(stop)
+        finally:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+        for job in scheduler.jobs:
+            logger.info(f"{job.name}: {job.runs} runs, {job.failures} failed")
+        logger.info("Pipeline daemon stopped")
+        return True
+
+
+def _log_cache_stats() -> None:
+    """Logs how many pages of the cached endpoints were unchanged"""
+    from jira.cache import cache_stats
+
+    stats = cache_stats()
+    logger.info(
+        f"Response cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"({stats['hit_ratio']:.0%} unchanged pages skipped)"
+    )
+
+
+def _resource_names(data: Any) -> List[str]:
+    """Returns the names of the resources a source or list of resources runs"""
+    from dlt.extract import DltSource
+
+    if isinstance(data, DltSource):
+        return list(data.selected_resources)
+    return [resource.name for resource in data]
+
+
+def _failed_resource(error: BaseException) -> Optional[str]:
+    """Returns the name of the resource that raised an error, if known"""
+    from dlt.extract.exceptions import PipeException
+
+    while error is not None:
+        if isinstance(error, PipeException):
+            return error.pipe_name
+        error = getattr(error, "exception", None) or error.__cause__
+    return None
 
 
 def main():
@@ -217,13 +531,13 @@ def main():
     parser = argparse.ArgumentParser(description="Jira data pipeline with dbt")
     parser.add_argument(
         "--mode",
-        choices=["full", "extract", "transform"],
+        choices=["full", "extract", "transform", "daemon"],
         default="full",
         help="Execution mode",
     )
     parser.add_argument(
         "--data-type",
-        choices=["all", "issues", "projects", "users"],
+        choices=DATA_TYPES,
         default="all",
         help="Data type to extract",
     )
@@ -232,14 +546,51 @@ def main():
         default="run",
         help="dbt command to execute (run, test, docs, etc.)",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Extract all resources in a single run with parallel evaluation",
+    )
+    parser.add_argument(
+        "--dbt-threads",
+        type=int,
+        default=None,
+        help="Number of threads dbt builds models with (defaults to the profile)",
+    )
+    parser.add_argument(
+        "--schedule",
+        action="append",
+        default=[],
+        metavar="RESOURCE=SCHEDULE",
+        help="Daemon schedule of a resource, an interval (5m, 1h, 1d) or a cron "
+        "expression; repeat for each resource (defaults to issues=5m, users=1h, "
+        "projects=1d)",
+    )
+    parser.add_argument(
+        "--dbt-timeout",
+        type=float,
+        default=30 * 60,
+        help="Seconds after which a dbt invocation is abandoned",
+    )
 
     args = parser.parse_args()
 
+    from scheduler import parse_schedules
+
+    try:
+        schedules = parse_schedules(";".join(args.schedule), DATA_TYPES)
+    except ValueError as e:
+        parser.error(str(e))
+
     # Pipeline configuration
     config = {
         "pipeline_name": "jira_analytics",
         "destination": "postgres",
         "dataset_name": "jira_data",
+        "parallel_extraction": args.parallel,
+        "dbt_threads": args.dbt_threads,
+        "dbt_timeout": args.dbt_timeout,
+        "schedules": schedules,
     }
 
     # Create and execute pipeline
@@ -252,6 +603,8 @@ def main():
             success = pipeline.run_extraction_only(args.data_type)
         elif args.mode == "transform":
             success = pipeline.run_dbt_only(args.dbt_command)
+        elif args.mode == "daemon":
+            success = pipeline.run_daemon(dbt_command=args.dbt_command)
 
         if success:
             logger.info("Pipeline executed successfully!")
@@ -0,0 +1,223 @@
+"""
+Per-run timings and volumes of the pipeline, persisted to jira_ops.run_metrics
+"""
+
+import logging
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import dlt
+
+logger = logging.getLogger(__name__)
+
+METRICS_DATASET = "jira_ops"
+METRICS_TABLE = "run_metrics"
+
+# dlt steps whose durations are recorded
+TRACE_STEPS = ("extract", "normalize", "load")
+
+# one row per measurement, so that new stages and metrics need no migration
+RUN_METRICS_COLUMNS = {
+    "run_id": {"data_type": "text", "nullable": False},
+    "run_started_at": {"data_type": "timestamp", "nullable": False},
+    "mode": {"data_type": "text"},
+    "stage": {"data_type": "text", "nullable": False},
+    "name": {"data_type": "text", "nullable": False},
+    "metric": {"data_type": "text", "nullable": False},
+    "value": {"data_type": "double"},
+}
+
+
+class RunMetrics:
+    """
+    Collects the measurements of one pipeline run.
+
+    Every measurement is a row of `stage`, `name`, `metric` and `value`:
+
+    - `extract`, `normalize` and `load` steps: `duration_seconds` per `pipeline.run`,
+      named after the resources it ran
+    - `extract` per resource: `resource_seconds` until its last item was written,
+      `items` and `bytes`
+    - `normalize` per table: `rows`
+    - `http` per endpoint path: `requests`, `pages`, `bytes` and `retries`
+    - `dbt` per model: `duration_seconds` and `rows`, and the `wall_seconds` of the
+      invocation
+    - `pipeline`: `wall_seconds` and `success` of the whole run
+    """
+
+    def __init__(self, mode: str) -> None:
+        """
+        Args:
+            mode: What the run executes, e.g. `full`, `extract` or `transform`.
+        """
+        from jira.client import client_stats
+
+        self.run_id = uuid.uuid4().hex
+        self.mode = mode
+        self.started_at = datetime.now(timezone.utc)
+        self.rows: List[Dict[str, Any]] = []
+        self._started = time.monotonic()
+        # the shared clients outlive the run, only their increase is recorded
+        self._http_baseline = client_stats()
+
+    def record(self, stage: str, name: str, metric: str, value: Any) -> None:
+        """
+        Records one measurement, ignoring unknown values.
+
+        Args:
+            stage: The stage measured, e.g. `extract` or `dbt`.
+            name: What was measured within the stage, e.g. a resource or a model.
+            metric: The measurement, e.g. `duration_seconds` or `rows`.
+            value: The measured value.
+        """
+        if value is None:
+            return
+        self.rows.append(
+            {
+                "run_id": self.run_id,
+                "run_started_at": self.started_at,
+                "mode": self.mode,
+                "stage": stage,
+                "name": name,
+                "metric": metric,
+                "value": float(value),
+            }
+        )
+
+    def record_trace(self, trace: Any) -> None:
+        """
+        Records the step durations, extracted resources and normalized rows of a
+        `pipeline.run`.
+
+        Args:
+            trace: The `PipelineTrace` of the run, e.g. `pipeline.last_trace`.
+        """
+        resources: List[str] = []
+        extract_info = trace.last_extract_info
+        for metrics in (extract_info.metrics if extract_info else {}).values():
+            for step in metrics:
+                started_at = step["started_at"].timestamp()
+                for name, writer in step["resource_metrics"].items():
+                    if name.startswith("_dlt"):
+                        continue
+                    resources.append(name)
+                    self.record(
+                        "extract",
+                        name,
+                        "resource_seconds",
+                        writer.last_modified - started_at,
+                    )
+                    self.record("extract", name, "items", writer.items_count)
+                    self.record("extract", name, "bytes", writer.file_size)
+
+        scope = ",".join(sorted(set(resources))) or trace.pipeline_name
+        for step in trace.steps:
+            if step.step in TRACE_STEPS and step.finished_at:
+                duration = (step.finished_at - step.started_at).total_seconds()
+                self.record(step.step, scope, "duration_seconds", duration)
+
+        normalize_info = trace.last_normalize_info
+        for table, count in (
+            normalize_info.row_counts if normalize_info else {}
+        ).items():
+            if not table.startswith("_dlt"):
+                self.record("normalize", table, "rows", count)
+
+    def record_http(self) -> None:
+        """Records the requests the shared Jira clients sent since the run started"""
+        from jira.client import client_stats
+
+        for endpoint, counts in client_stats().items():
+            baseline = self._http_baseline.get(endpoint, {})
+            if counts["requests"] == baseline.get("requests", 0):
+                continue
+            for metric, value in counts.items():
+                self.record("http", endpoint, metric, value - baseline.get(metric, 0))
+
+    def record_dbt(self, command: str, result: Any) -> None:
+        """
+        Records the per-model timings and row counts of a dbt invocation.
+
+        Args:
+            command: The dbt command that was invoked.
+            result: The `DbtRunResult` of the invocation.
+        """
+        for model in result.models:
+            self.record(
+                "dbt", model["model"], "duration_seconds", model["execution_time"]
+            )
+            rows = model["rows_affected"]
+            # views and tests report no rows (None or -1)
+            if rows is not None and rows >= 0:
+                self.record("dbt", model["model"], "rows", rows)
+        self.record("dbt", f"dbt {command}", "wall_seconds", result.elapsed)
+
+    def finish(self, success: bool) -> None:
+        """
+        Records the HTTP statistics, the duration and the outcome of the run.
+
+        Args:
+            success: Whether the run succeeded.
+        """
+        self.record_http()
+        self.record(
+            "pipeline", self.mode, "wall_seconds", time.monotonic() - self._started
+        )
+        self.record("pipeline", self.mode, "success", int(success))
+
+    def stage_seconds(self) -> Dict[str, float]:
+        """
+        Returns the time spent in each stage of the run.
+
+        Returns:
+            Dict[str, float]: Seconds spent in `extract`, `normalize`, `load` and `dbt`.
+        """
+        totals: Dict[str, float] = {}
+        for row in self.rows:
+            if row["metric"] == "duration_seconds" and row["stage"] in TRACE_STEPS:
+                totals[row["stage"]] = totals.get(row["stage"], 0.0) + row["value"]
+            elif row["stage"] == "dbt" and row["metric"] == "wall_seconds":
+                totals["dbt"] = totals.get("dbt", 0.0) + row["value"]
+        return totals
+
+    def save(self, pipeline: dlt.Pipeline) -> Any:
+        """
+        Appends the measurements to the `run_metrics` table.
+
+        Args:
+            pipeline: The pipeline to load with, see `get_metrics_pipeline`.
+        Returns:
+            Any: The `LoadInfo` of the load.
+        """
+        resource = dlt.resource(
+            self.rows,
+            name=METRICS_TABLE,
+            write_disposition="append",
+            columns=RUN_METRICS_COLUMNS,
+        )
+        load_info = pipeline.run(resource)
+        logger.info(f"Recorded {len(self.rows)} run metrics of run {self.run_id}")
+        return load_info
+
+
+def get_metrics_pipeline(
+    destination: Any = "postgres", pipelines_dir: Optional[str] = None
+) -> dlt.Pipeline:
+    """
+    Creates the pipeline that loads the run metrics into the `jira_ops` dataset.
+
+    Args:
+        destination: The destination, defaults to the Postgres of the raw data.
+        pipelines_dir: Working directory of the pipeline, defaults to dlt's.
+    Returns:
+        dlt.Pipeline: The metrics pipeline.
+    """
+    return dlt.pipeline(
+        pipeline_name="jira_run_metrics",
+        destination=destination,
+        dataset_name=METRICS_DATASET,
+        pipelines_dir=pipelines_dir,
+        dev_mode=False,
+    )
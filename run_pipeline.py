@@ -3,6 +3,7 @@
 Simplified script to execute the Jira data pipeline
 """
 
+import os
 import sys
 
 from orchestrator import JiraDataPipeline
@@ -35,9 +36,16 @@ def main():
         elif command == "docs":
             print("Generating dbt documentation...")
             success = pipeline.run_dbt_only("docs generate")
+        elif command == "daemon":
+            from scheduler import parse_schedules
+
+            # e.g. PIPELINE_SCHEDULES="issues=5m;users=1h;projects=0 3 * * *"
+            schedules = parse_schedules(os.getenv("PIPELINE_SCHEDULES", ""))
+            print("Starting pipeline daemon...")
+            success = pipeline.run_daemon(schedules)
         else:
             print(f"Unrecognized command: {command}")
-            print("Available commands: extract, transform, test, docs")
+            print("Available commands: extract, transform, test, docs, daemon")
             sys.exit(1)
     else:
         print("Executing complete pipeline...")
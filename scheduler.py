@@ -0,0 +1,235 @@
+"""
+In-process scheduling of pipeline runs for the daemon mode
+"""
+
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# how often each resource is extracted by default, transforming what it changed
+DEFAULT_SCHEDULES = {
+    "issues": "5m",
+    "users": "1h",
+    "projects": "1d",
+}
+
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# bounds the sleep between checks, so that a changed system clock is noticed
+MAX_SLEEP_SECONDS = 60.0
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class Schedule:
+    """When a job runs"""
+
+    def first_run(self, now: datetime) -> datetime:
+        """Returns when the job runs first, given the time it is scheduled at"""
+        raise NotImplementedError
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Returns when the job runs next, given the start of its last run"""
+        raise NotImplementedError
+
+
+class IntervalSchedule(Schedule):
+    """Runs a job every `seconds`, starting right away"""
+
+    def __init__(self, seconds: float) -> None:
+        if seconds <= 0:
+            raise ValueError(f"Interval must be positive: {seconds}")
+        self.seconds = seconds
+
+    def first_run(self, now: datetime) -> datetime:
+        return now
+
+    def next_after(self, moment: datetime) -> datetime:
+        return moment + timedelta(seconds=self.seconds)
+
+    def __repr__(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+class CronSchedule(Schedule):
+    """Runs a job at the times of a cron expression, evaluated in UTC"""
+
+    def __init__(self, expression: str) -> None:
+        from croniter import croniter
+
+        if not croniter.is_valid(expression):
+            raise ValueError(f"Invalid schedule: {expression!r}")
+        self.expression = expression
+
+    def first_run(self, now: datetime) -> datetime:
+        return self.next_after(now)
+
+    def next_after(self, moment: datetime) -> datetime:
+        from croniter import croniter
+
+        return croniter(self.expression, moment).get_next(datetime)
+
+    def __repr__(self) -> str:
+        return f"cron {self.expression!r}"
+
+
+def parse_schedule(spec: str) -> Schedule:
+    """
+    Parses an interval such as `30s`, `5m`, `1h` or `1d`, or a cron expression.
+
+    Args:
+        spec: The interval or the cron expression, e.g. `0 3 * * *`.
+    Returns:
+        Schedule: The parsed schedule.
+    """
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([smhd])", spec.strip())
+    if match:
+        return IntervalSchedule(float(match[1]) * INTERVAL_UNITS[match[2]])
+    return CronSchedule(spec.strip())
+
+
+def parse_schedules(
+    text: str, resources: Optional[Sequence[str]] = None
+) -> Dict[str, str]:
+    """
+    Parses per-resource schedules such as `issues=5m;projects=0 3 * * *`.
+
+    Entries are separated by `;`, as cron expressions contain commas.
+
+    Args:
+        text: The schedules.
+        resources: The resource names accepted, any name if not given.
+    Returns:
+        Dict[str, str]: The schedule of each resource.
+    """
+    schedules = {}
+    for entry in filter(None, (part.strip() for part in text.split(";"))):
+        resource, sep, spec = entry.partition("=")
+        if not sep or not spec.strip():
+            raise ValueError(f"Expected RESOURCE=SCHEDULE, got {entry!r}")
+        resource = resource.strip()
+        if resources is not None and resource not in resources:
+            raise ValueError(
+                f"Unknown resource {resource!r}, expected one of {', '.join(resources)}"
+            )
+        schedules[resource] = spec.strip()
+    return schedules
+
+
+class Job:
+    """A scheduled run and its bookkeeping"""
+
+    def __init__(
+        self, name: str, schedule: Schedule, run: Callable[[], bool], now: datetime
+    ) -> None:
+        self.name = name
+        self.schedule = schedule
+        self.run = run
+        self.next_run = schedule.first_run(now)
+        self.runs = 0
+        self.failures = 0
+
+
+class Scheduler:
+    """
+    Runs jobs on their schedules, one at a time, in the calling thread.
+
+    A job that is due while another one runs starts once it finished, the job that
+    has waited longest first. Runs missed meanwhile are coalesced into one, since
+    every run picks up all changes since the previous one.
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = _utcnow) -> None:
+        """
+        Args:
+            clock: Returns the current time, aware and in UTC.
+        """
+        self.clock = clock
+        self.jobs: List[Job] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, schedule: Schedule, run: Callable[[], bool]) -> Job:
+        """
+        Adds a job.
+
+        Args:
+            name: Name of the job in the logs.
+            schedule: When the job runs.
+            run: Runs the job, returning whether it succeeded.
+        Returns:
+            Job: The added job.
+        """
+        job = Job(name, schedule, run, self.clock())
+        self.jobs.append(job)
+        logger.info(f"Scheduled {name} {schedule}, first run at {job.next_run}")
+        return job
+
+    def seconds_until_next_run(self) -> float:
+        """Returns the seconds until the next job is due, 0 if one is overdue"""
+        if not self.jobs:
+            return MAX_SLEEP_SECONDS
+        next_run = min(job.next_run for job in self.jobs)
+        return max((next_run - self.clock()).total_seconds(), 0.0)
+
+    def run_pending(self, stop: Optional[threading.Event] = None) -> List[str]:
+        """
+        Runs the jobs that are due, never two at the same time.
+
+        Args:
+            stop: Stops running further jobs once set.
+        Returns:
+            List[str]: Names of the jobs that ran, empty if others were running.
+        """
+        if not self._lock.acquire(blocking=False):
+            logger.warning("Previous run still in progress, skipping")
+            return []
+        try:
+            ran = []
+            while not (stop and stop.is_set()):
+                now = self.clock()
+                due = [job for job in self.jobs if job.next_run <= now]
+                if not due:
+                    break
+                job = min(due, key=lambda job: job.next_run)
+                self._run_job(job, now)
+                ran.append(job.name)
+            return ran
+        finally:
+            self._lock.release()
+
+    def _run_job(self, job: Job, started_at: datetime) -> None:
+        logger.info(f"Starting scheduled run of {job.name}")
+        started = time.monotonic()
+        try:
+            success = job.run()
+        except Exception as e:
+            logger.error(f"Scheduled run of {job.name} raised: {e}")
+            success = False
+        job.runs += 1
+        if not success:
+            job.failures += 1
+
+        # an overdue next run is due right away, once
+        job.next_run = job.schedule.next_after(started_at)
+        logger.info(
+            f"Scheduled run of {job.name} {'succeeded' if success else 'failed'} in "
+            f"{time.monotonic() - started:.1f}s, next run at {job.next_run}"
+        )
+
+    def run_forever(self, stop: threading.Event) -> None:
+        """
+        Runs the jobs on their schedules until `stop` is set.
+
+        Args:
+            stop: Ends the loop once the running job finished.
+        """
+        while not stop.is_set():
+            self.run_pending(stop)
+            stop.wait(min(self.seconds_until_next_run(), MAX_SLEEP_SECONDS))
@@ -33,3 +33,15 @@ def mock_sys_exit():
     """Fixture para mock do sys.exit"""
     with patch("sys.exit") as mock_exit:
         yield mock_exit
+
+
+@pytest.fixture
+def fake_jira(tmp_path, monkeypatch):
+    """Fixture que inicia um servidor Jira falso local"""
+    from tests.fake_jira import FakeJiraServer
+
+    # o cache de respostas de cada teste fica em um diretório temporário
+    monkeypatch.setattr("jira.cache.CACHE_DIR", str(tmp_path / "jira_cache"))
+    server = FakeJiraServer().start()
+    yield server
+    server.stop()
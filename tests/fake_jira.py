@@ -0,0 +1,243 @@
+"""
+Servidor HTTP local que simula a API do Jira para testes de extração
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PROJECT_RE = re.compile(r'project\s*=\s*"?([A-Z0-9]+)"?')
+
+STATUSES = [("To Do", "To Do"), ("In Progress", "In Progress"), ("Done", "Done")]
+PRIORITIES = ["Highest", "High", "Medium", "Low", "Lowest"]
+ISSUE_TYPES = ["Bug", "Task", "Story", "Epic"]
+
+
+class FakeJiraServer:
+    """
+    Simula os endpoints `search/jql`, `changelog/bulkfetch`, `users` e `project/search`
+
+    O conjunto de dados é sintético e determinístico para um mesmo `seed`. O servidor
+    pode simular latência, limitar o tamanho das páginas como o Jira faz e responder
+    429 a cada `throttle_every` requisições.
+    """
+
+    def __init__(
+        self,
+        issues_per_project=100,
+        projects=("ABC", "XYZ"),
+        latency=0.0,
+        histories_per_issue=2,
+        etags=False,
+        users=25,
+        max_page_size=None,
+        throttle_every=0,
+        description_size=0,
+        seed=0,
+    ):
+        self.latency = latency
+        self.etags = etags
+        self.max_page_size = max_page_size
+        self.throttle_every = throttle_every
+        self.projects = list(projects)
+        self.users = [
+            {
+                "accountId": f"user-{n}",
+                "displayName": f"User {n}",
+                "active": n % 10 != 0,
+            }
+            for n in range(users)
+        ]
+        rng = random.Random(seed)
+        self.issues = [
+            self._issue(
+                rng, index, project, number, issues_per_project, description_size
+            )
+            for index, project in enumerate(self.projects)
+            for number in range(1, issues_per_project + 1)
+        ]
+        self.histories = {
+            issue["id"]: [
+                {
+                    "id": f"{issue['id']}{number:03d}",
+                    "author": {"accountId": "user-0"},
+                    "created": "2024-01-01T00:00:00.000+0000",
+                    "items": [
+                        {"field": "status", "fromString": "To Do", "toString": "Done"}
+                    ],
+                }
+                for number in range(histories_per_issue)
+            ]
+            for issue in self.issues
+        }
+        self.requests = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+
+    def _issue(self, rng, index, project, number, issues_per_project, description_size):
+        status, category = rng.choice(STATUSES)
+        fields = {
+            "summary": f"Issue {number} of {project}",
+            "project": {"id": str(index), "key": project, "name": f"Project {project}"},
+            "issuetype": {"name": rng.choice(ISSUE_TYPES)},
+            "status": {"name": status, "statusCategory": {"name": category}},
+            "priority": {"name": rng.choice(PRIORITIES)},
+            "assignee": {"accountId": rng.choice(self.users)["accountId"]},
+            "reporter": {"accountId": rng.choice(self.users)["accountId"]},
+            "created": f"2023-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            "T09:00:00.000+0000",
+            "updated": "2024-01-01T00:00:00.000+0000",
+        }
+        if description_size:
+            fields["description"] = "".join(
+                rng.choice("abcdefghij ") for _ in range(description_size)
+            )
+        return {
+            "id": str(index * issues_per_project + number),
+            "key": f"{project}-{number}",
+            "fields": fields,
+        }
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def search(self, query):
+        """Filtra as issues pela cláusula `project = KEY` do JQL, se houver"""
+        match = PROJECT_RE.search(query.get("jql", [""])[0])
+        if match:
+            return [i for i in self.issues if i["fields"]["project"]["key"] == match[1]]
+        return self.issues
+
+    def page_size(self, requested):
+        """Limita o tamanho da página como o Jira faz com `maxResults` muito grandes"""
+        if self.max_page_size:
+            return min(int(requested), self.max_page_size)
+        return int(requested)
+
+    def respond(self, path, query):
+        start_at = int(query.get("startAt", ["0"])[0])
+        max_results = self.page_size(query.get("maxResults", ["50"])[0])
+
+        if path.endswith("/search/jql"):
+            # o endpoint de busca aprimorada pagina apenas por nextPageToken
+            issues = self.search(query)
+            token = query.get("nextPageToken", [""])[0]
+            offset = int(token.split("-")[1]) if token else 0
+            page = issues[offset : offset + max_results]
+            body = {"issues": page, "isLast": offset + len(page) >= len(issues)}
+            if not body["isLast"]:
+                body["nextPageToken"] = f"page-{offset + len(page)}"
+            return body
+        if path.endswith("/users"):
+            return self.users[start_at : start_at + max_results]
+        if path.endswith("/project/search"):
+            values = [{"id": str(i), "key": k} for i, k in enumerate(self.projects)]
+            page = values[start_at : start_at + max_results]
+            return {"values": page, "isLast": start_at + len(page) >= len(values)}
+        return None
+
+    def respond_post(self, path, body):
+        if path.endswith("/changelog/bulkfetch"):
+            # pagina as histórias de todas as issues pedidas por nextPageToken
+            histories = [
+                (issue_id, history)
+                for issue_id in body["issueIdsOrKeys"]
+                for history in self.histories.get(issue_id, [])
+            ]
+            token = body.get("nextPageToken")
+            offset = int(token.split("-")[1]) if token else 0
+            page = histories[
+                offset : offset + self.page_size(body.get("maxResults", 1000))
+            ]
+            changelogs = {}
+            for issue_id, history in page:
+                changelogs.setdefault(issue_id, []).append(history)
+            result = {
+                "issueChangeLogs": [
+                    {"issueId": issue_id, "changeHistories": changes}
+                    for issue_id, changes in changelogs.items()
+                ]
+            }
+            if offset + len(page) < len(histories):
+                result["nextPageToken"] = f"page-{offset + len(page)}"
+            return result
+        return None
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                self.reply(lambda: server.respond(url.path, parse_qs(url.query)), True)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                self.reply(lambda: server.respond_post(self.path, request))
+
+            def reply(self, respond, cacheable=False):
+                with server._lock:
+                    server.requests += 1
+                    throttle = (
+                        server.throttle_every
+                        and server.requests % server.throttle_every == 0
+                    )
+                    if throttle:
+                        server.throttled += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if throttle:
+                    self.send_response(429)
+                    self.send_header("Retry-After", "0")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = respond()
+                if body is None:
+                    self.send_error(404)
+                    return
+
+                payload = json.dumps(body).encode()
+                etag = f'"{hashlib.md5(payload).hexdigest()}"'
+                if cacheable and server.etags:
+                    if self.headers.get("If-None-Match") == etag:
+                        self.send_response(304)
+                        self.end_headers()
+                        return
+                self.send_response(200)
+                if cacheable and server.etags:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def serve_in_process(urls, **kwargs):
+    """Executa o servidor em um processo separado e envia sua URL pela fila `urls`"""
+    server = FakeJiraServer(**kwargs).start()
+    urls.put(server.url)
+    threading.Event().wait()
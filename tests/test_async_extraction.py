@@ -0,0 +1,124 @@
+"""
+Testes do motor de extração assíncrono contra um servidor Jira falso
+"""
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from jira import (  # noqa: E402
+    get_paginated_data,
+    jira_async,
+    jira_search,
+    jira_search_async,
+)
+from jira.async_client import AsyncJiraClient, iter_parallel_async  # noqa: E402
+from jira.rate_limit import get_rate_limiter  # noqa: E402
+
+PROJECTS = ["P1", "P2", "P3", "P4"]
+
+
+class TestAsyncExtraction:
+    """Testes para AsyncJiraClient e as fontes assíncronas"""
+
+    def test_async_pages_match_sync_pages(self, fake_jira):
+        """Testa que as páginas assíncronas são iguais às síncronas"""
+        params = {"jql": 'project = "ABC"'}
+        sync_pages = list(
+            get_paginated_data(
+                fake_jira.url,
+                "e",
+                "t",
+                30,
+                "rest/api/3/search/jql",
+                "issues",
+                params,
+                paginator="token",
+            )
+        )
+
+        async def fetch():
+            async with AsyncJiraClient(fake_jira.url, "e", "t") as client:
+                return [
+                    page
+                    async for page in client.get_paginated_data(
+                        30, "rest/api/3/search/jql", "issues", params, "token"
+                    )
+                ]
+
+        assert asyncio.run(fetch()) == sync_pages
+
+    def test_async_source_loads_all_endpoints(self, fake_jira):
+        """Testa que a fonte assíncrona retorna todos os endpoints"""
+        source = jira_async(subdomain=fake_jira.url, email="e", api_token="t")
+
+        assert len(list(source.resources["users"])) == len(fake_jira.users)
+        assert len(list(source.resources["projects"])) == len(fake_jira.projects)
+
+    def test_early_exit_leaves_no_pending_workers(self):
+        """Testa que encerrar o consumo antes do fim aguarda os workers cancelados"""
+
+        def producer():
+            async def pages():
+                for page in range(100):
+                    await asyncio.sleep(0)
+                    yield [page]
+
+            return pages()
+
+        async def consume_one():
+            iterator = iter_parallel_async([producer, producer], max_workers=2)
+            first = await iterator.__anext__()
+            await iterator.aclose()
+            current = asyncio.current_task()
+            pending = [t for t in asyncio.all_tasks() if t is not current]
+            return first, pending
+
+        first, pending = asyncio.run(consume_one())
+
+        assert first == [0]
+        assert pending == []
+
+    @pytest.mark.performance
+    def test_concurrent_queries_scale_near_linearly(self):
+        """Testa ganho de throughput quase linear com consultas concorrentes"""
+        from tests.fake_jira import FakeJiraServer
+
+        server = FakeJiraServer(issues_per_project=200, projects=PROJECTS, latency=0.1)
+        server.start()
+
+        # O limite de taxa não deve ser o gargalo deste teste
+        limiter = get_rate_limiter(server.url)
+        limiter.max_rate = limiter.rate = 1000.0
+        limiter.burst = 100
+        try:
+            queries = [f'project = "{key}"' for key in PROJECTS]
+
+            start_time = time.time()
+            sync_issues = list(
+                jira_search(
+                    subdomain=server.url, email="e", api_token="t", max_workers=1
+                ).issues(jql_queries=queries)
+            )
+            sync_time = time.time() - start_time
+
+            start_time = time.time()
+            async_issues = list(
+                jira_search_async(
+                    subdomain=server.url,
+                    email="e",
+                    api_token="t",
+                    max_workers=len(PROJECTS),
+                ).issues(jql_queries=queries)
+            )
+            async_time = time.time() - start_time
+        finally:
+            server.stop()
+
+        assert sorted(i["id"] for i in async_issues) == sorted(
+            i["id"] for i in sync_issues
+        )
+        assert sync_time / async_time > len(PROJECTS) * 0.6
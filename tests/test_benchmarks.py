@@ -0,0 +1,148 @@
+"""
+Benchmarks de extração de ponta a ponta contra o servidor Jira falso
+
+Executar com `pytest tests/test_benchmarks.py --benchmark-only`. Cada benchmark
+registra em `extra_info` páginas/s, issues/s, pico de RSS e retentativas por 429.
+"""
+
+import os
+import threading
+
+import dlt
+import pytest
+
+from jira import jira_search
+from jira.client import JiraClient, jira_base_url
+from jira.rate_limit import RateLimiter
+
+pytest.importorskip("pytest_benchmark")
+psutil = pytest.importorskip("psutil")
+
+ISSUES_PER_PROJECT = 1000
+PAGE_SIZE = 100
+THROTTLE_EVERY = 20
+
+
+class PeakRSS:
+    """Amostra o RSS do processo em uma thread enquanto o bloco executa"""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = 0
+        self._process = psutil.Process(os.getpid())
+        self._stop = threading.Event()
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._process.memory_info().rss)
+
+
+@pytest.fixture
+def bench_jira(tmp_path, monkeypatch):
+    """Fixture com um conjunto de dados maior, páginas limitadas e 429 injetados"""
+    from tests.fake_jira import FakeJiraServer
+
+    monkeypatch.setattr("jira.cache.CACHE_DIR", str(tmp_path / "jira_cache"))
+    server = FakeJiraServer(
+        issues_per_project=ISSUES_PER_PROJECT,
+        max_page_size=PAGE_SIZE,
+        throttle_every=THROTTLE_EVERY,
+        description_size=500,
+    ).start()
+    # o limitador compartilhado não deve ser o gargalo medido
+    monkeypatch.setattr(
+        "jira.rate_limit._limiters",
+        {jira_base_url(server.url): RateLimiter(rate=1000, burst=100, min_rate=100)},
+    )
+    yield server
+    server.stop()
+
+
+def record(benchmark, server, counters, pages, issues, peak_rss):
+    """
+    Registra as métricas médias de uma rodada no relatório do benchmark
+
+    `counters` são os contadores de requisições e de 429 do servidor antes das rodadas.
+    """
+    seconds = benchmark.stats.stats.mean
+    rounds = len(benchmark.stats.stats.data)
+    requests, throttled = counters
+    benchmark.extra_info.update(
+        {
+            "pages_per_sec": pages / seconds,
+            "issues_per_sec": issues / seconds,
+            "peak_rss_bytes": peak_rss,
+            "requests": (server.requests - requests) // rounds,
+            "retries": (server.throttled - throttled) // rounds,
+        }
+    )
+
+
+class TestExtractionBenchmarks:
+    """Benchmarks da paginação e do pipeline completo"""
+
+    @pytest.mark.performance
+    def test_get_paginated_data(self, benchmark, bench_jira):
+        """Mede a paginação de search/jql com JiraClient.get_paginated_data"""
+        client = JiraClient(bench_jira.url, "e", "t")
+        counters = bench_jira.requests, bench_jira.throttled
+
+        def extract():
+            # pede páginas maiores que o limite do servidor, como faz o source
+            pages = client.get_paginated_data(
+                page_size=PAGE_SIZE * 2,
+                api_path="rest/api/3/search/jql",
+                data_path="issues",
+                params={"jql": "ORDER BY id"},
+                paginator="token",
+            )
+            return [len(page) for page in pages]
+
+        with PeakRSS() as rss:
+            lengths = benchmark.pedantic(extract, rounds=3)
+
+        assert sum(lengths) == len(bench_jira.issues)
+        record(benchmark, bench_jira, counters, len(lengths), sum(lengths), rss.peak)
+        assert benchmark.extra_info["retries"] > 0
+
+    @pytest.mark.performance
+    def test_pipeline_run(self, benchmark, bench_jira, tmp_path):
+        """Mede um pipeline.run completo de issues e changelogs para o duckdb"""
+        counters = bench_jira.requests, bench_jira.throttled
+        runs = iter(range(100))
+
+        def setup():
+            run = next(runs)
+            pipeline = dlt.pipeline(
+                pipeline_name=f"benchmark_{run}",
+                destination=dlt.destinations.duckdb(str(tmp_path / f"{run}.duckdb")),
+                dataset_name="jira_data",
+                pipelines_dir=str(tmp_path / "pipelines"),
+            )
+            source = jira_search(subdomain=bench_jira.url, email="e", api_token="t")
+            source.issues.bind(jql_queries=["ORDER BY id"])
+            return (pipeline, source), {}
+
+        def run(pipeline, source):
+            pipeline.run(source)
+            return pipeline.last_trace.last_normalize_info.row_counts
+
+        with PeakRSS() as rss:
+            row_counts = benchmark.pedantic(run, setup=setup, rounds=3)
+
+        issues = len(bench_jira.issues)
+        assert row_counts["issues"] == issues
+        pages = -(-issues // PAGE_SIZE)
+        record(benchmark, bench_jira, counters, pages, issues, rss.peak)
+        assert benchmark.extra_info["retries"] > 0
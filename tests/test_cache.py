@@ -0,0 +1,145 @@
+"""
+Testes do cache de respostas dos endpoints que mudam pouco
+"""
+
+import time
+
+from jira import jira
+from jira.cache import (
+    ResponseCache,
+    cache_key,
+    commit_loaded_pages,
+    discard_pending_pages,
+    get_response_cache,
+)
+from jira.client import JiraClient
+
+
+class TestResponseCache:
+    """Testes para ResponseCache"""
+
+    def test_detects_unchanged_body(self, tmp_path):
+        """Testa que um corpo com o mesmo hash é reconhecido como inalterado"""
+        cache = ResponseCache(str(tmp_path / "cache.json"))
+        key = cache_key("http://jira/rest/api/3/users", {"startAt": 0})
+
+        unchanged, entry = cache.check(key, {}, b"[1, 2]", {}, 2)
+        assert not unchanged
+        cache.commit({key: entry})
+
+        assert cache.check(key, {}, b"[1, 2]", {}, 2)[0]
+        assert not cache.check(key, {}, b"[1, 3]", {}, 2)[0]
+
+    def test_persists_between_instances(self, tmp_path):
+        """Testa que as entradas são gravadas em disco"""
+        path = str(tmp_path / "cache.json")
+        cache = ResponseCache(path)
+        cache.commit({"page": cache.check("page", {"ETag": '"v1"'}, b"[]", {}, 0)[1]})
+
+        entry = ResponseCache(path).get("page")
+
+        assert ResponseCache(path).conditional_headers(entry) == {
+            "If-None-Match": '"v1"'
+        }
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Testa que as entradas menos usadas são removidas além do limite"""
+        cache = ResponseCache(str(tmp_path / "cache.json"), max_entries=2)
+        for key in ["a", "b"]:
+            cache.commit({key: cache.check(key, {}, key.encode(), {}, 1)[1]})
+        cache.get("a")
+        cache.commit({"c": cache.check("c", {}, b"c", {}, 1)[1]})
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Testa que entradas mais antigas que o TTL não são usadas"""
+        cache = ResponseCache(str(tmp_path / "cache.json"), ttl_hours=1)
+        unchanged, entry = cache.check("page", {}, b"[]", {}, 0)
+        entry["stored_at"] = time.time() - 7200
+        cache.commit({"page": entry})
+
+        assert cache.get("page") is None
+
+
+class TestCachedExtraction:
+    """Testes para a extração com cache dos endpoints users e projects"""
+
+    def test_second_run_skips_unchanged_pages(self, fake_jira):
+        """Testa que páginas inalteradas não são retornadas na segunda execução"""
+        args = dict(subdomain=fake_jira.url, email="e", api_token="t", use_cache=True)
+        first = list(jira(**args).users)
+        commit_loaded_pages()
+        second = list(jira(**args).users)
+        cache = get_response_cache(JiraClient(fake_jira.url, "e", "t").base_url)
+
+        assert len(first) == len(fake_jira.users)
+        assert second == []
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_cache_is_disabled_by_default(self, fake_jira):
+        """Testa que a fonte não pula páginas sem use_cache"""
+        args = dict(subdomain=fake_jira.url, email="e", api_token="t")
+        list(jira(**args).users)
+        commit_loaded_pages()
+
+        assert len(list(jira(**args).users)) == len(fake_jira.users)
+
+    def test_scopes_have_separate_caches(self, fake_jira):
+        """Testa que páginas em cache de um destino não são puladas em outro"""
+        args = dict(subdomain=fake_jira.url, email="e", api_token="t", use_cache=True)
+        list(jira(**args, cache_scope="pipeline/dataset").users)
+        commit_loaded_pages()
+
+        assert list(jira(**args, cache_scope="pipeline/dataset").users) == []
+        assert len(list(jira(**args, cache_scope="other/dataset").users)) == len(
+            fake_jira.users
+        )
+
+    def test_changed_pages_are_loaded(self, fake_jira):
+        """Testa que apenas as páginas alteradas são carregadas novamente"""
+        client = JiraClient(fake_jira.url, "e", "t")
+        args = dict(page_size=10, api_path="rest/api/3/users", cache=True)
+
+        assert sum(len(page) for page in client.get_paginated_data(**args)) == 25
+        commit_loaded_pages()
+        fake_jira.users[12]["displayName"] = "Renamed"
+
+        pages = list(client.get_paginated_data(**args))
+
+        assert [len(page) for page in pages] == [10]
+        assert pages[0][2] == fake_jira.users[12]
+
+    def test_revalidates_with_etag(self, fake_jira):
+        """Testa a revalidação por ETag com respostas 304"""
+        fake_jira.etags = True
+        client = JiraClient(fake_jira.url, "e", "t")
+        args = dict(page_size=50, api_path="rest/api/3/project/search", cache=True)
+
+        assert len(list(client.get_paginated_data(**args))) == 1
+        commit_loaded_pages()
+        assert list(client.get_paginated_data(**args)) == []
+        assert client.response_cache.hits == 1
+
+    def test_interrupted_run_is_not_cached(self, fake_jira):
+        """Testa que uma leitura interrompida não marca páginas como carregadas"""
+        client = JiraClient(fake_jira.url, "e", "t")
+        args = dict(page_size=10, api_path="rest/api/3/users", cache=True)
+
+        pages = client.get_paginated_data(**args)
+        next(pages)
+        pages.close()
+
+        assert sum(len(page) for page in client.get_paginated_data(**args)) == 25
+
+    def test_pages_of_failed_load_are_not_cached(self, fake_jira):
+        """Testa que as páginas de uma carga que falhou são carregadas novamente"""
+        client = JiraClient(fake_jira.url, "e", "t")
+        args = dict(page_size=10, api_path="rest/api/3/users", cache=True)
+
+        assert sum(len(page) for page in client.get_paginated_data(**args)) == 25
+        discard_pending_pages()
+
+        assert sum(len(page) for page in client.get_paginated_data(**args)) == 25
@@ -0,0 +1,55 @@
+"""
+Testes da carga de changelogs em lote pelo transformer `issue_changelogs`
+"""
+
+import dlt
+
+import jira
+from jira import get_changelogs, jira_search
+from jira.client import JiraClient
+
+
+class TestIssueChangelogs:
+    """Testes para get_changelogs e o transformer issue_changelogs"""
+
+    def test_fetches_all_histories_across_pages(self, fake_jira, monkeypatch):
+        """Testa que todas as histórias são buscadas, seguindo nextPageToken"""
+        monkeypatch.setattr(jira, "CHANGELOG_PAGE_SIZE", 3)
+        client = JiraClient(fake_jira.url, "e", "t")
+        issue_ids = [issue["id"] for issue in fake_jira.issues[:5]]
+
+        histories = [h for page in get_changelogs(client, issue_ids) for h in page]
+
+        assert len(histories) == 10
+        assert {h["issue_id"] for h in histories} == set(issue_ids)
+
+    def test_transformer_is_optional(self):
+        """Testa que o transformer só é criado com bulk_changelog habilitado"""
+        source = jira_search(subdomain="x", email="e", api_token="t")
+        inline = jira_search(
+            subdomain="x", email="e", api_token="t", bulk_changelog=False
+        )
+
+        assert set(source.resources) == {"issues", "issue_changelogs"}
+        assert set(inline.resources) == {"issues"}
+
+    def test_loads_changelog_tables(self, fake_jira, tmp_path):
+        """Testa a carga das tabelas issue_changelogs e issue_changelogs__items"""
+        source = jira_search(subdomain=fake_jira.url, email="e", api_token="t")
+        source.issues.bind(jql_queries=['project = "ABC"'])
+        pipeline = dlt.pipeline(
+            pipeline_name="changelog_test",
+            destination=dlt.destinations.duckdb(str(tmp_path / "jira.duckdb")),
+            dataset_name="jira_data",
+            pipelines_dir=str(tmp_path),
+        )
+
+        pipeline.run(source)
+
+        with pipeline.sql_client() as client:
+            histories = client.execute_sql(
+                "SELECT COUNT(*), COUNT(DISTINCT issue_id) FROM issue_changelogs"
+            )
+            items = client.execute_sql("SELECT COUNT(*) FROM issue_changelogs__items")
+        assert histories[0] == (200, 100)
+        assert items[0][0] == 200
@@ -0,0 +1,44 @@
+"""
+Testes do cliente HTTP compartilhado pelos recursos da fonte Jira
+"""
+
+from jira import jira, jira_search
+from jira.client import get_client
+
+OPTIONS = dict(pool_size=3, connect_timeout=2.0, read_timeout=5.0)
+
+
+class TestSharedClient:
+    """Testes para get_client e as opções de conexão das fontes"""
+
+    def test_resources_share_configured_session(self, fake_jira):
+        """Testa que todos os recursos usam uma única sessão com o pool configurado"""
+        source = jira(subdomain=fake_jira.url, email="e", api_token="t", **OPTIONS)
+        search = jira_search(
+            subdomain=fake_jira.url,
+            email="e",
+            api_token="t",
+            bulk_changelog=False,
+            **OPTIONS,
+        )
+
+        list(source.users)
+        list(source.projects)
+        list(search.issues(jql_queries=['project = "ABC"']))
+
+        client = get_client(fake_jira.url, "e", "t", **OPTIONS)
+        adapter = client.session.get_adapter(fake_jira.url)
+        assert set(client.stats()) == {
+            "/rest/api/3/users",
+            "/rest/api/3/project/search",
+            "/rest/api/3/search/jql",
+        }
+        assert adapter._pool_maxsize == adapter._pool_connections == 3
+        assert client.session.timeout == (2.0, 5.0)
+
+    def test_settings_get_their_own_client(self):
+        """Testa que opções diferentes não reutilizam o pool de outro cliente"""
+        client = get_client("https://a.example", "e", "t")
+
+        assert get_client("https://a.example", "e", "t") is client
+        assert get_client("https://a.example", "e", "t", pool_size=20) is not client
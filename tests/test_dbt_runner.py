@@ -0,0 +1,153 @@
+"""
+Testes da execução do dbt no mesmo processo
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from dbt_runner import DbtRunner
+from orchestrator import JiraDataPipeline
+
+
+def node_result(name, seconds, rows):
+    """Cria um resultado de nó no formato do RunExecutionResult do dbt"""
+    return SimpleNamespace(
+        node=SimpleNamespace(name=name, unique_id=f"model.jira_analytics.{name}"),
+        status=SimpleNamespace(value="success"),
+        execution_time=seconds,
+        adapter_response={"rows_affected": rows},
+    )
+
+
+class FakeDbtRunner:
+    """Simula o dbtRunner registrando as invocações"""
+
+    invocations = []
+    parses = 0
+    block = None
+
+    def __init__(self, manifest=None):
+        self.manifest = manifest
+
+    def invoke(self, args):
+        if args[0] == "parse":
+            FakeDbtRunner.parses += 1
+            return SimpleNamespace(success=True, result="manifest", exception=None)
+        FakeDbtRunner.invocations.append((args, self.manifest))
+        if FakeDbtRunner.block:
+            FakeDbtRunner.block.wait()
+        results = [
+            node_result("stg_jira_users", 0.5, -1),
+            node_result("dim_users", 1.2, 25),
+        ]
+        return SimpleNamespace(
+            success=True, result=SimpleNamespace(results=results), exception=None
+        )
+
+
+@pytest.fixture
+def fake_dbt(tmp_path):
+    """Fixture que substitui o dbtRunner e cria um projeto dbt vazio"""
+    FakeDbtRunner.invocations = []
+    FakeDbtRunner.parses = 0
+    FakeDbtRunner.block = None
+    (tmp_path / "dbt_project.yml").write_text("name: test\n")
+    (tmp_path / "models").mkdir()
+    with patch("dbt_runner._dbt_runner_class", return_value=FakeDbtRunner):
+        yield tmp_path
+    if FakeDbtRunner.block:
+        FakeDbtRunner.block.set()
+
+
+class TestDbtRunner:
+    """Testes para DbtRunner"""
+
+    def test_returns_per_model_results(self, fake_dbt):
+        """Testa que tempos e linhas por modelo são retornados"""
+        runner = DbtRunner(str(fake_dbt), threads=4)
+
+        result = runner.invoke("run", ["source:jira_data.users+"])
+
+        assert result.success
+        assert [m["model"] for m in result.models] == ["stg_jira_users", "dim_users"]
+        assert result.models[1]["execution_time"] == 1.2
+        assert result.models[1]["rows_affected"] == 25
+        args, manifest = FakeDbtRunner.invocations[0]
+        assert args[:6] == [
+            "run",
+            "--select",
+            "source:jira_data.users+",
+            "--threads",
+            "4",
+            "--project-dir",
+        ]
+        assert manifest == "manifest"
+
+    def test_passes_project_variables(self, fake_dbt):
+        """Testa que as variáveis do projeto são passadas em todas as invocações"""
+        runner = DbtRunner(str(fake_dbt), variables={"bulk_changelog": False})
+
+        runner.invoke("run")
+
+        args = FakeDbtRunner.invocations[0][0]
+        assert args[args.index("--vars") + 1] == '{"bulk_changelog": false}'
+
+    def test_reuses_manifest_until_project_changes(self, fake_dbt):
+        """Testa que o projeto só é analisado novamente quando muda"""
+        runner = DbtRunner(str(fake_dbt))
+
+        runner.invoke("run")
+        runner.invoke("test")
+        assert FakeDbtRunner.parses == 1
+
+        (fake_dbt / "models" / "new_model.sql").write_text("select 1")
+        runner._manifest_mtime -= 10
+        runner.invoke("run")
+        assert FakeDbtRunner.parses == 2
+        # comandos sem threads não recebem --threads
+        assert "--threads" not in FakeDbtRunner.invocations[1][0]
+
+    def test_timeout_is_enforced(self, fake_dbt):
+        """Testa que uma invocação que não termina é abandonada após o timeout"""
+        FakeDbtRunner.block = threading.Event()
+        runner = DbtRunner(str(fake_dbt), timeout=0.2)
+
+        result = runner.invoke("run")
+
+        assert not result.success
+        assert "timed out" in result.error
+
+    def test_no_concurrent_run_after_timeout(self, fake_dbt):
+        """Testa que o dbt não roda de novo enquanto a invocação abandonada roda"""
+        FakeDbtRunner.block = threading.Event()
+        runner = DbtRunner(str(fake_dbt), timeout=0.2)
+        runner.invoke("run")
+
+        result = runner.invoke("run")
+
+        assert not result.success
+        assert "still running" in result.error
+        assert len(FakeDbtRunner.invocations) == 1
+
+        FakeDbtRunner.block.set()
+        runner._thread.join(5)
+        assert runner.invoke("run").success
+        assert len(FakeDbtRunner.invocations) == 2
+
+
+class TestTransformData:
+    """Testes para JiraDataPipeline.transform_data"""
+
+    def test_keeps_model_results(self, fake_dbt):
+        """Testa que os resultados por modelo voltam para o orchestrator"""
+        orchestrator = JiraDataPipeline({"dbt_threads": 2})
+        orchestrator.dbt_project_dir = str(fake_dbt)
+
+        assert orchestrator.transform_data("run")
+        assert orchestrator.transform_data("run")
+
+        assert orchestrator.dbt_results[1]["model"] == "dim_users"
+        assert FakeDbtRunner.parses == 1
@@ -0,0 +1,114 @@
+"""
+Testes da manutenção de índices das tabelas carregadas pelo dlt
+"""
+
+from unittest.mock import Mock
+
+from indexes import (
+    EXISTING_COLUMNS_SQL,
+    INDEX_STATE_SQL,
+    INDEX_USAGE_SQL,
+    IndexSpec,
+    ensure_indexes,
+    index_usage,
+    maintain_indexes,
+)
+
+
+class FakeSqlClient:
+    """Simula o sql_client do dlt registrando os comandos executados"""
+
+    def __init__(self, columns, indexes=(), usage=()):
+        self.results = {
+            EXISTING_COLUMNS_SQL: list(columns),
+            INDEX_STATE_SQL: list(indexes),
+            INDEX_USAGE_SQL: list(usage),
+        }
+        self.statements = []
+
+    def execute_sql(self, sql, *args):
+        if sql in self.results:
+            return self.results[sql]
+        self.statements.append(sql)
+        return None
+
+
+class TestEnsureIndexes:
+    """Testes para ensure_indexes"""
+
+    def test_creates_missing_indexes_concurrently(self):
+        """Testa que índices ausentes são criados sem bloquear escritas"""
+        client = FakeSqlClient([("issues", "_dlt_id"), ("issues", "fields__updated")])
+        indexes = [
+            IndexSpec("issues", ("_dlt_id",)),
+            IndexSpec("issues", ("fields__updated",)),
+        ]
+
+        created = ensure_indexes(client, "jira_data", indexes)
+
+        assert created == [index.name for index in indexes]
+        assert client.statements == [
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_issues___dlt_id" '
+            'ON "jira_data"."issues" ("_dlt_id")',
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS "idx_issues__fields__updated" '
+            'ON "jira_data"."issues" ("fields__updated")',
+        ]
+
+    def test_skips_existing_indexes_and_missing_tables(self):
+        """Testa que índices válidos e tabelas ainda não carregadas são ignorados"""
+        index = IndexSpec("issues", ("_dlt_id",))
+        client = FakeSqlClient([("issues", "_dlt_id")], [(index.name, True)])
+
+        created = ensure_indexes(
+            client, "jira_data", [index, IndexSpec("issue_changelogs", ("issue_id",))]
+        )
+
+        assert created == []
+        assert client.statements == []
+
+    def test_rebuilds_invalid_index(self):
+        """Testa que um índice inválido de uma criação interrompida é recriado"""
+        index = IndexSpec("users", ("account_id",))
+        client = FakeSqlClient([("users", "account_id")], [(index.name, False)])
+
+        assert ensure_indexes(client, "jira_data", [index]) == [index.name]
+        assert client.statements[0] == (
+            f'DROP INDEX CONCURRENTLY IF EXISTS "jira_data"."{index.name}"'
+        )
+        assert client.statements[1].startswith("CREATE INDEX CONCURRENTLY")
+
+    def test_long_names_fit_postgres_limit(self):
+        """Testa que nomes longos são encurtados de forma determinística"""
+        index = IndexSpec(
+            "issues__changelog__histories__items", ("_dlt_parent_id", "_dlt_list_idx")
+        )
+
+        assert len(index.name) == 63
+        assert index.name == IndexSpec(*index).name
+
+
+class TestIndexUsage:
+    """Testes para o relatório de uso dos índices"""
+
+    def test_returns_usage_per_index(self):
+        """Testa que as estatísticas são retornadas por índice"""
+        client = FakeSqlClient([], usage=[("issues", "idx", 3, 30, 30, 8192)])
+
+        assert index_usage(client, "jira_data") == [
+            {
+                "table_name": "issues",
+                "index_name": "idx",
+                "idx_scan": 3,
+                "idx_tup_read": 30,
+                "idx_tup_fetch": 30,
+                "size_bytes": 8192,
+            }
+        ]
+
+    def test_ignores_other_destinations(self):
+        """Testa que destinos diferentes do Postgres não são alterados"""
+        pipeline = Mock()
+        pipeline.destination.destination_type = "dlt.destinations.duckdb"
+
+        assert maintain_indexes(pipeline) == []
+        pipeline.sql_client.assert_not_called()
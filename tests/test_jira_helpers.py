@@ -0,0 +1,242 @@
+"""
+Testes para os helpers de sharding, paginação e busca concorrente da fonte Jira
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from jira import _search_params
+from jira.helpers import (
+    build_jql_shards,
+    incremental_jql,
+    iter_parallel,
+    split_order_by,
+)
+from jira.paginators import get_paginator
+from jira.settings import DEFAULT_ENDPOINTS, DEFAULT_ISSUE_FIELDS
+
+
+class TestBuildJqlShards:
+    """Testes para build_jql_shards"""
+
+    def test_no_sharding_returns_original_query(self):
+        """Testa que sem parâmetros de shard a query original é mantida"""
+        assert build_jql_shards("updated >= -90d") == ["(updated >= -90d)"]
+
+    def test_shards_by_project(self):
+        """Testa divisão da query por chave de projeto"""
+        shards = build_jql_shards("updated >= -90d", project_keys=["ABC", "XYZ"])
+
+        assert shards == [
+            '(updated >= -90d) AND project = "ABC"',
+            '(updated >= -90d) AND project = "XYZ"',
+            '(updated >= -90d) AND project not in ("ABC", "XYZ")',
+        ]
+
+    def test_project_keys_are_escaped(self):
+        """Testa que aspas e barras invertidas nas chaves de projeto são escapadas"""
+        shards = build_jql_shards("status = Done", project_keys=['A"B\\'])
+
+        assert shards == [
+            '(status = Done) AND project = "A\\"B\\\\"',
+            '(status = Done) AND project not in ("A\\"B\\\\")',
+        ]
+
+    def test_time_windows_are_disjoint_and_open_ended(self):
+        """Testa que as janelas de tempo são disjuntas e cobrem todo o intervalo"""
+        shards = build_jql_shards(
+            "updated >= -30d",
+            updated_since=datetime(2024, 1, 1),
+            window_days=10,
+            now=datetime(2024, 1, 31),
+        )
+
+        assert shards == [
+            '(updated >= -30d) AND updated < "2024-01-11 00:00"',
+            '(updated >= -30d) AND updated >= "2024-01-11 00:00"'
+            ' AND updated < "2024-01-21 00:00"',
+            '(updated >= -30d) AND updated >= "2024-01-21 00:00"',
+        ]
+
+    def test_combines_projects_and_windows(self):
+        """Testa combinação de projetos e janelas de tempo"""
+        shards = build_jql_shards(
+            "status = Done",
+            project_keys=["ABC", "XYZ"],
+            updated_since=datetime(2024, 1, 1),
+            window_days=10,
+            now=datetime(2024, 1, 15),
+        )
+
+        assert len(shards) == 6
+
+    def test_keeps_order_by_at_the_end(self):
+        """Testa que a cláusula ORDER BY permanece no final de cada shard"""
+        shards = build_jql_shards("status = Done order by updated", ["ABC"])
+
+        assert shards == [
+            '(status = Done) AND project = "ABC" ORDER BY updated',
+            '(status = Done) AND project not in ("ABC") ORDER BY updated',
+        ]
+
+    def test_window_requires_start(self):
+        """Testa que window_days exige updated_since"""
+        with pytest.raises(ValueError):
+            build_jql_shards("status = Done", window_days=7)
+
+    def test_split_order_by_without_clause(self):
+        """Testa split_order_by sem cláusula ORDER BY"""
+        assert split_order_by("status = Done") == ("status = Done", "")
+
+
+class TestIncrementalJql:
+    """Testes para incremental_jql"""
+
+    NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    def test_first_run_keeps_query(self):
+        """Testa que sem cursor a query original é mantida"""
+        assert incremental_jql("updated >= -90d", None) == "updated >= -90d"
+
+    def test_replaces_updated_lower_bound(self):
+        """Testa que o limite inferior de updated é substituído pelo cursor"""
+        jql = incremental_jql(
+            'project = X AND updated >= "-5d" ORDER BY updated',
+            "2024-01-01T10:00:00.000+0000",
+            now=self.NOW,
+        )
+
+        assert jql == 'project = X AND updated >= "-120m" ORDER BY updated'
+
+    def test_appends_bound_when_missing(self):
+        """Testa que o limite é adicionado quando a query não o possui"""
+        jql = incremental_jql("project = X", "2024-01-01T11:00:00.000+0000", self.NOW)
+
+        assert jql == '(project = X) AND updated >= "-60m"'
+
+
+class TestIterParallel:
+    """Testes para iter_parallel"""
+
+    def test_yields_all_pages(self):
+        """Testa que todas as páginas de todos os produtores são retornadas"""
+        producers = [lambda i=i: iter([[i, i], [i]]) for i in range(5)]
+
+        pages = list(iter_parallel(producers, max_workers=3))
+
+        assert sorted(map(tuple, pages)) == sorted(
+            [(i, i) for i in range(5)] + [(i,) for i in range(5)]
+        )
+
+    def test_runs_producers_concurrently(self):
+        """Testa que os produtores executam em paralelo"""
+
+        def slow_producer():
+            time.sleep(0.2)
+            yield [1]
+
+        start_time = time.time()
+        list(iter_parallel([slow_producer] * 4, max_workers=4))
+
+        assert time.time() - start_time < 0.6
+
+    def test_bounds_worker_count(self):
+        """Testa que o número de workers simultâneos é limitado"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def producer():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+            yield [1]
+
+        list(iter_parallel([producer] * 8, max_workers=2))
+
+        assert max(peak) <= 2
+
+    def test_propagates_producer_errors(self):
+        """Testa que erros dos produtores são propagados"""
+
+        def failing_producer():
+            raise RuntimeError("boom")
+            yield
+
+        with pytest.raises(RuntimeError):
+            list(iter_parallel([failing_producer, lambda: iter([[1]])], max_workers=2))
+
+
+class TestPaginators:
+    """Testes para as estratégias de paginação"""
+
+    def test_offset_advances_start_at(self):
+        """Testa que a paginação por offset avança startAt até a página curta"""
+        paginator = get_paginator("offset")
+        params = paginator.initial_params("rest/api/3/users", None, 2)
+
+        assert params == {"startAt": 0, "maxResults": 2}
+        params = paginator.next_params(params, [1, 2], 2, 2)
+        assert params["startAt"] == 2
+        assert paginator.next_params(params, [3], 1, 2) is None
+
+    def test_token_follows_next_page_token(self):
+        """Testa que a paginação por token segue nextPageToken e ignora startAt"""
+        paginator = get_paginator("token")
+        params = paginator.initial_params("jql", {"jql": "x", "startAt": 5}, 50)
+
+        assert params == {"jql": "x", "maxResults": 50}
+        result = {"issues": [1], "nextPageToken": "abc", "isLast": False}
+        params = paginator.next_params(params, result, 1, 50)
+        assert params["nextPageToken"] == "abc"
+
+    def test_token_stops_on_last_page(self):
+        """Testa que a paginação por token termina em isLast ou sem token"""
+        paginator = get_paginator("token")
+
+        assert (
+            paginator.next_params({}, {"isLast": True, "nextPageToken": "a"}, 0, 1)
+            is None
+        )
+        assert paginator.next_params({}, {"issues": [1]}, 1, 1) is None
+
+    def test_unknown_paginator(self):
+        """Testa que uma estratégia desconhecida gera erro"""
+        with pytest.raises(ValueError):
+            get_paginator("cursor")
+
+    def test_endpoints_declare_their_paginator(self):
+        """Testa que cada endpoint padrão declara uma estratégia válida"""
+        for endpoint in DEFAULT_ENDPOINTS.values():
+            get_paginator(endpoint["paginator"])
+        assert DEFAULT_ENDPOINTS["issues"]["paginator"] == "token"
+
+
+class TestSearchParams:
+    """Testes para a projeção de campos da busca de issues"""
+
+    def test_default_profile_matches_staging_fields(self):
+        """Testa que o perfil padrão pede apenas os campos usados no staging"""
+        params = _search_params(DEFAULT_ISSUE_FIELDS, None, changelog=False)
+
+        assert params["fields"].split(",") == list(DEFAULT_ISSUE_FIELDS)
+        assert "expand" not in params
+
+    def test_adds_custom_fields_and_cursor(self):
+        """Testa que campos customizados e o cursor updated são incluídos"""
+        params = _search_params(
+            ["summary"], ["customfield_10016", "summary"], changelog=True
+        )
+
+        assert params["fields"] == "summary,customfield_10016,updated"
+        assert params["expand"] == "changelog"
+
+    def test_all_fields(self):
+        """Testa que *all é repassado sem alterações"""
+        assert _search_params(["*all"], None, changelog=False)["fields"] == "*all"
@@ -0,0 +1,277 @@
+"""
+Testes do exportador OpenMetrics do monitor
+"""
+
+import threading
+import urllib.error
+import urllib.request
+from unittest.mock import patch
+
+import pytest
+
+from monitor import (
+    OPENMETRICS_CONTENT_TYPE,
+    SNAPSHOT_SQL,
+    PipelineMonitor,
+    build_snapshot,
+    main,
+    metrics_server,
+)
+
+CATALOG_ROWS = [
+    ("rows", "jira_data", "issues", "r", 2000.0),
+    ("rows", "jira_data", "users", "r", 50.0),
+    ("rows", "jira_analytics", "fct_issues_details", "r", 2000.0),
+    ("rows", "jira_analytics", "dim_users", "r", 50.0),
+    ("rows", "jira_analytics", "stg_jira_issues", "v", None),
+    ("null_fraction", "jira_data", "issues", "fields__summary", 0.01),
+]
+
+FRESHNESS_ROWS = [
+    ("watermark", "jira_ops", "issues", None, 1_700_000_000.0),
+    ("loaded_at", "jira_ops", "issues", None, 1_700_003_600.0),
+    ("rows_loaded", "jira_ops", "issues", None, 120.0),
+    ("watermark", "jira_ops", "users", None, None),
+    ("last_load", "jira_data", "_dlt_loads", "inserted_at", None),
+]
+
+SNAPSHOT_ROWS = CATALOG_ROWS + FRESHNESS_ROWS
+
+
+class FakeCursor:
+    """Simula um cursor do psycopg2 registrando as consultas"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, sql, params=None):
+        pool = self.connection.pool
+        if pool.fail:
+            raise RuntimeError("connection refused")
+        pool.queries.append(sql)
+        if sql == SNAPSHOT_SQL:
+            # to_regclass só encontra as tabelas já criadas
+            self.rows = CATALOG_ROWS + [
+                ("relation", None, name, None, None)
+                for name in params["relations"]
+                if name in pool.relations
+            ]
+        else:
+            self.rows = FRESHNESS_ROWS
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Simula uma conexão do psycopg2"""
+
+    closed = 0
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.autocommit = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakePool:
+    """Simula o ThreadedConnectionPool contando conexões abertas"""
+
+    instances = []
+
+    def __init__(self, minconn, maxconn, **db_config):
+        self.connections = []
+        self.borrowed = 0
+        self.queries = []
+        self.fail = False
+        self.relations = ["jira_ops.resource_watermarks", "jira_data._dlt_loads"]
+        FakePool.instances.append(self)
+
+    def getconn(self):
+        self.borrowed += 1
+        if not self.connections:
+            self.connections.append(FakeConnection(self))
+        return self.connections[0]
+
+    def putconn(self, conn, close=False):
+        pass
+
+    def closeall(self):
+        self.connections = []
+
+
+@pytest.fixture
+def monitor():
+    """Fixture que cria um monitor com um pool de conexões simulado"""
+    FakePool.instances = []
+    with patch("monitor.ThreadedConnectionPool", FakePool):
+        monitor = PipelineMonitor({"host": "db"}, snapshot_ttl=60)
+        yield monitor
+        monitor.close()
+
+
+class TestBuildSnapshot:
+    """Testes para build_snapshot"""
+
+    def test_estimates_counts_and_nulls(self):
+        """Testa que contagens e nulos são estimados a partir do catálogo"""
+        snapshot = build_snapshot(SNAPSHOT_ROWS)
+
+        assert snapshot["rows"][("jira_data", "issues")] == 2000
+        assert ("jira_analytics", "stg_jira_issues") not in snapshot["rows"]
+        assert snapshot["nulls"] == {("jira_data", "issues", "fields__summary"): 20}
+        assert snapshot["dbt_models"] == 2
+        assert snapshot["resources"] == {
+            "issues": {
+                "watermark": 1_700_000_000,
+                "loaded_at": 1_700_003_600,
+                "rows_loaded": 120,
+            },
+            "users": {"watermark": None},
+        }
+        assert snapshot["last_load"] is None
+
+
+class TestPipelineMonitor:
+    """Testes para o cache e o pool de conexões do monitor"""
+
+    def test_scrapes_within_ttl_reuse_snapshot(self, monitor):
+        """Testa que coletas dentro do TTL não consultam o banco novamente"""
+        first = monitor.openmetrics()
+        second = monitor.openmetrics()
+
+        pool = FakePool.instances[0]
+        assert len(FakePool.instances) == 1
+        assert pool.queries[0] == SNAPSHOT_SQL and len(pool.queries) == 2
+        assert pool.connections[0].autocommit
+        assert "jira_monitor_up 1" in first
+        assert first.split("\n")[-3:] == second.split("\n")[-3:]
+
+    def test_snapshot_is_read_again_after_ttl(self, monitor):
+        """Testa que o snapshot é atualizado depois do TTL"""
+        monitor.snapshot_ttl = 0
+        monitor.snapshot()
+        monitor.snapshot()
+
+        assert FakePool.instances[0].queries.count(SNAPSHOT_SQL) == 2
+
+    def test_fresh_database_is_reported(self, monitor):
+        """Testa que o monitor funciona antes da primeira carga criar as tabelas"""
+        with monitor.connection():
+            FakePool.instances[0].relations = []
+
+        snapshot, _, _ = monitor.snapshot()
+
+        assert FakePool.instances[0].queries == [SNAPSHOT_SQL]
+        assert snapshot["rows"][("jira_data", "issues")] == 2000
+        assert snapshot["resources"] == {}
+        assert "jira_monitor_up 1" in monitor.openmetrics()
+
+    def test_reports_down_when_query_fails(self, monitor):
+        """Testa que uma falha do banco é exposta em vez de propagada"""
+        monitor.snapshot()
+        FakePool.instances[0].fail = True
+        monitor.snapshot_ttl = 0
+
+        output = monitor.openmetrics()
+
+        assert "jira_monitor_up 0" in output
+        assert "jira_table_rows_estimate" not in output
+        assert output.endswith("# EOF\n")
+
+    def test_data_quality_reads_estimates(self, monitor):
+        """Testa que a verificação de volume não conta as linhas das tabelas"""
+        with patch("monitor.logger") as logger:
+            monitor.check_data_quality()
+
+        assert FakePool.instances[0].queries[0] == SNAPSHOT_SQL
+        assert not any("COUNT" in sql for sql in FakePool.instances[0].queries)
+        messages = [call.args[0] for call in logger.info.call_args_list]
+        assert "Total issues: ~2000" in messages
+        logger.warning.assert_any_call("~20 issues without summary")
+
+
+class TestMetricsServer:
+    """Testes para o endpoint /metrics"""
+
+    def test_serves_openmetrics(self, monitor):
+        """Testa que /metrics responde no formato OpenMetrics"""
+        server = metrics_server(monitor, "127.0.0.1", 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{url}/metrics") as response:
+                content_type = response.headers["Content-Type"]
+                body = response.read().decode()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"{url}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert content_type == OPENMETRICS_CONTENT_TYPE
+        assert (
+            'jira_table_rows_estimate{schema="jira_data",table="issues"} 2000' in body
+        )
+        assert (
+            "jira_null_values_estimate"
+            '{schema="jira_data",table="issues",column="fields__summary"} 20' in body
+        )
+        assert "jira_dbt_models 2" in body
+        assert (
+            'jira_resource_watermark_timestamp_seconds{resource="issues"} '
+            "1700000000.000" in body
+        )
+        assert 'jira_resource_staleness_threshold_seconds{resource="users"}' in body
+
+
+class TestMain:
+    """Testes para a linha de comando do monitor"""
+
+    CHECKS = [
+        "check_data_freshness",
+        "check_dbt_models",
+        "check_data_quality",
+        "check_index_usage",
+    ]
+
+    def run_main(self, argv):
+        """Executa main() e retorna as verificações chamadas"""
+        called = []
+        checks = {
+            name: (lambda self, name=name: called.append(name)) for name in self.CHECKS
+        }
+        with (
+            patch("monitor.ThreadedConnectionPool", FakePool),
+            patch.multiple(PipelineMonitor, **checks),
+        ):
+            main(argv)
+        return called
+
+    def test_workflow_flags_are_accepted(self):
+        """Testa as opções usadas pelo workflow de qualidade de dados"""
+        assert self.run_main(["--check-freshness"]) == ["check_data_freshness"]
+        assert self.run_main(["--check-volume"]) == ["check_data_quality"]
+        assert self.run_main(["--generate-report"]) == self.CHECKS
+
+    def test_runs_full_report_without_flags(self):
+        """Testa que sem opções todas as verificações são executadas"""
+        assert self.run_main([]) == self.CHECKS
@@ -0,0 +1,159 @@
+"""
+Testes da extração do orchestrator contra um servidor Jira falso
+"""
+
+from unittest.mock import patch
+
+import dlt
+import pytest
+
+from orchestrator import JiraDataPipeline
+
+
+@pytest.fixture
+def jira_env(fake_jira, monkeypatch):
+    """Fixture que aponta as credenciais das fontes para o servidor falso"""
+    monkeypatch.setenv("SOURCES__SUBDOMAIN", fake_jira.url)
+    monkeypatch.setenv("SOURCES__EMAIL", "e")
+    monkeypatch.setenv("SOURCES__API_TOKEN", "t")
+    return fake_jira
+
+
+@pytest.fixture
+def duckdb_pipeline(tmp_path):
+    """Fixture que cria um pipeline dlt com destino duckdb local"""
+    return dlt.pipeline(
+        pipeline_name="orchestrator_test",
+        destination=dlt.destinations.duckdb(str(tmp_path / "jira.duckdb")),
+        dataset_name="jira_data",
+        pipelines_dir=str(tmp_path),
+    )
+
+
+class TestParallelExtraction:
+    """Testes para a extração paralela em um único pipeline.run"""
+
+    def test_loads_all_resources_in_one_run(self, jira_env, duckdb_pipeline, tmp_path):
+        """Testa que todos os recursos são carregados em uma única execução"""
+        orchestrator = JiraDataPipeline({"parallel_extraction": True})
+
+        with patch.object(
+            orchestrator, "get_dlt_pipeline", return_value=duckdb_pipeline
+        ):
+            assert orchestrator.extract_data("all")
+
+        assert orchestrator.extraction_results == {
+            "projects": True,
+            "users": True,
+            "issues": True,
+            "issue_changelogs": True,
+        }
+        assert len(duckdb_pipeline.last_trace.last_load_info.loads_ids) == 1
+        row_counts = duckdb_pipeline.last_trace.last_normalize_info.row_counts
+        assert row_counts["issues"] == len(jira_env.issues)
+        assert row_counts["users"] == len(jira_env.users)
+
+    def test_reports_failed_resource(self, jira_env, duckdb_pipeline):
+        """Testa que a falha de um recurso é reportada"""
+        respond = jira_env.respond
+        jira_env.respond = lambda path, query: (
+            None if path.endswith("/users") else respond(path, query)
+        )
+        orchestrator = JiraDataPipeline({"parallel_extraction": True})
+
+        with patch.object(
+            orchestrator, "get_dlt_pipeline", return_value=duckdb_pipeline
+        ):
+            with patch("orchestrator.logger") as logger:
+                assert not orchestrator.extract_data("all")
+
+        assert not any(orchestrator.extraction_results.values())
+        messages = [call.args[0] for call in logger.error.call_args_list]
+        assert any(m.startswith("Resource users failed") for m in messages)
+
+
+class TestSelectiveTransform:
+    """Testes para a execução do dbt apenas sobre as fontes alteradas"""
+
+    def test_selects_loaded_sources(self, jira_env, duckdb_pipeline):
+        """Testa que apenas os modelos das tabelas carregadas são selecionados"""
+        orchestrator = JiraDataPipeline({})
+
+        with patch.object(
+            orchestrator, "get_dlt_pipeline", return_value=duckdb_pipeline
+        ):
+            with patch.object(orchestrator, "transform_data", return_value=True) as dbt:
+                assert orchestrator.run_full_pipeline("users")
+
+        dbt.assert_called_once_with("run", ["source:jira_data.users+"])
+
+    def test_skips_transform_without_changes(self, jira_env, duckdb_pipeline):
+        """Testa que o dbt não é executado quando nenhuma tabela mudou"""
+        orchestrator = JiraDataPipeline({})
+
+        with patch.object(
+            orchestrator, "get_dlt_pipeline", return_value=duckdb_pipeline
+        ):
+            assert orchestrator.extract_data("users")
+            # a segunda execução só encontra páginas inalteradas no cache
+            with patch.object(orchestrator, "transform_data") as dbt:
+                assert orchestrator.run_full_pipeline("users")
+
+        assert orchestrator.loaded_tables == set()
+        dbt.assert_not_called()
+
+    def test_failed_load_is_extracted_again(self, jira_env, duckdb_pipeline, tmp_path):
+        """Testa que as páginas de uma carga que falhou não são puladas depois"""
+        orchestrator = JiraDataPipeline({})
+        # sem os pacotes pendentes da execução que falhou
+        retry_pipeline = dlt.pipeline(
+            pipeline_name="orchestrator_retry_test",
+            destination=dlt.destinations.duckdb(str(tmp_path / "jira.duckdb")),
+            dataset_name="jira_data",
+            pipelines_dir=str(tmp_path),
+        )
+
+        with patch.object(
+            duckdb_pipeline, "normalize", side_effect=RuntimeError("disk full")
+        ):
+            with patch.object(
+                orchestrator, "get_dlt_pipeline", return_value=duckdb_pipeline
+            ):
+                assert not orchestrator.extract_data("users")
+        with patch.object(
+            orchestrator, "get_dlt_pipeline", return_value=retry_pipeline
+        ):
+            assert orchestrator.extract_data("users")
+
+        row_counts = retry_pipeline.last_trace.last_normalize_info.row_counts
+        assert row_counts["users"] == len(jira_env.users)
+
+    def test_pages_read_outside_a_run_are_not_committed(
+        self, jira_env, duckdb_pipeline
+    ):
+        """Testa que páginas lidas fora de uma execução não são gravadas depois"""
+        from jira import jira
+
+        orchestrator = JiraDataPipeline({})
+        list(jira(use_cache=True, cache_scope="orchestrator_test/jira_data").users)
+
+        with patch.object(
+            orchestrator, "get_dlt_pipeline", return_value=duckdb_pipeline
+        ):
+            assert orchestrator.extract_data("projects")
+            assert orchestrator.extract_data("users")
+
+        row_counts = duckdb_pipeline.last_trace.last_normalize_info.row_counts
+        assert row_counts["users"] == len(jira_env.users)
+
+    def test_other_commands_run_all_models(self):
+        """Testa que comandos que não constroem modelos não são filtrados"""
+        orchestrator = JiraDataPipeline({})
+        assert orchestrator.dbt_selectors("run") is None
+
+        orchestrator.loaded_tables = {"issues", "issue_changelogs"}
+        assert orchestrator.dbt_selectors("test") is None
+        assert orchestrator.dbt_selectors("run --full-refresh") == [
+            "source:jira_data.issue_changelogs+",
+            "source:jira_data.issues+",
+        ]
@@ -0,0 +1,135 @@
+"""
+Testes para o limitador de taxa adaptativo da fonte Jira
+"""
+
+import time
+
+from jira.rate_limit import (
+    RateLimiter,
+    get_rate_limiter,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+
+
+class TestHeaderParsing:
+    """Testes para a leitura dos cabeçalhos de limite de taxa"""
+
+    def test_retry_after_seconds(self):
+        """Testa Retry-After em segundos"""
+        assert parse_retry_after("5") == 5.0
+
+    def test_retry_after_http_date(self):
+        """Testa Retry-After como data HTTP"""
+        now = 1704067200.0  # 2024-01-01 00:00:00 UTC
+        assert parse_retry_after("Mon, 01 Jan 2024 00:00:30 GMT", now=now) == 30.0
+
+    def test_retry_after_invalid(self):
+        """Testa Retry-After ausente ou inválido"""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_rate_limit_reset_iso(self):
+        """Testa X-RateLimit-Reset no formato ISO 8601 usado pelo Jira"""
+        now = 1704067200.0
+        assert parse_rate_limit_reset("2024-01-01T00:01:00Z", now=now) == 60.0
+
+
+class TestRateLimiter:
+    """Testes para RateLimiter"""
+
+    def test_burst_is_not_delayed(self):
+        """Testa que requisições dentro do burst não esperam"""
+        limiter = RateLimiter(rate=10, burst=5, jitter=0)
+
+        assert [limiter.reserve() for _ in range(5)] == [0.0] * 5
+
+    def test_waits_once_bucket_is_empty(self):
+        """Testa que a espera respeita a taxa após esvaziar o bucket"""
+        limiter = RateLimiter(rate=10, burst=1, jitter=0)
+        limiter.reserve()
+
+        assert 0.05 < limiter.reserve() <= 0.1
+
+    def test_retry_after_pauses_all_callers(self):
+        """Testa que Retry-After pausa todas as requisições"""
+        limiter = RateLimiter(rate=10, burst=10, jitter=0)
+        limiter.update(429, {"Retry-After": "2"})
+
+        assert limiter.reserve() > 1.9
+
+    def test_throttling_without_headers_halves_rate(self):
+        """Testa que um 429 sem cabeçalhos reduz a taxa pela metade"""
+        limiter = RateLimiter(rate=10, min_rate=1)
+        limiter.update(429, {})
+
+        assert limiter.rate == 5
+
+    def test_throttling_without_headers_backs_off(self):
+        """Testa que um 429 sem cabeçalhos pausa as requisições com backoff"""
+        limiter = RateLimiter(rate=10, burst=10, jitter=0)
+
+        limiter.update(429, {})
+        first = limiter.reserve()
+        limiter.update(503, {})
+        second = limiter.reserve()
+
+        # o burst restante não é usado enquanto o Jira limita as requisições
+        assert first > 0.9
+        assert second > first + 0.9
+
+    def test_success_resets_backoff(self):
+        """Testa que uma resposta bem-sucedida reinicia o backoff"""
+        limiter = RateLimiter(rate=10, burst=10, jitter=0)
+        limiter.update(429, {})
+        limiter.update(200, {})
+
+        assert limiter._backoffs == 0
+
+    def test_headers_raise_the_rate_for_their_window(self):
+        """Testa que o orçamento dos cabeçalhos supera a taxa inicial até o reset"""
+        limiter = RateLimiter(rate=10)
+        reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 10))
+        limiter.update(
+            200, {"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": reset}
+        )
+
+        assert limiter.rate > 40
+        limiter.update(200, {})
+        assert limiter.rate > 40
+        assert limiter.max_rate == 10
+
+    def test_configured_ceiling_applies_after_reset(self):
+        """Testa que a taxa volta ao teto configurado depois do reset da janela"""
+        limiter = RateLimiter(rate=10)
+        reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 10))
+        limiter.update(
+            200, {"X-RateLimit-Remaining": "500", "X-RateLimit-Reset": reset}
+        )
+        limiter._window_end = time.monotonic()
+
+        limiter.update(200, {})
+
+        assert limiter.rate == limiter.max_rate == 10
+
+    def test_remaining_budget_is_spread_until_reset(self):
+        """Testa que o orçamento restante é distribuído até o reset"""
+        limiter = RateLimiter(rate=10, min_rate=0.1)
+        reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 100))
+        limiter.update(200, {"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": reset})
+
+        assert 0.4 < limiter.rate < 0.6
+
+    def test_success_recovers_rate(self):
+        """Testa que respostas bem-sucedidas aumentam a taxa até o máximo"""
+        limiter = RateLimiter(rate=10, min_rate=1)
+        limiter.update(429, {})
+        for _ in range(10):
+            limiter.update(200, {})
+
+        assert limiter.rate == 10
+
+    def test_limiter_is_shared_per_instance(self):
+        """Testa que o limitador é compartilhado por instância do Jira"""
+        assert get_rate_limiter("https://a") is get_rate_limiter("https://a")
+        assert get_rate_limiter("https://a") is not get_rate_limiter("https://b")
@@ -0,0 +1,96 @@
+"""
+Testes da detecção de linhas inalteradas por hash de conteúdo
+"""
+
+import dlt
+import pytest
+
+from jira import jira, jira_search
+from jira.helpers import row_hash, skip_unchanged_rows
+
+
+@pytest.fixture
+def duckdb_pipeline(tmp_path):
+    """Fixture que cria um pipeline dlt com destino duckdb local"""
+    return dlt.pipeline(
+        pipeline_name="row_hash_test",
+        destination=dlt.destinations.duckdb(str(tmp_path / "jira.duckdb")),
+        dataset_name="jira_data",
+        pipelines_dir=str(tmp_path),
+    )
+
+
+class TestRowHash:
+    """Testes para row_hash e skip_unchanged_rows"""
+
+    def test_hash_ignores_key_order(self):
+        """Testa que o hash não depende da ordem das chaves"""
+        assert row_hash({"a": 1, "b": {"c": 2}}) == row_hash({"b": {"c": 2}, "a": 1})
+        assert row_hash({"a": 1}) != row_hash({"a": 2})
+        assert len(row_hash({"a": 1})) == 16
+
+    def test_unchanged_rows_are_not_loaded_again(self, fake_jira, duckdb_pipeline):
+        """Testa que apenas linhas alteradas chegam à normalização"""
+
+        def users():
+            return jira(
+                subdomain=fake_jira.url,
+                email="e",
+                api_token="t",
+                use_cache=False,
+                skip_unchanged=True,
+            ).users
+
+        duckdb_pipeline.run(users())
+        first = duckdb_pipeline.last_trace.last_normalize_info.row_counts
+
+        fake_jira.users[3]["displayName"] = "Renamed"
+        duckdb_pipeline.run(users())
+        second = duckdb_pipeline.last_trace.last_normalize_info.row_counts
+
+        assert first["users"] == len(fake_jira.users)
+        assert second["users"] == 1
+        with duckdb_pipeline.sql_client() as client:
+            rows = client.execute_sql(
+                "SELECT COUNT(*), COUNT(DISTINCT _row_hash) FROM users"
+            )
+        assert rows[0] == (len(fake_jira.users), len(fake_jira.users))
+
+    def test_search_skips_unchanged_issues(self, fake_jira, duckdb_pipeline):
+        """Testa que issues inalteradas e seus changelogs não são recarregados"""
+
+        def source():
+            search = jira_search(
+                subdomain=fake_jira.url, email="e", api_token="t", skip_unchanged=True
+            )
+            search.issues.bind(jql_queries=['project = "ABC"'])
+            return search
+
+        duckdb_pipeline.run(source())
+        fake_jira.issues[0]["fields"]["summary"] = "Changed"
+        duckdb_pipeline.run(source())
+
+        row_counts = duckdb_pipeline.last_trace.last_normalize_info.row_counts
+        assert row_counts["issues"] == 1
+        assert row_counts["issue_changelogs"] == 2
+
+    def test_hashes_of_old_rows_are_pruned(self, duckdb_pipeline, monkeypatch):
+        """Testa que o estado só guarda os hashes das issues atualizadas há pouco"""
+        monkeypatch.setattr("jira.helpers.ROW_HASH_PRUNE_SIZE", 10)
+        rows = [
+            {
+                "id": i,
+                "fields": {"updated": f"2024-01-{1 + i // 10:02d}T00:00:00.000+0000"},
+            }
+            for i in range(40)
+        ]
+        resource = skip_unchanged_rows(
+            dlt.resource(rows, name="issues"), "id", updated_path="fields.updated"
+        )
+
+        duckdb_pipeline.run(resource)
+
+        state = duckdb_pipeline.state["sources"]["row_hash_test"]["resources"]
+        hashes = state["issues"]["row_hashes"]
+        # os 10 de 04/01 e os 10 de 03/01, dentro das 24 horas de retenção
+        assert sorted(int(key) for key in hashes) == list(range(20, 40))
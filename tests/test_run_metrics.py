@@ -0,0 +1,201 @@
+"""
+Testes das métricas de execução gravadas em jira_ops.run_metrics
+"""
+
+from unittest.mock import Mock, patch
+
+import dlt
+import pytest
+
+from dbt_runner import DbtRunResult
+from jira.client import JiraClient
+from jira.rate_limit import RateLimiter
+from orchestrator import JiraDataPipeline
+from run_metrics import RunMetrics, get_metrics_pipeline
+from tests.fake_jira import FakeJiraServer
+
+
+@pytest.fixture
+def metrics_pipeline(tmp_path):
+    """Fixture que cria o pipeline de métricas com destino duckdb local"""
+    return get_metrics_pipeline(
+        dlt.destinations.duckdb(str(tmp_path / "ops.duckdb")), str(tmp_path)
+    )
+
+
+def metric_values(metrics, stage, metric):
+    """Retorna os valores de uma métrica por nome"""
+    return {
+        row["name"]: row["value"]
+        for row in metrics.rows
+        if row["stage"] == stage and row["metric"] == metric
+    }
+
+
+class TestClientStats:
+    """Testes para as estatísticas de requisições do cliente"""
+
+    def test_counts_requests_pages_and_retries(self, tmp_path, monkeypatch):
+        """Testa que páginas, bytes e requisições repetidas são contados"""
+        monkeypatch.setattr("jira.cache.CACHE_DIR", str(tmp_path / "jira_cache"))
+        server = FakeJiraServer(throttle_every=3).start()
+        try:
+            client = JiraClient(
+                server.url, "e", "t", rate_limiter=RateLimiter(rate=1000, burst=100)
+            )
+            pages = list(client.get_paginated_data(10, "rest/api/3/users"))
+            items = list(client.get_paginated_items(10, "rest/api/3/users"))
+        finally:
+            server.stop()
+
+        stats = client.stats()["/rest/api/3/users"]
+        assert len(pages) == 3 and len(items) == 25
+        assert stats["pages"] == 6
+        assert stats["retries"] == server.throttled
+        assert stats["requests"] == stats["pages"] + stats["retries"]
+        assert stats["bytes"] > 0
+
+
+class TestRunMetrics:
+    """Testes para a coleta das métricas de uma execução"""
+
+    def test_records_trace_of_pipeline_run(self, tmp_path):
+        """Testa que etapas, recursos e linhas normalizadas são registrados"""
+        pipeline = dlt.pipeline(
+            pipeline_name="metrics_trace_test",
+            destination=dlt.destinations.duckdb(str(tmp_path / "jira.duckdb")),
+            dataset_name="jira_data",
+            pipelines_dir=str(tmp_path),
+        )
+        users = dlt.resource([{"id": i} for i in range(5)], name="users")
+        projects = dlt.resource([{"id": 1}], name="projects")
+        pipeline.run([users, projects])
+
+        metrics = RunMetrics("extract")
+        metrics.record_trace(pipeline.last_trace)
+
+        durations = metric_values(metrics, "load", "duration_seconds")
+        assert list(durations) == ["projects,users"]
+        assert set(metrics.stage_seconds()) == {"extract", "normalize", "load"}
+        assert metric_values(metrics, "extract", "items") == {
+            "users": 5,
+            "projects": 1,
+        }
+        assert metric_values(metrics, "normalize", "rows") == {
+            "users": 5,
+            "projects": 1,
+        }
+        assert all(
+            v >= 0
+            for v in metric_values(metrics, "extract", "resource_seconds").values()
+        )
+
+    def test_records_dbt_models(self):
+        """Testa que o tempo de cada modelo e as linhas afetadas são registrados"""
+        metrics = RunMetrics("transform")
+        metrics.record_dbt(
+            "run",
+            DbtRunResult(
+                True,
+                [
+                    {
+                        "model": "stg_jira_issues",
+                        "execution_time": 0.5,
+                        "rows_affected": -1,
+                    },
+                    {
+                        "model": "fct_transitions",
+                        "execution_time": 2.0,
+                        "rows_affected": 40,
+                    },
+                ],
+                None,
+                3.0,
+            ),
+        )
+
+        assert metric_values(metrics, "dbt", "duration_seconds") == {
+            "stg_jira_issues": 0.5,
+            "fct_transitions": 2.0,
+        }
+        assert metric_values(metrics, "dbt", "rows") == {"fct_transitions": 40}
+        assert metrics.stage_seconds() == {"dbt": 3.0}
+
+    def test_saves_rows_to_run_metrics_table(self, metrics_pipeline):
+        """Testa que as métricas são acrescentadas à tabela run_metrics"""
+        for success in (True, False):
+            metrics = RunMetrics("full")
+            metrics.finish(success)
+            metrics.save(metrics_pipeline)
+
+        with metrics_pipeline.sql_client() as client:
+            rows = client.execute_sql(
+                "SELECT metric, SUM(value), COUNT(DISTINCT run_id) FROM run_metrics "
+                "WHERE stage = 'pipeline' GROUP BY metric ORDER BY metric"
+            )
+        assert metrics_pipeline.dataset_name == "jira_ops"
+        assert [(metric, runs) for metric, _, runs in rows] == [
+            ("success", 2),
+            ("wall_seconds", 2),
+        ]
+        assert rows[0][1] == 1
+
+
+class TestOrchestratorMetrics:
+    """Testes para a gravação das métricas pelo orchestrator"""
+
+    def test_transform_run_is_recorded(self, metrics_pipeline):
+        """Testa que uma execução do dbt grava suas métricas"""
+        orchestrator = JiraDataPipeline({})
+        runner = Mock()
+        runner.invoke.return_value = DbtRunResult(
+            True,
+            [
+                {
+                    "model": "dim_users",
+                    "status": "success",
+                    "execution_time": 1.0,
+                    "rows_affected": 3,
+                }
+            ],
+            None,
+            1.5,
+        )
+
+        with patch.object(orchestrator, "get_dbt_runner", return_value=runner):
+            with patch.object(
+                orchestrator, "get_metrics_pipeline", return_value=metrics_pipeline
+            ):
+                assert orchestrator.run_dbt_only()
+
+        with metrics_pipeline.sql_client() as client:
+            rows = client.execute_sql(
+                "SELECT name, value FROM run_metrics "
+                "WHERE stage = 'dbt' AND metric = 'duration_seconds'"
+            )
+        assert rows == [("dim_users", 1.0)]
+
+    def test_failing_to_save_does_not_fail_run(self):
+        """Testa que um erro ao gravar as métricas não falha a execução"""
+        orchestrator = JiraDataPipeline({})
+
+        with patch.object(orchestrator, "transform_data", return_value=True):
+            with patch.object(
+                orchestrator, "get_metrics_pipeline", side_effect=RuntimeError("down")
+            ):
+                assert orchestrator.run_dbt_only()
+
+        assert metric_values(orchestrator.run_metrics, "pipeline", "success") == {
+            "transform": 1
+        }
+
+    def test_can_be_disabled(self):
+        """Testa que as métricas não são coletadas quando desativadas"""
+        orchestrator = JiraDataPipeline({"record_metrics": False})
+
+        with patch.object(orchestrator, "transform_data", return_value=True):
+            with patch.object(orchestrator, "get_metrics_pipeline") as metrics:
+                assert orchestrator.run_dbt_only()
+
+        metrics.assert_not_called()
+        assert orchestrator.run_metrics is None
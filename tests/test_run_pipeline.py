@@ -79,6 +79,21 @@ class TestRunPipeline:
             mock_pipeline.run_full_pipeline.assert_called_once_with("all", "run")
             mock_sys_exit.assert_called_once_with(0)
 
+    def test_daemon_command_reads_schedules(
+        self, mock_pipeline_class, mock_pipeline, mock_sys_exit, monkeypatch
+    ):
+        """Testa que o comando daemon usa os agendamentos do ambiente"""
+        monkeypatch.setenv("PIPELINE_SCHEDULES", "issues=10m;projects=0 3 * * *")
+        mock_pipeline.run_daemon.return_value = True
+
+        with patch("sys.argv", ["run_pipeline.py", "daemon"]):
+            main()
+
+        mock_pipeline.run_daemon.assert_called_once_with(
+            {"issues": "10m", "projects": "0 3 * * *"}
+        )
+        mock_sys_exit.assert_called_once_with(0)
+
     def test_invalid_command(self, mock_pipeline_class, mock_pipeline, mock_sys_exit):
         """Testa tratamento de comando inválido"""
         with patch("sys.argv", ["run_pipeline.py", "invalid"]):
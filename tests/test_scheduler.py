@@ -0,0 +1,215 @@
+"""
+Testes do agendamento em processo do modo daemon
+"""
+
+import os
+import signal
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from orchestrator import JiraDataPipeline, main
+from scheduler import (
+    CronSchedule,
+    IntervalSchedule,
+    Scheduler,
+    parse_schedule,
+    parse_schedules,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """Relógio controlado pelo teste"""
+
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **delta):
+        self.now += timedelta(**delta)
+
+
+class TestParseSchedule:
+    """Testes para parse_schedule e parse_schedules"""
+
+    def test_intervals(self):
+        """Testa intervalos em segundos, minutos, horas e dias"""
+        assert parse_schedule("30s").seconds == 30
+        assert parse_schedule("5m").seconds == 300
+        assert parse_schedule("1.5h").seconds == 5400
+        assert parse_schedule("1d").seconds == 86400
+
+    def test_cron_expressions(self):
+        """Testa que expressões cron são avaliadas em UTC"""
+        schedule = parse_schedule("0 3 * * *")
+
+        assert isinstance(schedule, CronSchedule)
+        assert schedule.first_run(START) == START.replace(hour=3)
+        assert schedule.next_after(START.replace(hour=3)) == START.replace(
+            day=2, hour=3
+        )
+
+    def test_invalid_schedules(self):
+        """Testa que agendamentos inválidos são rejeitados"""
+        with pytest.raises(ValueError):
+            parse_schedule("every five minutes")
+        with pytest.raises(ValueError):
+            parse_schedules("issues")
+
+    def test_parse_schedules(self):
+        """Testa que agendamentos por recurso são separados por ponto e vírgula"""
+        assert parse_schedules("issues=5m; projects=0 3 * * 1,3;") == {
+            "issues": "5m",
+            "projects": "0 3 * * 1,3",
+        }
+        assert parse_schedules("") == {}
+
+    def test_unknown_resources_are_rejected(self):
+        """Testa que nomes de recurso desconhecidos são rejeitados"""
+        assert parse_schedules("issues=5m", ["issues"]) == {"issues": "5m"}
+        with pytest.raises(ValueError):
+            parse_schedules("isues=5m", ["issues"])
+
+
+class TestScheduler:
+    """Testes para o Scheduler"""
+
+    def test_runs_each_job_on_its_cadence(self):
+        """Testa que cada recurso roda na sua própria cadência"""
+        clock = FakeClock()
+        scheduler = Scheduler(clock)
+        ran = []
+        scheduler.add("issues", IntervalSchedule(300), lambda: ran.append("i") or True)
+        scheduler.add("users", IntervalSchedule(3600), lambda: ran.append("u") or True)
+
+        assert scheduler.run_pending() == ["issues", "users"]
+        for _ in range(12):
+            clock.advance(minutes=5)
+            scheduler.run_pending()
+
+        assert ran.count("i") == 13
+        assert ran.count("u") == 2
+        assert scheduler.seconds_until_next_run() == 300
+
+    def test_missed_runs_are_coalesced(self):
+        """Testa que execuções perdidas durante uma execução longa viram uma só"""
+        clock = FakeClock()
+        scheduler = Scheduler(clock)
+
+        def slow_users():
+            clock.advance(minutes=20)
+            return True
+
+        issues = scheduler.add("issues", IntervalSchedule(300), lambda: True)
+        scheduler.add("users", IntervalSchedule(3600), slow_users)
+        clock.advance(seconds=1)
+
+        # issues roda primeiro, users atrasa issues em 20 minutos
+        assert scheduler.run_pending() == ["issues", "users", "issues"]
+        assert issues.runs == 2
+        assert issues.next_run == clock.now + timedelta(minutes=5)
+
+    def test_failures_do_not_stop_other_jobs(self):
+        """Testa que uma falha é contada sem interromper o agendamento"""
+        scheduler = Scheduler(FakeClock())
+
+        def broken():
+            raise RuntimeError("boom")
+
+        failing = scheduler.add("users", IntervalSchedule(60), broken)
+        scheduler.add("issues", IntervalSchedule(60), lambda: True)
+
+        assert scheduler.run_pending() == ["users", "issues"]
+        assert failing.failures == 1
+
+    def test_runs_never_overlap(self):
+        """Testa que uma nova verificação não inicia execuções concorrentes"""
+        scheduler = Scheduler()
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return True
+
+        scheduler.add("issues", IntervalSchedule(60), slow)
+        worker = threading.Thread(target=scheduler.run_pending)
+        worker.start()
+        started.wait(5)
+
+        assert scheduler.run_pending() == []
+        release.set()
+        worker.join(5)
+        assert scheduler.jobs[0].runs == 1
+
+
+class TestDaemon:
+    """Testes para o modo daemon do orchestrator"""
+
+    def test_stops_gracefully_on_sigterm(self):
+        """Testa que SIGTERM encerra o daemon após a execução em andamento"""
+        orchestrator = JiraDataPipeline({})
+        finished = []
+
+        def run(data_type, dbt_command):
+            # o sinal chega no meio da execução, que termina normalmente
+            os.kill(os.getpid(), signal.SIGTERM)
+            time.sleep(0.05)
+            finished.append(data_type)
+            return True
+
+        previous = signal.getsignal(signal.SIGTERM)
+        with patch.object(orchestrator, "run_full_pipeline", side_effect=run):
+            assert orchestrator.run_daemon({"issues": "5m", "users": "1h"})
+
+        assert finished == ["issues"]
+        assert signal.getsignal(signal.SIGTERM) is previous
+
+    def test_runs_each_resource_in_process(self):
+        """Testa que cada recurso agendado executa o pipeline no mesmo processo"""
+        orchestrator = JiraDataPipeline(
+            {"schedules": {"users": "1h", "projects": "1d"}}
+        )
+        stop = threading.Event()
+        calls = []
+
+        def run(data_type, dbt_command):
+            calls.append((data_type, dbt_command))
+            if len(calls) == 2:
+                stop.set()
+            return True
+
+        with patch.object(orchestrator, "run_full_pipeline", side_effect=run):
+            assert orchestrator.run_daemon(dbt_command="build", stop=stop)
+
+        assert calls == [("users", "build"), ("projects", "build")]
+
+    def test_unknown_resource_fails_at_startup(self):
+        """Testa que o daemon não inicia com um recurso agendado desconhecido"""
+        orchestrator = JiraDataPipeline({})
+
+        with patch.object(orchestrator, "run_full_pipeline") as run:
+            assert not orchestrator.run_daemon({"isues": "5m"})
+
+        run.assert_not_called()
+
+    def test_command_line_rejects_unknown_resource(self):
+        """Testa que --schedule com um recurso desconhecido é um erro de argumento"""
+        argv = ["orchestrator.py", "--mode", "daemon", "--schedule", "isues=5m"]
+        with (
+            patch("sys.argv", argv),
+            patch.object(JiraDataPipeline, "run_daemon") as run_daemon,
+        ):
+            with pytest.raises(SystemExit) as exit_info:
+                main()
+
+        assert exit_info.value.code == 2
+        run_daemon.assert_not_called()
@@ -0,0 +1,157 @@
+"""
+Testes da extração com parsing incremental das respostas do Jira
+"""
+
+import io
+import json
+import multiprocessing
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("ijson")
+
+from jira import jira, jira_search  # noqa: E402
+from jira.client import JiraClient  # noqa: E402
+from jira.streaming import iter_page_items  # noqa: E402
+
+
+class TestIterPageItems:
+    """Testes para iter_page_items"""
+
+    def test_yields_items_and_collects_metadata(self):
+        """Testa que os itens e os metadados de paginação são extraídos"""
+        body = {
+            "issues": [{"id": "1", "fields": {"labels": ["a", "b"]}}, {"id": "2"}],
+            "names": {"summary": "Summary"},
+            "isLast": False,
+            "nextPageToken": "abc",
+        }
+        metadata = {}
+
+        items = list(
+            iter_page_items(io.BytesIO(json.dumps(body).encode()), "issues", metadata)
+        )
+
+        assert items == body["issues"]
+        assert metadata == {"isLast": False, "nextPageToken": "abc"}
+
+    def test_list_and_values_bodies(self):
+        """Testa respostas em lista e com o array padrão `values`"""
+        assert list(iter_page_items(io.BytesIO(b'[{"a": 1}, 2]'), None, {})) == [
+            {"a": 1},
+            2,
+        ]
+        assert list(
+            iter_page_items(io.BytesIO(b'{"values": [{"a": 1}]}'), None, {})
+        ) == [{"a": 1}]
+
+
+class TestStreamingExtraction:
+    """Testes para a extração em modo streaming"""
+
+    def test_stream_matches_buffered_pages(self, fake_jira):
+        """Testa que o streaming retorna as mesmas issues que a leitura por página"""
+        client = JiraClient(fake_jira.url, "e", "t")
+        args = dict(
+            page_size=30,
+            api_path="rest/api/3/search/jql",
+            data_path="issues",
+            params={"jql": "order by key"},
+            paginator="token",
+        )
+
+        pages = [issue for page in client.get_paginated_data(**args) for issue in page]
+        items = list(client.get_paginated_items(**args))
+
+        assert items == pages
+        assert len(items) == len(fake_jira.issues)
+
+    def test_stream_source_loads_all_endpoints(self, fake_jira):
+        """Testa que a fonte em modo streaming retorna todos os endpoints"""
+        source = jira(subdomain=fake_jira.url, email="e", api_token="t", stream=True)
+
+        assert len(list(source.resources["users"])) == len(fake_jira.users)
+        assert len(list(source.resources["projects"])) == len(fake_jira.projects)
+
+    def test_stream_search_yields_each_issue_once(self, fake_jira):
+        """Testa a busca de issues em modo streaming"""
+        source = jira_search(
+            subdomain=fake_jira.url,
+            email="e",
+            api_token="t",
+            page_size=30,
+            bulk_changelog=False,
+            stream=True,
+        )
+
+        issues = list(source.issues(jql_queries=['project = "ABC"', "order by key"]))
+
+        assert len(issues) == len({issue["id"] for issue in issues}) == 200
+
+    def test_stream_batches_bulk_changelog_requests(self, fake_jira):
+        """Testa que o streaming busca os changelogs em lotes de BATCH_SIZE"""
+        requests = []
+        respond_post = fake_jira.respond_post
+        fake_jira.respond_post = lambda path, body: (
+            requests.append(len(body["issueIdsOrKeys"])) or respond_post(path, body)
+        )
+        source = jira_search(
+            subdomain=fake_jira.url, email="e", api_token="t", stream=True
+        )
+        source.issues.bind(jql_queries=['project = "ABC"'])
+
+        histories = list(source.issue_changelogs)
+
+        assert len(histories) == 200
+        assert requests == [50, 50]
+
+    @pytest.mark.performance
+    def test_stream_caps_peak_memory(self, record_property):
+        """Testa que o pico de memória do streaming não cresce com o tamanho da página"""
+        from tests.fake_jira import serve_in_process
+
+        # o servidor roda em outro processo para não entrar na medição do tracemalloc
+        context = multiprocessing.get_context("spawn")
+        urls = context.Queue()
+        server = context.Process(
+            target=serve_in_process,
+            args=(urls,),
+            kwargs={"issues_per_project": 5000, "projects": ["BIG"]},
+            daemon=True,
+        )
+        server.start()
+        client = JiraClient(urls.get(timeout=30), "e", "t")
+        args = dict(
+            page_size=5000,
+            api_path="rest/api/3/search/jql",
+            data_path="issues",
+            params={"jql": 'project = "BIG"'},
+            paginator="token",
+        )
+
+        def peak_memory(extract):
+            tracemalloc.start()
+            try:
+                count = sum(1 for _ in extract())
+                return count, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        try:
+            # aquece imports e conexões antes de medir
+            list(client.get_paginated_items(**args))
+            buffered_count, buffered_peak = peak_memory(
+                lambda: (i for page in client.get_paginated_data(**args) for i in page)
+            )
+            stream_count, stream_peak = peak_memory(
+                lambda: client.get_paginated_items(**args)
+            )
+        finally:
+            server.terminate()
+
+        record_property("peak_memory_buffered_bytes", buffered_peak)
+        record_property("peak_memory_stream_bytes", stream_peak)
+
+        assert stream_count == buffered_count == 5000
+        assert stream_peak < buffered_peak / 4
@@ -0,0 +1,66 @@
+"""
+Testes do gerador de warehouse sintético usado nos benchmarks do dbt
+"""
+
+from benchmarks.warehouse import TABLES, WarehouseGenerator, project_key
+
+
+class TestWarehouseGenerator:
+    """Testes para WarehouseGenerator"""
+
+    def test_rows_match_table_layout(self):
+        """Testa que as linhas têm as colunas das tabelas do dlt"""
+        generator = WarehouseGenerator(issues=10, histories=35, users=5, projects=3)
+        issues, histories, items = generator.issue_rows(0, 10)
+
+        assert len(issues) == 10
+        assert len(histories) == len(items) == 35
+        assert all(len(row) == len(TABLES["issues"]) for row in issues)
+        assert all(len(row) == len(TABLES["users"]) for row in generator.user_rows())
+        assert all(
+            len(row) == len(TABLES["projects"]) for row in generator.project_rows()
+        )
+        assert {len(row) for row in items} == {
+            len(TABLES["issues__changelog__histories__items"])
+        }
+
+    def test_children_reference_their_parents(self):
+        """Testa que históricos e itens apontam para o _dlt_id do pai"""
+        generator = WarehouseGenerator(issues=4, histories=8, users=2)
+        issues, histories, items = generator.issue_rows(0, 4)
+
+        issue_ids = {row[-1] for row in issues}
+        history_ids = {row[-1] for row in histories}
+        assert {row[-3] for row in histories} == issue_ids
+        assert {row[-3] for row in items} == history_ids
+        assert len({row[-1] for row in items}) == len(items)
+
+    def test_chunks_are_deterministic(self):
+        """Testa que os blocos geram as mesmas linhas de uma geração única"""
+        generator = WarehouseGenerator(issues=7, histories=20, users=3, seed=42)
+        whole = generator.issue_rows(0, 7)
+        chunked = [[], [], []]
+        for chunk in generator.chunks(3):
+            for rows, part in zip(chunked, chunk):
+                rows.extend(part)
+
+        assert tuple(chunked) == whole
+        assert whole != WarehouseGenerator(7, 20, 3, seed=1).issue_rows(0, 7)
+
+    def test_status_follows_changelog(self):
+        """Testa que o status da issue é o destino da última mudança de status"""
+        generator = WarehouseGenerator(issues=20, histories=100, users=4)
+        issues, histories, items = generator.issue_rows(0, 20)
+
+        last_status = {}
+        for item in items:
+            if item[0] == "status":
+                last_status[item[-4]] = item[3]
+        for issue in issues:
+            assert issue[6] == last_status.get(issue[-1], "To Do")
+
+    def test_project_keys_are_unique(self):
+        """Testa que as chaves de projeto não se repetem"""
+        keys = [project_key(n) for n in range(1000)]
+        assert len(set(keys)) == 1000
+        assert keys[:2] == ["PA", "PB"]
@@ -0,0 +1,163 @@
+"""
+Testes das marcas d'água por recurso gravadas em jira_ops.resource_watermarks
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import dlt
+
+from orchestrator import JiraDataPipeline
+from run_metrics import get_metrics_pipeline
+from watermarks import (
+    incremental_watermarks,
+    parse_watermark,
+    stale_resources,
+    watermark_rows,
+)
+
+
+class TestParseWatermark:
+    """Testes para parse_watermark"""
+
+    def test_parses_jira_timestamps(self):
+        """Testa que o formato de data do Jira é convertido para UTC"""
+        assert parse_watermark("2024-01-01T10:00:00.000-0300") == datetime(
+            2024, 1, 1, 13, tzinfo=timezone.utc
+        )
+
+    def test_parses_iso_and_naive_datetimes(self):
+        """Testa que datas ISO e datas sem fuso são tratadas como UTC"""
+        expected = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert parse_watermark("2024-01-01T00:00:00+00:00") == expected
+        assert parse_watermark(datetime(2024, 1, 1)) == expected
+
+    def test_ignores_other_values(self):
+        """Testa que cursores que não são datas não geram marca d'água"""
+        assert parse_watermark("10042") is None
+        assert parse_watermark(10042) is None
+
+
+class TestWatermarkRows:
+    """Testes para a construção das marcas d'água"""
+
+    def test_reads_latest_cursor_of_each_resource(self):
+        """Testa que o maior cursor de cada recurso é lido do estado do pipeline"""
+        state = {
+            "sources": {
+                "jira": {
+                    "resources": {
+                        "issues": {
+                            "incremental": {
+                                "fields.updated": {
+                                    "last_value": "2024-01-01T00:00:00.000+0000"
+                                }
+                            }
+                        }
+                    }
+                },
+                "jira_search": {
+                    "resources": {
+                        "issues": {
+                            "incremental": {
+                                "fields.updated": {
+                                    "last_value": "2024-02-01T00:00:00.000+0000"
+                                }
+                            }
+                        }
+                    }
+                },
+            }
+        }
+
+        assert incremental_watermarks(state) == {
+            "issues": datetime(2024, 2, 1, tzinfo=timezone.utc)
+        }
+
+    def test_builds_one_row_per_resource(self):
+        """Testa que recursos sem linhas também registram a carga"""
+        loaded_at = datetime(2024, 3, 1, tzinfo=timezone.utc)
+        watermark = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+        rows = watermark_rows(
+            ["users", "issues"],
+            {"issues": 10, "issues__fields__labels": 4},
+            {"issues": watermark},
+            load_id="1",
+            loaded_at=loaded_at,
+        )
+
+        assert rows == [
+            {
+                "resource": "issues",
+                "high_watermark": watermark,
+                "rows_loaded": 10,
+                "load_id": "1",
+                "loaded_at": loaded_at,
+            },
+            {
+                "resource": "users",
+                "high_watermark": None,
+                "rows_loaded": 0,
+                "load_id": "1",
+                "loaded_at": loaded_at,
+            },
+        ]
+
+    def test_stale_resources_use_their_threshold(self):
+        """Testa que cada recurso é comparado ao seu próprio limite de atraso"""
+        now = datetime(2024, 3, 3, tzinfo=timezone.utc)
+        loaded_at = now - timedelta(hours=30)
+
+        stale = stale_resources(
+            [
+                {"resource": "issues", "loaded_at": loaded_at},
+                {"resource": "users", "loaded_at": loaded_at},
+            ],
+            now,
+        )
+
+        assert stale == {"issues": 30}
+
+
+class TestOrchestratorWatermarks:
+    """Testes para a gravação das marcas d'água pelo orchestrator"""
+
+    def test_extraction_records_watermarks(self, fake_jira, monkeypatch, tmp_path):
+        """Testa que a extração grava a marca d'água e as linhas de cada recurso"""
+        monkeypatch.setenv("SOURCES__SUBDOMAIN", fake_jira.url)
+        monkeypatch.setenv("SOURCES__EMAIL", "e")
+        monkeypatch.setenv("SOURCES__API_TOKEN", "t")
+        pipeline = dlt.pipeline(
+            pipeline_name="watermarks_test",
+            destination=dlt.destinations.duckdb(str(tmp_path / "jira.duckdb")),
+            dataset_name="jira_data",
+            pipelines_dir=str(tmp_path),
+        )
+        ops_pipeline = get_metrics_pipeline(
+            dlt.destinations.duckdb(str(tmp_path / "ops.duckdb")), str(tmp_path)
+        )
+        orchestrator = JiraDataPipeline({"record_metrics": False})
+
+        with patch.object(orchestrator, "get_dlt_pipeline", return_value=pipeline):
+            with patch.object(
+                orchestrator, "get_metrics_pipeline", return_value=ops_pipeline
+            ):
+                assert orchestrator.extract_data("issues")
+                assert orchestrator.extract_data("users")
+
+        with ops_pipeline.sql_client() as client:
+            rows = client.execute_sql(
+                "SELECT resource, high_watermark, rows_loaded "
+                "FROM resource_watermarks ORDER BY resource"
+            )
+        issues = len(fake_jira.issues)
+        assert [(resource, count) for resource, _, count in rows] == [
+            ("issue_changelogs", sum(map(len, fake_jira.histories.values()))),
+            ("issues", issues),
+            ("users", len(fake_jira.users)),
+        ]
+        assert parse_watermark(rows[1][1]) == parse_watermark(
+            "2024-01-01T00:00:00.000+0000"
+        )
+        assert rows[2][1] is None
@@ -0,0 +1,169 @@
+"""
+Per-resource high watermarks and row counts, kept in jira_ops.resource_watermarks
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import dlt
+
+logger = logging.getLogger(__name__)
+
+WATERMARKS_TABLE = "resource_watermarks"
+
+# one row per resource, replaced by every load of the resource
+WATERMARK_COLUMNS = {
+    "resource": {"data_type": "text", "nullable": False, "primary_key": True},
+    "high_watermark": {"data_type": "timestamp"},
+    # rows written by the latest load of the resource, not its total
+    "rows_loaded": {"data_type": "bigint", "nullable": False},
+    "load_id": {"data_type": "text"},
+    "loaded_at": {"data_type": "timestamp", "nullable": False},
+}
+
+# Hours after which a resource that was not loaded again is stale
+STALENESS_HOURS = {
+    "issues": 24,
+    "issue_changelogs": 24,
+    "users": 48,
+    "projects": 48,
+}
+DEFAULT_STALENESS_HOURS = 24
+
+# columns of the rows returned by WATERMARKS_SQL
+WATERMARK_FIELDS = ("resource", "high_watermark", "rows_loaded", "loaded_at")
+
+WATERMARKS_SQL = f"""
+    SELECT resource, high_watermark, rows_loaded, loaded_at
+    FROM jira_ops.{WATERMARKS_TABLE}
+    ORDER BY resource
+"""
+
+
+def parse_watermark(value: Any) -> Optional[datetime]:
+    """
+    Parses a cursor value into an aware datetime.
+
+    Args:
+        value: A datetime, or a timestamp string as returned by Jira
+            (`2024-01-01T10:00:00.000+0000`) or in ISO 8601.
+    Returns:
+        Optional[datetime]: The value in UTC, or None if it is not a timestamp.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+        except ValueError:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+    else:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def incremental_watermarks(state: Mapping[str, Any]) -> Dict[str, datetime]:
+    """
+    Reads the cursor of every incremental resource from the pipeline state.
+
+    Args:
+        state: The state of a pipeline, e.g. `pipeline.state`.
+    Returns:
+        Dict[str, datetime]: The latest cursor value per resource name, across the
+            sources that load a resource of that name.
+    """
+    watermarks: Dict[str, datetime] = {}
+    for source in state.get("sources", {}).values():
+        for name, resource in source.get("resources", {}).items():
+            for cursor in resource.get("incremental", {}).values():
+                value = parse_watermark(cursor.get("last_value"))
+                if value is not None and (
+                    name not in watermarks or value > watermarks[name]
+                ):
+                    watermarks[name] = value
+    return watermarks
+
+
+def watermark_rows(
+    resources: Iterable[str],
+    row_counts: Mapping[str, int],
+    watermarks: Mapping[str, datetime],
+    load_id: Optional[str] = None,
+    loaded_at: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Builds the watermark rows of the resources of a load.
+
+    Args:
+        resources: Names of the resources that were loaded, with or without rows.
+        row_counts: Rows normalized per table, the root table of a resource has
+            its name.
+        watermarks: Cursor values per resource, see `incremental_watermarks`.
+        load_id: The dlt load id of the load.
+        loaded_at: When the load finished, defaults to now.
+    Returns:
+        List[Dict[str, Any]]: One row per resource.
+    """
+    loaded_at = loaded_at or datetime.now(timezone.utc)
+    return [
+        {
+            "resource": resource,
+            "high_watermark": watermarks.get(resource),
+            "rows_loaded": row_counts.get(resource, 0),
+            "load_id": load_id,
+            "loaded_at": loaded_at,
+        }
+        for resource in sorted(set(resources))
+    ]
+
+
+def save_watermarks(pipeline: dlt.Pipeline, rows: List[Dict[str, Any]]) -> Any:
+    """
+    Replaces the watermark rows of the given resources.
+
+    Args:
+        pipeline: The pipeline of the `jira_ops` dataset, see
+            `run_metrics.get_metrics_pipeline`.
+        rows: The rows built by `watermark_rows`.
+    Returns:
+        Any: The `LoadInfo` of the load.
+    """
+    resource = dlt.resource(
+        rows,
+        name=WATERMARKS_TABLE,
+        write_disposition="merge",
+        primary_key="resource",
+        columns=WATERMARK_COLUMNS,
+    )
+    return pipeline.run(resource)
+
+
+def stale_resources(
+    watermarks: Iterable[Mapping[str, Any]], now: Optional[datetime] = None
+) -> Dict[str, float]:
+    """
+    Returns the resources that were not loaded within their staleness threshold.
+
+    Args:
+        watermarks: Rows of the watermarks table with `resource` and `loaded_at`.
+        now: The current time, defaults to now.
+    Returns:
+        Dict[str, float]: Hours since the last load per stale resource.
+    """
+    now = now or datetime.now(timezone.utc)
+    stale = {}
+    for row in watermarks:
+        loaded_at = parse_watermark(row["loaded_at"])
+        if loaded_at is None:
+            continue
+        hours = (now - loaded_at).total_seconds() / 3600
+        limit = STALENESS_HOURS.get(row["resource"], DEFAULT_STALENESS_HOURS)
+        if hours > limit:
+            stale[row["resource"]] = hours
+    return stale